@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Cart Pricing Benchmark - Per-Line Queries vs One Batched Query
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+Compares three ways of pricing the same cart:
+  1. per-line   - one SELECT per cart line (the original demo_place_order loop)
+  2. batched    - order_pricing.price_cart() over MenuCatalog (one query)
+  3. cached     - order_pricing.price_cart() over MenuCache (no query)
+
+USAGE:
+  python3 bench_cart_pricing.py                       # in-process fake
+  python3 bench_cart_pricing.py --latency-ms 0.5      # fake with network hop
+  python3 bench_cart_pricing.py --mysql --lines 20    # local MySQL (main.DB_CONFIG)
+
+The fake adds --latency-ms to every statement to stand in for the
+client/server round-trip that the batched path saves.
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+import argparse
+import random
+import statistics
+
+from benchmark import percentile, time_runs
+from db_pool import ConnectionPool
+from menu_cache import MenuCache
+from menu_catalog import MenuCatalog, check_category
+from order_pricing import price_cart
+
+
+def price_cart_per_line(pool, cart):
+    """The original loop: one query per cart line"""
+    subtotal = 0
+    with pool.connection() as connection:
+        cursor = connection.cursor()
+        for category, item_sl, quantity in cart:
+            check_category(category)
+            cursor.execute(f"SELECT ItemName, Price FROM {category} WHERE SL = %s", (item_sl,))
+            result = cursor.fetchone()
+            if result:
+                subtotal += result[1] * quantity
+        cursor.close()
+    return subtotal
+
+
+def make_cart(menu_keys, lines, seed=42):
+    """Random cart of `lines` distinct items with quantities 1-3"""
+    rng = random.Random(seed)
+    keys = rng.sample(menu_keys, min(lines, len(menu_keys)))
+    return [(category, sl, rng.randint(1, 3)) for category, sl in keys]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--mysql', action='store_true', help='use main.DB_CONFIG instead of the fake')
+    parser.add_argument('--lines', type=int, default=20, help='cart lines (default 20)')
+    parser.add_argument('--runs', type=int, default=200, help='timed runs per method')
+    parser.add_argument('--latency-ms', type=float, default=0.2,
+                        help='fake per-statement latency in ms (default 0.2)')
+    args = parser.parse_args()
+
+    if args.mysql:
+        from main import DB_CONFIG
+        pool = ConnectionPool(DB_CONFIG, size=2)
+        target = f"MySQL {DB_CONFIG['host']}"
+    else:
+        from fake_db import FakeDatabase
+        fake = FakeDatabase(latency=args.latency_ms / 1000).load_menu()
+        pool = ConnectionPool({}, size=2, connect=fake.connect)
+        target = f"fake ({args.latency_ms} ms/statement)"
+
+    catalog = MenuCatalog(pool)
+    cache = MenuCache(catalog, ttl=None)
+    cart = make_cart(list(cache.snapshot().keys()), args.lines)
+
+    expected = price_cart(catalog, cart).subtotal
+    assert price_cart_per_line(pool, cart) == expected
+
+    methods = [
+        ('per-line', lambda: price_cart_per_line(pool, cart)),
+        ('batched', lambda: price_cart(catalog, cart)),
+        ('cached', lambda: price_cart(cache, cart)),
+    ]
+
+    print(f"\nCart pricing: {len(cart)} lines, {args.runs} runs, target: {target}")
+    print("-" * 60)
+    print(f"{'method':<10} {'p50 ms':>10} {'p95 ms':>10} {'mean ms':>10} {'speedup':>10}")
+    baseline = None
+    for name, func in methods:
+        samples = sorted(time_runs(func, args.runs, warmup=3))
+        p50 = percentile(samples, 0.50)
+        p95 = percentile(samples, 0.95)
+        baseline = baseline or p50
+        print(f"{name:<10} {p50:>10.3f} {p95:>10.3f} {statistics.mean(samples):>10.3f} "
+              f"{baseline / p50:>9.1f}x")
+    pool.close_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite for the Restaurant Management System Hot Paths
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Measures the flows behind main.py's demos so performance regressions
+  are caught before deploying.
+
+SCENARIOS:
+  menu_browse        first 5 items of 5 categories (menu cache)
+  menu_browse_db     same, straight from the database (MenuCatalog)
+  menu_search        typeahead search over item names (menu_search.py)
+  cart_pricing       price a 10-line cart (menu cache)
+  cart_pricing_db    price a 10-line cart (one batched query)
+  checkout           price + insert header and lines in one transaction
+  order_history      first page of order history (keyset)
+  statistics         maintained totals + per-category item counts
+
+METHOD:
+  Each scenario runs `warmup` untimed iterations, then `runs` timed ones.
+  Reported: p50 / p95 / p99 / mean / max latency in ms and throughput
+  (operations per second of wall time).
+
+USAGE:
+  python3 benchmark.py                               # in-process fake
+  python3 benchmark.py --latency-ms 0.3              # fake with network hop
+  python3 benchmark.py --mysql                       # local MySQL (main.DB_CONFIG)
+  python3 benchmark.py --json results.json           # save results
+  python3 benchmark.py --compare baseline.json       # fail on regressions
+  python3 benchmark.py --queries                     # per-statement breakdown
+
+  --compare exits with status 1 if any scenario's p50 or p95 is more than
+  --threshold (default 20%) slower than the baseline file.
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+import argparse
+import itertools
+import json
+import math
+import platform
+import random
+import sys
+import time
+from datetime import datetime
+
+DEFAULT_RUNS = 200
+DEFAULT_WARMUP = 20
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# MEASUREMENT
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def percentile(sorted_samples, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_samples:
+        return 0.0
+    # ceil(fraction * n); the rounding keeps float noise such as
+    # 0.07 * 100 = 7.000000000000001 from bumping the rank
+    rank = max(1, math.ceil(round(fraction * len(sorted_samples), 9)))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+
+def time_runs(func, runs, warmup=DEFAULT_WARMUP):
+    """Run func warmup + runs times, return the timed latencies in ms"""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def summarize(samples):
+    """
+    Returns:
+        dict with p50_ms, p95_ms, p99_ms, mean_ms, max_ms, ops_per_sec
+    """
+    ordered = sorted(samples)
+    total_ms = sum(ordered)
+    return {
+        'runs': len(ordered),
+        'p50_ms': percentile(ordered, 0.50),
+        'p95_ms': percentile(ordered, 0.95),
+        'p99_ms': percentile(ordered, 0.99),
+        'mean_ms': total_ms / len(ordered) if ordered else 0.0,
+        'max_ms': ordered[-1] if ordered else 0.0,
+        'ops_per_sec': len(ordered) / (total_ms / 1000) if total_ms else 0.0,
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare results with a baseline results dict
+
+    Returns:
+        list of (scenario, metric, baseline_ms, current_ms) regressions
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric in ('p50_ms', 'p95_ms'):
+            if previous[metric] and current[metric] > previous[metric] * (1 + threshold):
+                regressions.append((name, metric, previous[metric], current[metric]))
+    return regressions
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# SCENARIOS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def build_scenarios(pool, seed=42):
+    """
+    Returns:
+        dict: {scenario name: zero-argument callable}
+    """
+    from menu_cache import MenuCache
+    from menu_catalog import CATEGORIES, MenuCatalog
+    from menu_search import MenuSearch
+    from order_history import fetch_page
+    from order_pricing import price_cart
+    from order_stats import read_totals
+    from order_store import ensure_order_schema, insert_order
+
+    with pool.connection() as connection:
+        ensure_order_schema(connection)
+
+    catalog = MenuCatalog(pool)
+    prepared = MenuCatalog(pool, prepared=True)
+    cache = MenuCache(catalog, ttl=None)
+    rng = random.Random(seed)
+    menu_keys = sorted(cache.snapshot().keys())
+    cart = [(category, sl, rng.randint(1, 3))
+            for category, sl in rng.sample(menu_keys, min(10, len(menu_keys)))]
+    browse = ["beverages", "dosaitem", "starters", "curry", "sweets"]
+    search = MenuSearch(cache)
+    queries = ["pan", "masala do", "gobi", "coffe", "paneer tikka", "d"]
+    next_query = itertools.cycle(queries).__next__
+    next_key = itertools.cycle(rng.sample(menu_keys, len(menu_keys))).__next__
+
+    def checkout():
+        priced = price_cart(cache, cart)
+        with pool.connection() as connection:
+            insert_order(connection, priced)
+
+    def order_history():
+        with pool.connection() as connection:
+            fetch_page(connection, page_size=10)
+
+    def statistics():
+        with pool.connection() as connection:
+            read_totals(connection)
+        catalog.category_counts(CATEGORIES)
+
+    return {
+        'menu_browse': lambda: cache.preview(browse, limit=5),
+        'menu_browse_db': lambda: catalog.preview(browse, limit=5),
+        'menu_search': lambda: search.search(next_query()),
+        'item_lookup_db': lambda: catalog.get_item(*next_key()),
+        'item_lookup_prepared': lambda: prepared.get_item(*next_key()),
+        'cart_pricing': lambda: price_cart(cache, cart),
+        'cart_pricing_db': lambda: price_cart(catalog, cart),
+        'checkout': checkout,
+        'order_history': order_history,
+        'statistics': statistics,
+    }
+
+
+def run_suite(pool, runs=DEFAULT_RUNS, warmup=DEFAULT_WARMUP, only=None):
+    """
+    Run every scenario (or those named in `only`)
+
+    Returns:
+        dict: {scenario name: summarize() result}
+    """
+    results = {}
+    for name, func in build_scenarios(pool).items():
+        if only and name not in only:
+            continue
+        results[name] = summarize(time_runs(func, runs, warmup))
+    return results
+
+
+def print_results(results, target):
+    print(f"\nBenchmark target: {target}")
+    print("-" * 90)
+    print(f"{'scenario':<22}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+          f"{'mean ms':>10}{'max ms':>10}{'ops/s':>12}")
+    for name, r in results.items():
+        print(f"{name:<22}{r['p50_ms']:>10.3f}{r['p95_ms']:>10.3f}{r['p99_ms']:>10.3f}"
+              f"{r['mean_ms']:>10.3f}{r['max_ms']:>10.3f}{r['ops_per_sec']:>12,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the order and menu hot paths")
+    parser.add_argument('--mysql', action='store_true', help='use main.DB_CONFIG instead of the fake')
+    parser.add_argument('--latency-ms', type=float, default=0.0,
+                        help='fake per-statement latency in ms (default 0)')
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS, help='timed runs per scenario')
+    parser.add_argument('--warmup', type=int, default=DEFAULT_WARMUP, help='untimed runs per scenario')
+    parser.add_argument('--only', nargs='*', help='scenario names to run')
+    parser.add_argument('--queries', action='store_true',
+                        help='instrument cursors and print the busiest statements')
+    parser.add_argument('--json', metavar='FILE', help='write results as JSON')
+    parser.add_argument('--compare', metavar='FILE', help='baseline JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.20,
+                        help='allowed slowdown vs baseline (default 0.20 = 20%%)')
+    args = parser.parse_args()
+
+    from db_pool import ConnectionPool
+    from query_metrics import QueryMetrics
+    metrics = QueryMetrics(slow_ms=None) if args.queries else None
+    if args.mysql:
+        from main import DB_CONFIG
+        pool = ConnectionPool(DB_CONFIG, size=2, metrics=metrics)
+        target = f"MySQL {DB_CONFIG['host']}"
+    else:
+        from fake_db import FakeDatabase
+        fake = FakeDatabase(latency=args.latency_ms / 1000).load_menu()
+        pool = ConnectionPool({}, size=2, connect=fake.connect, metrics=metrics)
+        target = f"fake ({args.latency_ms} ms/statement)"
+
+    try:
+        results = run_suite(pool, args.runs, args.warmup, args.only)
+    finally:
+        pool.close_all()
+    print_results(results, target)
+    if metrics is not None:
+        print(f"\n{'calls':>8}{'total ms':>12}{'p95 ms':>10}{'rows':>10}  statement")
+        for q in metrics.top(10):
+            print(f"{q['count']:>8}{q['total_ms']:>12.1f}{q['p95_ms']:>10.3f}{q['rows']:>10}  "
+                  f"{q['sql'][:70]}")
+
+    if args.json:
+        with open(args.json, 'w') as handle:
+            json.dump({
+                'meta': {
+                    'target': target,
+                    'runs': args.runs,
+                    'warmup': args.warmup,
+                    'timestamp': datetime.now().isoformat(timespec='seconds'),
+                    'python': platform.python_version(),
+                    'platform': platform.platform(),
+                },
+                'results': results,
+            }, handle, indent=2)
+        print(f"\n✓ Results written to {args.json}")
+
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for name, metric, before, after in regressions:
+                print(f"   {name} {metric}: {before:.3f} ms -> {after:.3f} ms")
+            sys.exit(1)
+        print(f"\n✓ No regressions over {args.threshold:.0%} vs {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Exact Billing for Restaurant Management System
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Computes bills in integer paise so totals, taxes and rounding are exact
+  (no float drift such as 0.1 + 0.2), and amounts reach MySQL's
+  DECIMAL(10,2) columns as Decimal values with exactly two places.
+
+MONEY:
+  - Menu prices (INT or DECIMAL rupees) are converted once with to_paise()
+  - Line totals and subtotals are integer paise
+  - Each tax is rate x subtotal, rounded half-up to the paisa, once per
+    bill (CGST 2.5% + SGST 2.5%, as in the original demo)
+  - to_rupees() turns paise back into Decimal('123.45') for storage and
+    display
+
+BATCH BILLING:
+  compute_bills() prices thousands of bills at once from flat columns
+  (BillBatch: one price/quantity per line plus per-bill offsets), for
+  end-of-day re-billing and audits. With NumPy installed the whole batch
+  is a handful of int64 array operations; without it the same integer
+  arithmetic runs as a plain Python loop. Both give identical results.
+
+USAGE:
+  from billing import compute_bill, to_paise, to_rupees
+
+  bill = compute_bill([(to_paise(120), 2), (to_paise(60), 1)])
+  to_rupees(bill.grand_total)           # Decimal('315.00')
+
+  batch = BillBatch.from_bills(bills)   # bills: [[(price_paise, qty), ...], ...]
+  subtotal, cgst, sgst, grand_total = compute_bills(batch)
+
+  python3 billing.py --bills 100000     # loop vs vectorized benchmark
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+from array import array
+from collections import namedtuple
+from decimal import ROUND_HALF_UP, Decimal
+
+try:
+    import numpy
+except ImportError:         # optional - compute_bills() falls back to a loop
+    numpy = None
+
+PAISE_PER_RUPEE = 100
+
+# Tax rates in basis points (1/100 of a percent)
+CGST_BP = 250
+SGST_BP = 250
+CGST_RATE = Decimal(CGST_BP) / 10000
+SGST_RATE = Decimal(SGST_BP) / 10000
+
+_PAISA = Decimal('0.01')
+
+# Amounts of one bill, all in paise
+Bill = namedtuple('Bill', 'subtotal cgst sgst grand_total')
+
+
+def to_paise(amount):
+    """
+    Rupees (int, Decimal or numeric string) to integer paise
+
+    Raises:
+        ValueError: For float amounts, which are already inexact
+    """
+    if isinstance(amount, int):
+        return amount * PAISE_PER_RUPEE
+    if isinstance(amount, float):
+        raise ValueError(f"Use int or Decimal for money, not float: {amount!r}")
+    paise = (Decimal(amount) * PAISE_PER_RUPEE).quantize(Decimal(1), rounding=ROUND_HALF_UP)
+    return int(paise)
+
+
+def to_rupees(paise):
+    """Integer paise to Decimal rupees with two places"""
+    return (Decimal(int(paise)) / PAISE_PER_RUPEE).quantize(_PAISA)
+
+
+def tax(subtotal, basis_points):
+    """Tax on a paise subtotal, rounded half-up to the paisa"""
+    return (subtotal * basis_points + 5000) // 10000
+
+
+def compute_bill(lines):
+    """
+    Args:
+        lines: Iterable of (price_paise, quantity)
+
+    Returns:
+        Bill (paise)
+    """
+    subtotal = 0
+    for price, quantity in lines:
+        subtotal += price * quantity
+    cgst = tax(subtotal, CGST_BP)
+    sgst = tax(subtotal, SGST_BP)
+    return Bill(subtotal, cgst, sgst, subtotal + cgst + sgst)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# BATCH BILLING
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class BillBatch:
+    """
+    Many bills as flat columns
+
+    Lines of bill i are prices[offsets[i]:offsets[i + 1]] (and the same
+    range of quantities), so len(offsets) == number of bills + 1.
+
+    Args:
+        prices: Line prices in paise
+        quantities: Line quantities
+        offsets: Start of each bill's lines, plus the total line count
+    """
+
+    __slots__ = ('prices', 'quantities', 'offsets')
+
+    def __init__(self, prices, quantities, offsets):
+        if len(prices) != len(quantities) or not offsets or offsets[-1] != len(prices):
+            raise ValueError("prices, quantities and offsets do not describe the same lines")
+        self.prices = array('q', prices)
+        self.quantities = array('q', quantities)
+        self.offsets = array('q', offsets)
+
+    @classmethod
+    def from_bills(cls, bills):
+        """bills: Iterable of bills, each an iterable of (price_paise, quantity)"""
+        prices, quantities, offsets = array('q'), array('q'), array('q', [0])
+        for lines in bills:
+            for price, quantity in lines:
+                prices.append(price)
+                quantities.append(quantity)
+            offsets.append(len(prices))
+        return cls(prices, quantities, offsets)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+
+def compute_bills_loop(batch):
+    """
+    compute_bills() without NumPy
+
+    Returns:
+        (subtotal, cgst, sgst, grand_total) - each an array('q') of paise
+    """
+    prices, quantities, offsets = batch.prices, batch.quantities, batch.offsets
+    subtotals = array('q', bytes(8 * len(batch)))
+    start = 0
+    for i in range(len(batch)):
+        end = offsets[i + 1]
+        subtotal = 0
+        for j in range(start, end):
+            subtotal += prices[j] * quantities[j]
+        subtotals[i] = subtotal
+        start = end
+    cgst = array('q', [(s * CGST_BP + 5000) // 10000 for s in subtotals])
+    sgst = array('q', [(s * SGST_BP + 5000) // 10000 for s in subtotals])
+    grand = array('q', [s + c + g for s, c, g in zip(subtotals, cgst, sgst)])
+    return subtotals, cgst, sgst, grand
+
+
+def compute_bills(batch, vectorized=True):
+    """
+    Price every bill of a BillBatch
+
+    Args:
+        batch: BillBatch
+        vectorized: Use NumPy when it is installed
+
+    Returns:
+        (subtotal, cgst, sgst, grand_total) - int64 arrays (NumPy) or
+        array('q') (fallback) of paise, one entry per bill
+    """
+    if not (vectorized and numpy is not None):
+        return compute_bills_loop(batch)
+
+    prices = numpy.frombuffer(batch.prices, dtype=numpy.int64)
+    quantities = numpy.frombuffer(batch.quantities, dtype=numpy.int64)
+    offsets = numpy.frombuffer(batch.offsets, dtype=numpy.int64)
+    # Running sum of line totals; a bill's subtotal is the difference at its
+    # two offsets (exact in int64 and correct for bills with no lines)
+    running = numpy.zeros(len(prices) + 1, dtype=numpy.int64)
+    numpy.cumsum(prices * quantities, out=running[1:])
+    subtotals = running[offsets[1:]] - running[offsets[:-1]]
+    cgst = (subtotals * CGST_BP + 5000) // 10000
+    sgst = (subtotals * SGST_BP + 5000) // 10000
+    return subtotals, cgst, sgst, subtotals + cgst + sgst
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# BENCHMARK
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _decimal_bill(lines):
+    """Reference per-item Decimal computation the batch paths must match"""
+    subtotal = sum((Decimal(price) / 100 * quantity for price, quantity in lines), Decimal(0))
+    cgst = (subtotal * CGST_RATE).quantize(_PAISA, rounding=ROUND_HALF_UP)
+    sgst = (subtotal * SGST_RATE).quantize(_PAISA, rounding=ROUND_HALF_UP)
+    return subtotal, cgst, sgst, subtotal + cgst + sgst
+
+
+if __name__ == "__main__":
+    """
+    Command Line
+
+    Usage:
+      python3 billing.py [--bills N]
+
+    Re-bills N random bills with the per-item Decimal loop, compute_bill()
+    per bill, and compute_bills() on the whole batch, and checks that all
+    three agree to the paisa.
+    """
+    import argparse
+    import random
+    import time
+
+    parser = argparse.ArgumentParser(description="Batch billing benchmark")
+    parser.add_argument('--bills', type=int, default=100000, help='bills to price (default 100000)')
+    args = parser.parse_args()
+
+    rng = random.Random(17)
+    bills = [[(rng.randrange(1000, 60000, 5), rng.randint(1, 3)) for _ in range(rng.randint(1, 8))]
+             for _ in range(args.bills)]
+    batch = BillBatch.from_bills(bills)
+
+    timings = []
+
+    started = time.perf_counter()
+    reference = [_decimal_bill(lines) for lines in bills]
+    timings.append(('Decimal per item', time.perf_counter() - started))
+
+    started = time.perf_counter()
+    per_bill = [compute_bill(lines) for lines in bills]
+    timings.append(('paise per bill', time.perf_counter() - started))
+
+    started = time.perf_counter()
+    looped = compute_bills(batch, vectorized=False)
+    timings.append(('paise batch loop', time.perf_counter() - started))
+
+    if numpy is not None:
+        started = time.perf_counter()
+        vectorized = compute_bills(batch)
+        timings.append(('NumPy vectorized', time.perf_counter() - started))
+    else:
+        vectorized = looped
+
+    for i, expected in enumerate(reference):
+        columns = tuple(to_rupees(column[i]) for column in vectorized)
+        assert columns == expected == tuple(to_rupees(v) for v in per_bill[i]), (i, expected)
+        assert tuple(column[i] for column in looped) == per_bill[i]
+
+    print(f"\nBatch billing: {args.bills:,} bills, {len(batch.prices):,} lines")
+    print("-" * 52)
+    print(f"{'method':<20}{'total ms':>12}{'µs/bill':>10}{'speedup':>10}")
+    base = timings[0][1]
+    for name, seconds in timings:
+        print(f"{name:<20}{seconds * 1000:>12.1f}{seconds / args.bills * 1e6:>10.2f}"
+              f"{base / seconds:>9.1f}x")
+    if numpy is None:
+        print("\n(NumPy not installed - vectorized path not measured)")
+    print("\n✓ All methods agree to the paisa")
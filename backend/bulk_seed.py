@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Bulk Seeding for Restaurant Management System Load Tests
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Fills the database with generated menu items and synthetic orders at a
+  configurable scale (hundreds of thousands of items, millions of order
+  lines) for benchmarking. Used by 'setup_database.py --bulk-seed'.
+
+TECHNIQUES:
+  1. Large batches - rows are sent batch_size at a time with executemany(),
+     which mysql.connector turns into one multi-row INSERT per batch
+  2. One transaction per chunk - a commit per batch, not per row or table
+  3. Deferred indexes - secondary indexes (idx_orders_header,
+     idx_orders_time, idx_menu_items_name) are dropped before loading and
+     rebuilt once
+  4. Relaxed session checks - unique_checks / foreign_key_checks are off
+     for the seeding session
+  5. Optional LOAD DATA LOCAL INFILE (use_infile=True) - each order
+     batch is written to a temporary CSV and loaded by the server in one
+     command; needs local_infile=ON on the server
+
+DATA:
+  - Menu items get SL numbers above SEED_SL_START in every category
+    table (and menu_items, if it exists), leaving the sample menu intact
+  - Orders are checkouts of 1-6 lines spread over the last `days` days,
+    each with an order_headers row; order_stats is reconciled at the end
+  - Generation is seeded, so the same arguments give the same data
+
+USAGE:
+  python3 setup_database.py --bulk-seed --items 200000 --orders 2000000
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+import csv
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from billing import compute_bill, to_paise, to_rupees
+from menu_catalog import CATEGORIES
+from order_stats import reconcile
+
+SEED_SL_START = 100000
+DEFAULT_BATCH_SIZE = 5000
+
+_ADJECTIVES = ("Special", "Classic", "Spicy", "Royal", "Home Style", "Tandoori",
+               "Masala", "Butter", "Crispy", "Jumbo", "Mini", "Chef's")
+_NAMES = ("Paneer", "Dosa", "Biryani", "Naan", "Curry", "Soup", "Lassi", "Idly",
+          "Noodles", "Kulfi", "Chaat", "Thali", "Pulao", "Juice", "Vada")
+
+# Secondary indexes rebuilt after loading: {table: [(index, columns), ...]}
+DEFERRED_INDEXES = {
+    'orders': [('idx_orders_header', 'HeaderID'), ('idx_orders_time', 'OrderTime, OrderID')],
+    'menu_items': [('idx_menu_items_name', 'ItemName')],
+}
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# DATA GENERATION
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def generate_menu_items(count, seed=1):
+    """
+    Yield `count` synthetic menu items spread evenly over CATEGORIES
+
+    Yields:
+        (category, SL, ItemName, Price)
+    """
+    rng = random.Random(seed)
+    for n in range(count):
+        category = CATEGORIES[n % len(CATEGORIES)]
+        sl = SEED_SL_START + n // len(CATEGORIES)
+        name = f"{rng.choice(_ADJECTIVES)} {rng.choice(_NAMES)} {sl}"
+        yield category, sl, name, rng.randrange(20, 400, 5)
+
+
+def generate_checkouts(menu, line_count, first_header_id, days=30, seed=2):
+    """
+    Yield synthetic checkouts until `line_count` order lines exist
+
+    Args:
+        menu: list of (category, SL, ItemName, Price) to order from
+        first_header_id: HeaderID of the first generated checkout
+
+    Yields:
+        (header_row, line_rows) ready for INSERT
+    """
+    rng = random.Random(seed)
+    now = datetime.now().replace(microsecond=0)
+    span = days * 86400
+    header_id = first_header_id
+    remaining = line_count
+    while remaining > 0:
+        order_time = now - timedelta(seconds=rng.randrange(span))
+        lines = []
+        for category, _, item_name, price in rng.sample(menu, min(rng.randint(1, 6), remaining)):
+            quantity = rng.randint(1, 3)
+            lines.append((header_id, category, item_name, price, quantity,
+                          price * quantity, order_time))
+        subtotal = sum(line[5] for line in lines)
+        bill = compute_bill((to_paise(line[3]), line[4]) for line in lines)
+        yield ((header_id, len(lines), subtotal, to_rupees(bill.cgst), to_rupees(bill.sgst),
+                to_rupees(bill.grand_total), order_time), lines)
+        remaining -= len(lines)
+        header_id += 1
+
+
+def _batches(iterable, size):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# LOADING
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class BulkLoader:
+    """
+    Writes row batches into tables, one transaction per batch
+
+    Args:
+        connection: Open connection with the target database selected
+        use_infile: Load batches with LOAD DATA LOCAL INFILE (MySQL only,
+                    connection must allow local infile)
+    """
+
+    def __init__(self, connection, use_infile=False):
+        self.connection = connection
+        self.use_infile = use_infile
+        self.cursor = connection.cursor()
+
+    def insert(self, table, columns, rows, commit=True):
+        """Write one batch and commit it (commit=False leaves it to the caller)"""
+        if self.use_infile:
+            self._load_infile(table, columns, rows)
+        else:
+            placeholders = ", ".join(["%s"] * len(columns))
+            self.cursor.executemany(
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})", rows)
+        if commit:
+            self.connection.commit()
+
+    def _load_infile(self, table, columns, rows):
+        handle = tempfile.NamedTemporaryFile('w', suffix='.csv', newline='', delete=False)
+        try:
+            with handle:
+                csv.writer(handle, lineterminator='\n').writerows(rows)
+            self.cursor.execute(
+                f"LOAD DATA LOCAL INFILE '{handle.name}' INTO TABLE {table} "
+                "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' "
+                f"LINES TERMINATED BY '\\n' ({', '.join(columns)})")
+        finally:
+            os.unlink(handle.name)
+
+    def table_exists(self, table):
+        self.cursor.execute("SELECT TABLE_NAME FROM information_schema.TABLES "
+                            "WHERE TABLE_SCHEMA = DATABASE()")
+        return table in {row[0] for row in self.cursor.fetchall()}
+
+    def drop_indexes(self, table):
+        for index, _ in DEFERRED_INDEXES.get(table, ()):
+            try:
+                self.cursor.execute(f"ALTER TABLE {table} DROP INDEX {index}")
+            except Exception:
+                pass    # already dropped by an interrupted earlier seed
+
+    def create_indexes(self, table):
+        for index, columns in DEFERRED_INDEXES.get(table, ()):
+            self.cursor.execute(f"CREATE INDEX {index} ON {table} ({columns})")
+        self.connection.commit()
+
+    def close(self):
+        self.cursor.close()
+
+
+def _timed(report, label, rows, started):
+    elapsed = time.perf_counter() - started
+    rate = rows / elapsed if elapsed else 0
+    report(f"✓ {label}: {rows:,} rows in {elapsed:.2f}s ({rate:,.0f} rows/s)")
+
+
+def bulk_seed(connection, items=0, orders=0, batch_size=DEFAULT_BATCH_SIZE, days=30,
+              use_infile=False, report=print):
+    """
+    Generate and load menu items and order lines
+
+    Args:
+        connection: Open connection with the 'menu' database selected and
+                    the schema already created
+        items: Number of synthetic menu items
+        orders: Number of synthetic order lines
+        batch_size: Rows per INSERT batch / transaction
+        days: Spread order times over this many past days
+        use_infile: Use LOAD DATA LOCAL INFILE instead of INSERT batches
+        report: Callback for progress / timing lines
+
+    Returns:
+        dict of phase timings in seconds
+    """
+    loader = BulkLoader(connection, use_infile)
+    timings = {}
+    total_started = time.perf_counter()
+    try:
+        loader.cursor.execute("SET unique_checks = 0")
+        loader.cursor.execute("SET foreign_key_checks = 0")
+        unified = loader.table_exists('menu_items')
+
+        if items:
+            started = time.perf_counter()
+            if unified:
+                loader.drop_indexes('menu_items')
+            try:
+                for batch in _batches(generate_menu_items(items), batch_size):
+                    by_category = {}
+                    for category, sl, name, price in batch:
+                        by_category.setdefault(category, []).append((sl, name, price))
+                    for category, rows in by_category.items():
+                        loader.cursor.executemany(
+                            f"INSERT IGNORE INTO {category} (SL, ItemName, Price) "
+                            "VALUES (%s, %s, %s)", rows)
+                    if unified:
+                        loader.cursor.executemany(
+                            "INSERT IGNORE INTO menu_items (Category, SL, ItemName, Price) "
+                            "VALUES (%s, %s, %s, %s)", batch)
+                    connection.commit()
+            finally:
+                if unified:
+                    loader.create_indexes('menu_items')
+            timings['menu_items'] = time.perf_counter() - started
+            _timed(report, "Menu items", items, started)
+
+        if orders:
+            started = time.perf_counter()
+            menu = list(generate_menu_items(items)) if items else [
+                (c, sl, n, p) for c, rows in _sample_menu().items() for sl, n, p in rows]
+            loader.cursor.execute("SELECT COALESCE(MAX(HeaderID), 0) FROM order_headers")
+            first_header_id = loader.cursor.fetchone()[0] + 1
+
+            loader.drop_indexes('orders')
+            written = 0
+            try:
+                # ~3 lines per checkout, so batches hold about batch_size lines
+                for checkouts in _batches(generate_checkouts(menu, orders, first_header_id, days),
+                                          max(1, batch_size // 3)):
+                    headers = [header for header, _ in checkouts]
+                    lines = [line for _, rows in checkouts for line in rows]
+                    # Headers and their lines commit together, so an interrupted
+                    # seed never leaves headers without lines
+                    try:
+                        loader.insert('order_headers', ('HeaderID', 'LineCount', 'Subtotal',
+                                                        'CGST', 'SGST', 'GrandTotal', 'OrderTime'),
+                                      headers, commit=False)
+                        loader.insert('orders', ('HeaderID', 'Category', 'ItemName', 'Price',
+                                                 'Quantity', 'TotalPrice', 'OrderTime'),
+                                      lines, commit=False)
+                        connection.commit()
+                    except Exception:
+                        connection.rollback()
+                        raise
+                    written += len(lines)
+                timings['orders'] = time.perf_counter() - started
+                _timed(report, "Order lines", written, started)
+            finally:
+                started = time.perf_counter()
+                loader.create_indexes('orders')
+                timings['indexes'] = time.perf_counter() - started
+                report(f"✓ Rebuilt deferred indexes in {timings['indexes']:.2f}s")
+
+            started = time.perf_counter()
+            reconcile(connection)
+            timings['stats'] = time.perf_counter() - started
+            report(f"✓ Reconciled order_stats in {timings['stats']:.2f}s")
+    finally:
+        # The connection may go back to a pool - restore the session checks
+        loader.cursor.execute("SET unique_checks = 1")
+        loader.cursor.execute("SET foreign_key_checks = 1")
+        loader.close()
+
+    timings['total'] = time.perf_counter() - total_started
+    report(f"✓ Bulk seed finished in {timings['total']:.2f}s")
+    return timings
+
+
+def _sample_menu():
+    from setup_database import MENU_TABLES
+    return MENU_TABLES
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Compact In-Memory Menu for Restaurant Management System
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Holds a whole menu snapshot in a few flat arrays instead of one dict
+  entry + tuple + boxed ints per item, so a large multi-branch menu costs
+  tens of bytes per item rather than a few hundred. MenuCache uses it for
+  its snapshots.
+
+LAYOUT (one row per item, sorted by category then SL):
+  category_id  array('B')   index into .categories
+  sl           array('q')
+  price        array('q')   (a plain list if prices are not integers)
+  name_id      array('l')   index into .names - each distinct item name
+                            is stored once
+
+LOOKUP:
+  get(category, SL) is O(1). For each category the rows form one
+  contiguous range; dense SL numbering (the usual 1..N) is indexed by a
+  direct array of row numbers, sparse numbering falls back to a dict.
+
+USAGE:
+  from compact_menu import CompactMenu
+
+  menu = CompactMenu(catalog.all_items())
+  menu.get('curry', 3)            # ('Dal Makhani', 180)
+  menu.item('curry', 3)           # MenuItem(category='curry', sl=3, ...)
+  menu.listing('curry', limit=5)  # [(SL, ItemName, Price), ...]
+
+  python3 compact_menu.py --items 200000    # bytes-per-item benchmark
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+from array import array
+
+from menu_catalog import CATEGORIES
+
+_MISSING = -1
+
+
+class MenuItem:
+    """One menu item, materialized on demand from a CompactMenu row"""
+
+    __slots__ = ('category', 'sl', 'name', 'price')
+
+    def __init__(self, category, sl, name, price):
+        self.category = category
+        self.sl = sl
+        self.name = name
+        self.price = price
+
+    def __repr__(self):
+        return (f"MenuItem(category={self.category!r}, sl={self.sl}, "
+                f"name={self.name!r}, price={self.price})")
+
+    def __eq__(self, other):
+        return isinstance(other, MenuItem) and (
+            (self.category, self.sl, self.name, self.price) ==
+            (other.category, other.sl, other.name, other.price))
+
+
+class CompactMenu:
+    """
+    Column-oriented, read-only menu snapshot
+
+    Args:
+        rows: Iterable of (Category, SL, ItemName, Price)
+        loaded_at: time.monotonic() of the load (used by MenuCache TTL)
+    """
+
+    __slots__ = ('categories', 'names', 'category_id', 'sl', 'price', 'name_id',
+                 '_category_ids', '_ranges', '_index', 'loaded_at')
+
+    def __init__(self, rows, loaded_at=0.0):
+        self.categories = list(CATEGORIES)
+        self._category_ids = {c: i for i, c in enumerate(self.categories)}
+        self.names = []
+        self.loaded_at = loaded_at
+        name_ids = {}
+
+        decorated = []
+        for category, sl, name, price in rows:
+            cid = self._category_ids.get(category)
+            if cid is None:
+                cid = self._category_ids[category] = len(self.categories)
+                self.categories.append(category)
+            nid = name_ids.get(name)
+            if nid is None:
+                nid = name_ids[name] = len(self.names)
+                self.names.append(name)
+            decorated.append((cid, sl, nid, price))
+        decorated.sort()
+
+        self.category_id = array('B', (r[0] for r in decorated))
+        self.sl = array('q', (r[1] for r in decorated))
+        self.name_id = array('l', (r[2] for r in decorated))
+        prices = [r[3] for r in decorated]
+        try:
+            self.price = array('q', prices)
+        except TypeError:           # DECIMAL prices - keep them exact
+            self.price = prices
+        del decorated
+
+        # Contiguous row range and SL index per category
+        self._ranges = [(0, 0)] * len(self.categories)
+        self._index = [None] * len(self.categories)
+        start = 0
+        total = len(self.sl)
+        while start < total:
+            cid = self.category_id[start]
+            end = start
+            while end < total and self.category_id[end] == cid:
+                end += 1
+            self._ranges[cid] = (start, end)
+            self._index[cid] = self._build_index(start, end)
+            start = end
+
+    def _build_index(self, start, end):
+        """(base SL, row table) for dense SLs, else {SL: row}"""
+        low, high = self.sl[start], self.sl[end - 1]
+        span = high - low + 1
+        if span <= 2 * (end - start) + 64:
+            table = array('l', [_MISSING]) * span
+            for row in range(start, end):
+                table[self.sl[row] - low] = row
+            return low, table
+        return {self.sl[row]: row for row in range(start, end)}
+
+    # ─── Lookup ──────────────────────────────────────────────────────────
+
+    def row_of(self, category, sl):
+        """Row number of (category, SL), or None"""
+        cid = self._category_ids.get(category)
+        if cid is None or self._index[cid] is None:
+            return None
+        index = self._index[cid]
+        if isinstance(index, dict):
+            return index.get(sl)
+        low, table = index
+        offset = sl - low
+        if 0 <= offset < len(table):
+            row = table[offset]
+            return row if row != _MISSING else None
+        return None
+
+    def get(self, category, sl):
+        """
+        Returns:
+            (ItemName, Price) or None
+        """
+        # row_of() inlined - this is the cart pricing hot path
+        cid = self._category_ids.get(category)
+        index = self._index[cid] if cid is not None else None
+        if index is None:
+            return None
+        if type(index) is dict:
+            row = index.get(sl)
+            if row is None:
+                return None
+        else:
+            offset = sl - index[0]
+            if offset < 0 or offset >= len(index[1]):
+                return None
+            row = index[1][offset]
+            if row == _MISSING:
+                return None
+        return self.names[self.name_id[row]], self.price[row]
+
+    def item(self, category, sl):
+        """MenuItem for (category, SL), or None"""
+        row = self.row_of(category, sl)
+        if row is None:
+            return None
+        return MenuItem(category, self.sl[row], self.names[self.name_id[row]], self.price[row])
+
+    def listing(self, category, limit=None):
+        """
+        Returns:
+            list of (SL, ItemName, Price) ordered by SL
+        """
+        cid = self._category_ids.get(category)
+        if cid is None:
+            return []
+        start, end = self._ranges[cid]
+        if limit is not None:
+            end = min(end, start + limit)
+        names, name_id, sl, price = self.names, self.name_id, self.sl, self.price
+        return [(sl[i], names[name_id[i]], price[i]) for i in range(start, end)]
+
+    def count(self, category):
+        cid = self._category_ids.get(category)
+        if cid is None:
+            return 0
+        start, end = self._ranges[cid]
+        return end - start
+
+    def keys(self):
+        """Iterate (category, SL) in category, SL order"""
+        categories, category_id = self.categories, self.category_id
+        return ((categories[category_id[i]], self.sl[i]) for i in range(len(self.sl)))
+
+    def __len__(self):
+        return len(self.sl)
+
+    def __contains__(self, key):
+        return self.row_of(*key) is not None
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# MEMORY BENCHMARK
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def measure(build):
+    """Bytes still allocated by the object build() returns"""
+    import gc
+    import tracemalloc
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    obj = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, after - before
+
+
+if __name__ == "__main__":
+    """
+    Command Line
+
+    Usage:
+      python3 compact_menu.py [--items N] [--branches B]
+
+    Compares bytes per item of the tuple-based MenuSnapshot with
+    CompactMenu. Rows are generated (bulk_seed.generate_menu_items);
+    --branches repeats the item names, as a multi-branch menu would.
+    """
+    import argparse
+    import random
+    import time
+
+    from bulk_seed import generate_menu_items
+    from menu_cache import MenuSnapshot
+
+    parser = argparse.ArgumentParser(description="Menu snapshot memory benchmark")
+    parser.add_argument('--items', type=int, default=200000, help='menu items (default 200000)')
+    parser.add_argument('--branches', type=int, default=1,
+                        help='share item names between this many branches (default 1)')
+    args = parser.parse_args()
+
+    distinct = max(1, args.items // args.branches)
+    base = list(generate_menu_items(distinct))
+    per_category = distinct // len(CATEGORIES) + 1     # keeps SLs dense per branch
+
+    def make_rows():
+        # Fresh name strings per row, as the database driver returns them
+        for n in range(args.items):
+            category, sl, name, price = base[n % distinct]
+            branch = n // distinct
+            yield category, sl + branch * per_category, (name + '.')[:-1], price
+
+    snapshot, tuple_bytes = measure(lambda: MenuSnapshot(make_rows(), 0.0))
+    compact, compact_bytes = measure(lambda: CompactMenu(make_rows(), 0.0))
+
+    keys = random.Random(3).sample(list(compact.keys()), min(100000, len(compact)))
+    started = time.perf_counter()
+    for key in keys:
+        snapshot.get(*key)
+    tuple_lookup = (time.perf_counter() - started) / len(keys) * 1e9
+    started = time.perf_counter()
+    for key in keys:
+        compact.get(*key)
+    compact_lookup = (time.perf_counter() - started) / len(keys) * 1e9
+    assert all(snapshot.get(*key) == compact.get(*key) for key in keys[:1000])
+
+    print(f"\nMenu snapshot memory: {args.items:,} items, {len(compact.names):,} distinct names")
+    print("-" * 64)
+    print(f"{'layout':<16}{'total MB':>12}{'bytes/item':>14}{'lookup ns':>12}")
+    print(f"{'tuples (dict)':<16}{tuple_bytes / 1e6:>12.1f}{tuple_bytes / args.items:>14.0f}"
+          f"{tuple_lookup:>12.0f}")
+    print(f"{'compact':<16}{compact_bytes / 1e6:>12.1f}{compact_bytes / args.items:>14.0f}"
+          f"{compact_lookup:>12.0f}")
+    print(f"\n✓ {tuple_bytes / compact_bytes:.1f}x smaller")
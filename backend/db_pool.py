@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""
+Database Connection Pool for Restaurant Management System
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Shares a small set of open MySQL connections between all the Python
+  scripts instead of opening a fresh connection (TCP + auth handshake)
+  for every query batch.
+
+FUNCTIONALITY:
+  1. Configurable pool size with blocking checkout and timeout
+  2. Health check (ping) on checkout for connections idle too long
+  3. Idle recycling - connections unused for max_idle seconds are closed
+  4. Per-checkout timing statistics (wait time and hold time)
+  5. Optional query instrumentation - pass metrics=QueryMetrics() and
+     every cursor handed out is timed (see query_metrics.py)
+  6. Prepared statements - connection.fetch_prepared(sql, params) runs a
+     server-side prepared statement kept open on that driver connection
+     (statement_cache.py)
+
+USAGE:
+  from db_pool import get_pool
+
+  pool = get_pool(DB_CONFIG)
+  with pool.connection() as connection:
+      cursor = connection.cursor()
+      ...
+
+  Calling connection.close() on a pooled connection returns it to the
+  pool instead of closing the socket, so existing code keeps working.
+
+TESTING:
+  Pass connect=<factory> to use a stand-in instead of mysql.connector,
+  e.g. ConnectionPool(config, connect=FakeDatabase().connect) from
+  fake_db.py for an in-process SQLite-backed fake.
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from query_metrics import InstrumentedCursor
+from statement_cache import DEFAULT_CAPACITY, StatementCache
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# POOL DEFAULTS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+DEFAULT_POOL_SIZE = 5           # Maximum open connections per pool
+DEFAULT_CHECKOUT_TIMEOUT = 10.0  # Seconds to wait for a free connection
+DEFAULT_MAX_IDLE = 300.0        # Close connections idle longer than this
+DEFAULT_PING_AFTER = 30.0       # Ping connections idle longer than this
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection becomes free within the checkout timeout"""
+
+
+def mysql_connect(**config):
+    """
+    Default connection factory using mysql.connector
+
+    The import happens here so that scripts using a fake factory do not
+    need mysql-connector-python installed.
+    """
+    import mysql.connector as con
+    return con.connect(**config)
+
+
+class PooledConnection:
+    """
+    Connection handed out by ConnectionPool
+
+    Behaves like the underlying connection (all attributes are forwarded),
+    except close() returns it to the pool. Can be used as a context manager.
+    """
+
+    def __init__(self, pool, raw):
+        self._pool = pool
+        self._raw = raw
+        self._checked_out_at = time.perf_counter()
+
+    @property
+    def raw(self):
+        """The underlying driver connection"""
+        return self._raw
+
+    def __getattr__(self, name):
+        if self._raw is None:
+            raise AttributeError(f"connection already returned to pool: {name}")
+        return getattr(self._raw, name)
+
+    def cursor(self, *args, **kwargs):
+        """Driver cursor, wrapped in an InstrumentedCursor if the pool has metrics"""
+        if self._raw is None:
+            raise AttributeError("connection already returned to pool: cursor")
+        cursor = self._raw.cursor(*args, **kwargs)
+        if self._pool.metrics is not None:
+            cursor = InstrumentedCursor(cursor, self._pool.metrics)
+        return cursor
+
+    def prepared(self, sql):
+        """
+        Cached prepared cursor for `sql` on this driver connection
+
+        Returns:
+            (canonical_sql, cursor) - execute the cursor with canonical_sql
+            (not `sql`: the driver only reuses the prepared statement for
+            the identical string object) and fetch all rows; do not close
+            it - it stays open for the next checkout of this connection.
+        """
+        if self._raw is None:
+            raise AttributeError("connection already returned to pool: prepared")
+        return self._pool._statements_for(self._raw).statement(sql)
+
+    def fetch_prepared(self, sql, params=()):
+        """
+        Run `sql` as a cached prepared statement
+
+        Returns:
+            list of rows (fetchall)
+        """
+        if self._raw is None:
+            raise AttributeError("connection already returned to pool: fetch_prepared")
+        statements = self._pool._statements_for(self._raw)
+        canonical, cursor = statements.statement(sql)
+        try:
+            cursor.execute(canonical, params)
+            return cursor.fetchall()
+        except Exception:
+            statements.discard(sql)     # the cursor may be left mid-result
+            raise
+
+    def close(self):
+        """Return the connection to the pool (safe to call twice)"""
+        if self._raw is not None:
+            raw, self._raw = self._raw, None
+            self._pool._release(raw, time.perf_counter() - self._checked_out_at)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of database connections
+
+    Args:
+        config: Keyword arguments for the connection factory
+                (host, user, password, database, ...)
+        size: Maximum number of open connections
+        checkout_timeout: Seconds acquire() waits before raising PoolTimeout
+        max_idle: Idle connections older than this are closed, not reused
+        ping_after: Idle connections older than this are pinged on checkout
+        connect: Connection factory, defaults to mysql.connector.connect
+        metrics: QueryMetrics recording every statement (None = off)
+        statement_cache_size: Prepared statements kept open per connection
+    """
+
+    def __init__(self, config, size=DEFAULT_POOL_SIZE,
+                 checkout_timeout=DEFAULT_CHECKOUT_TIMEOUT,
+                 max_idle=DEFAULT_MAX_IDLE, ping_after=DEFAULT_PING_AFTER,
+                 connect=None, metrics=None, statement_cache_size=DEFAULT_CAPACITY):
+        if size < 1:
+            raise ValueError("pool size must be at least 1")
+        self.config = dict(config)
+        self.size = size
+        self.checkout_timeout = checkout_timeout
+        self.max_idle = max_idle
+        self.ping_after = ping_after
+        self._connect = connect or mysql_connect
+        self.metrics = metrics
+        self.statement_cache_size = statement_cache_size
+        self._idle = deque()            # (raw connection, released_at)
+        self._statements = {}           # id(raw connection) -> StatementCache
+        self._open = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._stats = {
+            'created': 0,
+            'checkouts': 0,
+            'reused': 0,
+            'recycled': 0,
+            'failed_health_checks': 0,
+            'timeouts': 0,
+            'wait_total': 0.0,
+            'wait_max': 0.0,
+            'hold_total': 0.0,
+            'hold_max': 0.0,
+        }
+
+    # ─── Checkout / release ──────────────────────────────────────────────
+
+    def acquire(self, timeout=None):
+        """
+        Check out a connection, creating one if the pool is not full
+
+        Returns:
+            PooledConnection
+
+        Raises:
+            PoolTimeout: If no connection is free within the timeout
+            Exception: Whatever the connection factory raises
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        started = time.perf_counter()
+        deadline = started + timeout
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("connection pool is closed")
+                raw = self._take_idle()
+                if raw is not None:
+                    self._stats['reused'] += 1
+                    break
+                if self._open < self.size:
+                    self._open += 1
+                    raw = None
+                    break
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    self._stats['timeouts'] += 1
+                    raise PoolTimeout(
+                        f"no free connection after {timeout:.1f}s (pool size {self.size})")
+                self._cond.wait(remaining)
+
+        if raw is None:
+            try:
+                raw = self._connect(**self.config)
+            except Exception:
+                with self._cond:
+                    self._open -= 1
+                    self._cond.notify()
+                raise
+            with self._cond:
+                self._stats['created'] += 1
+
+        waited = time.perf_counter() - started
+        with self._cond:
+            self._stats['checkouts'] += 1
+            self._stats['wait_total'] += waited
+            self._stats['wait_max'] = max(self._stats['wait_max'], waited)
+        return PooledConnection(self, raw)
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """Context manager: check out a connection and always return it"""
+        pooled = self.acquire(timeout)
+        try:
+            yield pooled
+        finally:
+            pooled.close()
+
+    def _take_idle(self):
+        """Pop a healthy idle connection, recycling stale ones (lock held)"""
+        now = time.monotonic()
+        while self._idle:
+            raw, released_at = self._idle.pop()     # LIFO keeps hot sockets warm
+            idle_for = now - released_at
+            if idle_for > self.max_idle:
+                self._stats['recycled'] += 1
+                self._discard(raw)
+                continue
+            if idle_for > self.ping_after and not self._is_healthy(raw):
+                self._stats['failed_health_checks'] += 1
+                self._discard(raw)
+                continue
+            return raw
+        return None
+
+    def _release(self, raw, held_for):
+        """Return a connection to the idle list (called by PooledConnection)"""
+        try:
+            if getattr(raw, 'in_transaction', False):
+                raw.rollback()
+        except Exception:
+            with self._cond:
+                self._discard(raw)
+                self._cond.notify()
+            return
+
+        with self._cond:
+            self._stats['hold_total'] += held_for
+            self._stats['hold_max'] = max(self._stats['hold_max'], held_for)
+            if self._closed:
+                self._discard(raw)
+            else:
+                self._idle.append((raw, time.monotonic()))
+            self._cond.notify()
+
+    def _statements_for(self, raw):
+        """StatementCache of a driver connection, created on first use"""
+        cache = self._statements.get(id(raw))
+        if cache is None:
+            cache = StatementCache(raw, self.statement_cache_size, self.metrics)
+            with self._cond:
+                self._statements[id(raw)] = cache
+        return cache
+
+    def _discard(self, raw):
+        """Close a connection and free its slot (lock held)"""
+        self._open -= 1
+        cache = self._statements.pop(id(raw), None)
+        if cache is not None:
+            cache.close()
+        try:
+            raw.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _is_healthy(raw):
+        """Ping the server; connections without ping() are assumed healthy"""
+        try:
+            if hasattr(raw, 'ping'):
+                raw.ping(reconnect=False)
+            elif hasattr(raw, 'is_connected'):
+                return raw.is_connected()
+            return True
+        except Exception:
+            return False
+
+    # ─── Maintenance ─────────────────────────────────────────────────────
+
+    def recycle_idle(self):
+        """Close every idle connection older than max_idle, returns count"""
+        now = time.monotonic()
+        with self._cond:
+            keep = deque()
+            closed = 0
+            for raw, released_at in self._idle:
+                if now - released_at > self.max_idle:
+                    self._discard(raw)
+                    closed += 1
+                else:
+                    keep.append((raw, released_at))
+            self._idle = keep
+            self._stats['recycled'] += closed
+            self._cond.notify_all()
+        return closed
+
+    def close_all(self):
+        """Close idle connections; checked-out ones close when returned"""
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                raw, _ = self._idle.pop()
+                self._discard(raw)
+            self._cond.notify_all()
+
+    def stats(self):
+        """
+        Snapshot of pool counters
+
+        Returns:
+            dict with created/checkouts/reused/recycled counts, open and
+            idle connection counts, average/max wait and hold times in
+            milliseconds, and prepared statement cache counters
+        """
+        with self._cond:
+            s = dict(self._stats)
+            s['open'] = self._open
+            s['idle'] = len(self._idle)
+            caches = list(self._statements.values())
+        checkouts = s['checkouts'] or 1
+        return {
+            'size': self.size,
+            'open': s['open'],
+            'idle': s['idle'],
+            'created': s['created'],
+            'checkouts': s['checkouts'],
+            'reused': s['reused'],
+            'recycled': s['recycled'],
+            'failed_health_checks': s['failed_health_checks'],
+            'timeouts': s['timeouts'],
+            'avg_wait_ms': s['wait_total'] / checkouts * 1000,
+            'max_wait_ms': s['wait_max'] * 1000,
+            'avg_hold_ms': s['hold_total'] / checkouts * 1000,
+            'max_hold_ms': s['hold_max'] * 1000,
+            'prepared_open': sum(len(cache) for cache in caches),
+            'prepared_hits': sum(cache.hits for cache in caches),
+            'prepared_misses': sum(cache.misses for cache in caches),
+        }
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# SHARED POOLS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(config, **pool_options):
+    """
+    Return the shared pool for a connection config, creating it once
+
+    Pools are keyed by the config values, so main.py and setup_database.py
+    each get their own pool but every call inside one script reuses it.
+    pool_options (size, connect, ...) only apply when the pool is created.
+    """
+    key = tuple(sorted(config.items()))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(config, **pool_options)
+            _pools[key] = pool
+        return pool
+
+
+def close_all_pools():
+    """Close every shared pool (used on shutdown and between tests)"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close_all()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+In-Process Fake MySQL Database for Restaurant Management System
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Lets the pool, data-access code and benchmarks run without a MySQL
+  server. Connections are backed by a shared in-memory SQLite database
+  and expose the subset of the mysql.connector API the scripts use.
+
+SUPPORTED:
+  - connection.cursor() (prepared=True included), commit(), rollback(),
+    close(), ping(), is_connected()
+  - cursor.execute(), executemany(), fetchone(), fetchall(), fetchmany()
+  - %s placeholders (Decimal parameters included), INSERT IGNORE,
+    INT AUTO_INCREMENT PRIMARY KEY,
+    SELECT ... FOR UPDATE (lock hint dropped), ALTER TABLE ... DROP INDEX,
+    inline INDEX clauses in CREATE TABLE, CREATE DATABASE / USE (ignored),
+    information_schema.TABLES listing, information_schema.COLUMNS types,
+    information_schema.STATISTICS index names, NOW() - INTERVAL %s SECOND
+
+USAGE:
+  from fake_db import FakeDatabase
+  from db_pool import ConnectionPool
+
+  fake = FakeDatabase()
+  fake.load_menu()                      # 14 menu tables + orders
+  pool = ConnectionPool({}, connect=fake.connect)
+
+CONCURRENCY:
+  SQLite locks the whole database for writes, InnoDB only locks rows, so
+  concurrent checkouts would serialize here but not on MySQL. To keep the
+  fake representative, writes take a short database-wide lock, reads run
+  as READ UNCOMMITTED, and the simulated latency of statements issued
+  inside a write transaction is paid after commit, outside the lock.
+
+NOTE: This is not a MySQL emulator. Anything beyond the statements the
+scripts actually issue may behave differently from MySQL.
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+import itertools
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from decimal import Decimal
+
+_ids = itertools.count(1)
+
+# mysql.connector sends Decimal parameters as exact literals; do the same
+sqlite3.register_adapter(Decimal, str)
+
+# MySQL-isms rewritten to SQLite before execution
+_REWRITES = [
+    (re.compile(r'\bINT\s+AUTO_INCREMENT\s+PRIMARY\s+KEY\b', re.I),
+     'INTEGER PRIMARY KEY AUTOINCREMENT'),
+    (re.compile(r'\bINSERT\s+IGNORE\b', re.I), 'INSERT OR IGNORE'),
+    (re.compile(r'\s+FOR\s+UPDATE\b', re.I), ''),
+    (re.compile(r'^\s*ALTER\s+TABLE\s+\w+\s+DROP\s+INDEX\s+(\w+)', re.I), r'DROP INDEX \1'),
+    (re.compile(r'SELECT\s+TABLE_NAME\s+FROM\s+information_schema\.TABLES\s+'
+                r'WHERE\s+TABLE_SCHEMA\s*=\s*\S+', re.I),
+     "SELECT name AS TABLE_NAME FROM sqlite_master WHERE type = 'table' "
+     "AND name NOT LIKE 'sqlite_%'"),
+    (re.compile(r'SELECT\s+COLUMN_NAME,\s*DATA_TYPE\s+FROM\s+information_schema\.COLUMNS\s+'
+                r'WHERE\s+TABLE_SCHEMA\s*=\s*DATABASE\(\)\s+AND\s+TABLE_NAME\s*=\s*%s', re.I),
+     "SELECT name AS COLUMN_NAME, lower(type) AS DATA_TYPE FROM pragma_table_info(%s)"),
+    (re.compile(r'\bNOW\(\)\s*-\s*INTERVAL\s+%s\s+SECOND\b', re.I),
+     "datetime('now', '-' || %s || ' seconds')"),
+    (re.compile(r'SELECT\s+INDEX_NAME\s+FROM\s+information_schema\.STATISTICS\s+'
+                r'WHERE\s+TABLE_SCHEMA\s*=\s*DATABASE\(\)\s+AND\s+TABLE_NAME\s*=\s*%s', re.I),
+     "SELECT name AS INDEX_NAME FROM sqlite_master WHERE type = 'index' AND tbl_name = %s"),
+]
+_READ = re.compile(r'^\s*(SELECT|WITH|PRAGMA)\b', re.I)
+_IGNORED = re.compile(r'^\s*(CREATE\s+DATABASE|USE|DROP\s+DATABASE|SET)\b', re.I)
+_CREATE_TABLE = re.compile(r'^\s*CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)', re.I)
+_INLINE_INDEX = re.compile(r',\s*(UNIQUE\s+)?(?:INDEX|KEY)\s+(\w+)\s*\(([^)]*)\)', re.I)
+
+
+def translate(sql):
+    """Rewrite a MySQL statement into its SQLite equivalent"""
+    for pattern, replacement in _REWRITES:
+        sql = pattern.sub(replacement, sql)
+    return sql.replace('%s', '?')
+
+
+def split_inline_indexes(sql):
+    """
+    Move MySQL inline INDEX clauses out of CREATE TABLE
+
+    Returns:
+        (create_table_sql, [create_index_sql, ...])
+    """
+    table = _CREATE_TABLE.match(sql)
+    if not table:
+        return sql, []
+    indexes = [
+        f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS {name} "
+        f"ON {table.group(1)} ({columns})"
+        for unique, name, columns in _INLINE_INDEX.findall(sql)
+    ]
+    return _INLINE_INDEX.sub('', sql), indexes
+
+
+class FakeCursor:
+    """
+    Cursor with the mysql.connector methods used by the scripts
+
+    A prepared cursor (cursor(prepared=True)) translates its SQL once and
+    skips the simulated parse cost while it is re-executed with the same
+    SQL string object - mysql.connector checks identity, not equal text,
+    so an equal string built anew is prepared again.
+    """
+
+    def __init__(self, connection, prepared=False):
+        self._connection = connection
+        self._cursor = connection._sqlite.cursor()
+        self._prepared = prepared
+        self._statement = None      # (MySQL SQL object, SQLite text) last prepared
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    def execute(self, sql, params=()):
+        if self._prepared and self._statement and self._statement[0] is sql:
+            self._connection._delay(parse=False)
+            with self._connection._statement(sql):
+                self._cursor.execute(self._statement[1], tuple(params or ()))
+            return
+        self._connection._delay()
+        if _IGNORED.match(sql):
+            return
+        original = sql
+        sql, indexes = split_inline_indexes(sql)
+        if indexes and self._connection._table_exists(_CREATE_TABLE.match(sql).group(1)):
+            return      # CREATE TABLE IF NOT EXISTS is a no-op, indexes included
+        translated = translate(sql)
+        if self._prepared and not indexes:
+            self._statement = (original, translated)
+        with self._connection._statement(sql):
+            self._cursor.execute(translated, tuple(params or ()))
+            for index_sql in indexes:
+                self._connection._sqlite.execute(index_sql)
+
+    def executemany(self, sql, seq_of_params):
+        self._connection._delay()
+        with self._connection._statement(sql):
+            self._cursor.executemany(translate(sql), [tuple(p) for p in seq_of_params])
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    def fetchmany(self, size=1):
+        return self._cursor.fetchmany(size)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def close(self):
+        self._cursor.close()
+
+
+class FakeConnection:
+    """Connection object returned by FakeDatabase.connect()"""
+
+    def __init__(self, database):
+        self._database = database
+        self._sqlite = database._open()
+        self._open = True
+        self._writing = False   # holds the database write lock
+        self._owed = 0.0        # latency to pay once the write lock is released
+
+    def _delay(self, parse=True):
+        delay = self._database.latency + (self._database.parse_latency if parse else 0.0)
+        if not delay:
+            return
+        if self._writing:
+            self._owed += delay
+        else:
+            time.sleep(delay)
+
+    @contextmanager
+    def _statement(self, sql):
+        """Take the write lock for non-SELECT statements until commit"""
+        if not self._writing and not _READ.match(sql):
+            self._database._write_lock.acquire()
+            self._writing = True
+        try:
+            yield
+        finally:
+            if self._writing and not self._sqlite.in_transaction:
+                self._end_write()
+
+    def _end_write(self):
+        if self._writing:
+            self._writing = False
+            self._database._write_lock.release()
+        owed, self._owed = self._owed, 0.0
+        if owed:
+            time.sleep(owed)
+
+    def _table_exists(self, name):
+        return self._sqlite.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (name,)).fetchone() is not None
+
+    @property
+    def in_transaction(self):
+        return self._open and self._sqlite.in_transaction
+
+    def cursor(self, prepared=False, **options):
+        if not self._open:
+            raise RuntimeError("connection is closed")
+        return FakeCursor(self, prepared)
+
+    def start_transaction(self):
+        self._sqlite.execute('BEGIN')
+
+    def commit(self):
+        self._sqlite.commit()
+        self._end_write()
+
+    def rollback(self):
+        self._sqlite.rollback()
+        self._end_write()
+
+    def ping(self, reconnect=False, attempts=1, delay=0):
+        if not self._open:
+            raise RuntimeError("connection is closed")
+
+    def is_connected(self):
+        return self._open
+
+    def close(self):
+        if self._open:
+            self._sqlite.rollback()
+            self._end_write()
+            self._open = False
+            self._sqlite.close()
+
+
+class FakeDatabase:
+    """
+    Shared in-memory database; every connect() sees the same tables
+
+    Args:
+        latency: Seconds to sleep per statement, to imitate a network hop
+        parse_latency: Extra seconds per statement that has to be parsed -
+                       every plain execute, but only the first execute of
+                       a prepared cursor - to imitate server parse cost
+    """
+
+    def __init__(self, latency=0.0, parse_latency=0.0):
+        self.latency = latency
+        self.parse_latency = parse_latency
+        self.connections_opened = 0
+        self._uri = f"file:fake_menu_{next(_ids)}?mode=memory&cache=shared"
+        self._lock = threading.Lock()
+        self._write_lock = threading.RLock()
+        # Keep one connection open so the in-memory database lives on
+        self._anchor = self._open()
+
+    def _open(self):
+        conn = sqlite3.connect(self._uri, uri=True, check_same_thread=False,
+                               isolation_level='DEFERRED', timeout=30)
+        conn.execute('PRAGMA read_uncommitted = true')
+        return conn
+
+    def connect(self, **config):
+        """Connection factory compatible with mysql.connector.connect"""
+        with self._lock:
+            self.connections_opened += 1
+        return FakeConnection(self)
+
+    def load_menu(self, menu_tables=None):
+        """
+        Create the legacy schema (14 menu tables + orders tables) and load items
+
+        Args:
+            menu_tables: {category: [(SL, ItemName, Price), ...]},
+                         defaults to setup_database.MENU_TABLES
+        """
+        from order_stats import ensure_stats_schema
+        from order_store import CREATE_ORDER_HEADERS_TABLE, CREATE_ORDERS_TABLE
+        if menu_tables is None:
+            from setup_database import MENU_TABLES
+            menu_tables = MENU_TABLES
+        cursor = self._anchor.cursor()
+        for table_name, items in menu_tables.items():
+            cursor.execute(f"CREATE TABLE IF NOT EXISTS {table_name} "
+                           "(SL INT PRIMARY KEY, ItemName VARCHAR(255) NOT NULL, "
+                           "Price INT NOT NULL)")
+            cursor.executemany(f"INSERT OR IGNORE INTO {table_name} "
+                               "(SL, ItemName, Price) VALUES (?, ?, ?)", items)
+        self._anchor.commit()
+        cursor.close()
+        connection = self.connect()
+        cursor = connection.cursor()
+        cursor.execute(CREATE_ORDER_HEADERS_TABLE)
+        cursor.execute(CREATE_ORDERS_TABLE)
+        connection.commit()
+        ensure_stats_schema(connection)
+        connection.close()
+        return self
@@ -12,7 +12,18 @@ It showcases:
   6. Displaying database statistics
 
 USAGE:
-  python3 demo.py
+  python3 main.py
+  python3 main.py --headless     # run every flow, render nothing (errors on
+                                 # stderr, exit status 1 without a database)
+
+  Single commands (for cron jobs and health probes - each imports only
+  what it needs and prints its startup time on stderr, except with
+  --headless):
+  python3 main.py menu [CATEGORY ...]
+  python3 main.py order beverages:1:2 dosaitem:2
+  python3 main.py history [--before ORDER_ID]
+  python3 main.py stats
+  python3 main.py seed --items 1000 --orders 10000
 
 REQUIREMENTS:
   - MySQL server running on localhost
@@ -24,16 +35,115 @@ and Next.js frontend. Use this script for testing database connectivity.
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
 
-import mysql.connector as con
-from tabulate import tabulate
+import time
+
+_STARTED = time.perf_counter()      # reported by the CLI as startup time
+
+import os
+
+# Everything else (pool, catalog, pricing, tabulate, mysql.connector) is
+# imported by the function that needs it, so `from main import DB_CONFIG`
+# and single CLI commands do not pay for modules they never use
+from restaurant_views import ConsoleView, HeadlessView
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # DATABASE CONNECTION
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-def connect_to_database():
+DB_CONFIG = {
+    'host': 'localhost',
+    'user': 'root',
+    'password': 'Welcomenav1#',
+    'database': 'menu'
+}
+
+DB_POOL_SIZE = 5
+
+# Read replicas for reporting queries (order history, totals, database
+# stats), e.g. {'replica1': dict(DB_CONFIG, host='10.0.0.12')}; empty =
+# everything runs on the primary (see replica_router.py)
+DB_REPLICAS = {}
+
+# Replicas further behind than this many seconds are skipped
+REPLICA_MAX_LAG = 5.0
+
+# Session the demo's reads and writes belong to (read-your-writes)
+DEMO_SESSION = 'demo'
+
+_router = None
+
+# Statements slower than this are logged with their normalized SQL
+SLOW_QUERY_MS = 100
+
+# Per-statement latency / row counters for every pooled cursor
+_query_metrics = None
+
+# Read the menu from the unified menu_items table
+# (run 'python3 setup_database.py --unified' first)
+USE_UNIFIED_MENU = False
+
+# Run catalog queries as server-side prepared statements, cached per
+# pooled connection (see statement_cache.py)
+USE_PREPARED_STATEMENTS = True
+
+# Seconds the in-memory menu snapshot is served before reloading
+MENU_CACHE_TTL = 300
+
+_menu_cache = None
+
+# Tax slabs, happy hours and combos (see pricing_rules.example.json);
+# without this file orders get the standard CGST 2.5% + SGST 2.5%
+PRICING_RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pricing_rules.json')
+
+_pricing_rules = None
+
+# Offline mode: when MySQL is unreachable the demo keeps taking orders in
+# this local SQLite file and syncs them once MySQL is back
+# (see offline_store.py)
+OFFLINE_MODE = True
+OFFLINE_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'terminal.db')
+
+_offline_store = None
+_sync_worker = None
+
+# Rendering for the demo screens (restaurant_views.py)
+CONSOLE = ConsoleView()
+HEADLESS = HeadlessView()
+
+def get_query_metrics():
+    """Shared QueryMetrics recording every statement of the pooled connections"""
+    global _query_metrics
+    if _query_metrics is None:
+        from query_metrics import QueryMetrics
+        _query_metrics = QueryMetrics(slow_ms=SLOW_QUERY_MS)
+    return _query_metrics
+
+def get_db_pool():
+    """Shared connection pool for DB_CONFIG (instrumented with query_metrics)"""
+    from db_pool import get_pool
+    return get_pool(DB_CONFIG, size=DB_POOL_SIZE, metrics=get_query_metrics())
+
+def get_router():
+    """
+    Read/write router over the primary pool and DB_REPLICAS
+
+    Writes go through get_router().writes(session), reporting reads
+    through get_router().reads(session); a session reads its own writes
+    from the primary until the replicas have caught up.
     """
-    Establish connection to MySQL database
+    global _router
+    if _router is None:
+        from replica_router import ReplicaRouter
+        _router = ReplicaRouter(get_db_pool(), DB_REPLICAS, max_lag=REPLICA_MAX_LAG,
+                                pool_size=DB_POOL_SIZE, metrics=get_query_metrics())
+    return _router
+
+def connect_to_database(view=None):
+    """
+    Check out a connection to the MySQL database from the shared pool
+    
+    Args:
+        view: Report a failure through view.error() (default: print it)
     
     Returns:
         connection object or None if connection fails
@@ -44,28 +154,118 @@ def connect_to_database():
         Password: Welcomenav1#
         Database: menu
     
+    Note:
+        Connections come from db_pool.py, so only the first call pays the
+        TCP + auth handshake. connection.close() returns it to the pool.
+    
     Raises:
         Exception: If connection to MySQL fails
     """
     try:
-        connection = con.connect(
-            host='localhost',
-            user='root',
-            password='Welcomenav1#',
-            database='menu'
-        )
+        connection = get_db_pool().acquire()
         return connection
     except Exception as e:
-        print(f"Error connecting to database: {e}")
+        if view is None:
+            print(f"Error connecting to database: {e}")
+        else:
+            view.error(f"cannot connect to database: {e}")
+        return None
+
+def get_catalog(pool=None):
+    """
+    Menu catalog backed by the shared connection pool
+    
+    Args:
+        pool: Where the catalog reads (default the primary pool), e.g.
+              get_router().reads() for reporting
+    
+    Returns:
+        MenuCatalog reading either the legacy category tables or the
+        unified menu_items table, depending on USE_UNIFIED_MENU, with
+        prepared statements if USE_PREPARED_STATEMENTS
+    """
+    from menu_catalog import MenuCatalog
+    return MenuCatalog(pool or get_db_pool(), unified=USE_UNIFIED_MENU, prepared=USE_PREPARED_STATEMENTS)
+
+def go_offline():
+    """
+    Switch the demo to the terminal's local store (OFFLINE_DB_PATH)
+    
+    The menu is served from the local copy, orders are saved locally, and
+    a background SyncWorker pushes them to MySQL and pulls menu changes
+    as soon as the server answers again.
+    """
+    global _offline_store, _sync_worker, _menu_cache
+    if _offline_store is None:
+        from menu_cache import MenuCache
+        from offline_store import OfflineStore, SyncWorker
+        _offline_store = OfflineStore(OFFLINE_DB_PATH)
+        _menu_cache = MenuCache(_offline_store, ttl=MENU_CACHE_TTL)
+        _sync_worker = SyncWorker(_offline_store, get_db_pool(),
+                                  on_menu_change=_menu_cache.invalidate)
+    return _offline_store
+
+def offline_if_unreachable(view=CONSOLE):
+    """
+    Switch a read-only command to the local store when MySQL is down
+    
+    Args:
+        view: Reports the switch through view.status()
+    
+    Returns:
+        OfflineStore or None - None while MySQL answers (or OFFLINE_MODE is off)
+    """
+    if _offline_store is not None:
+        return _offline_store
+    if not OFFLINE_MODE:
+        return None
+    try:
+        get_db_pool().acquire().close()
         return None
+    except Exception:
+        pass
+    store = go_offline()
+    # Nothing to push for a read, and MySQL is down anyway
+    _sync_worker.close(final_sync=False)
+    view.status(f"📴 MySQL is unreachable - showing {OFFLINE_DB_PATH}")
+    return store
 
-def demo_display_menu():
+def get_menu_cache():
+    """
+    Shared in-memory menu cache (see menu_cache.py)
+    
+    The whole menu is loaded with one query on first use; menu browsing
+    and order pricing are then served from memory until MENU_CACHE_TTL
+    expires or invalidate() is called.
+    """
+    global _menu_cache
+    if _menu_cache is None:
+        from menu_cache import MenuCache
+        _menu_cache = MenuCache(get_catalog(), ttl=MENU_CACHE_TTL)
+    return _menu_cache
+
+def get_pricing_rules():
+    """
+    Pricing rules compiled once from PRICING_RULES_FILE (see pricing_rules.py)
+    
+    Raises:
+        ValueError: If the rules file is malformed
+    """
+    global _pricing_rules
+    if _pricing_rules is None:
+        from pricing_rules import PricingRules
+        if os.path.exists(PRICING_RULES_FILE):
+            _pricing_rules = PricingRules.load(PRICING_RULES_FILE)
+        else:
+            _pricing_rules = PricingRules()
+    return _pricing_rules
+
+def demo_display_menu(view=CONSOLE):
     """
     DEMO 1: Display menu items from each category
     
     This function:
-      - Connects to the database
-      - Queries 5 sample categories
+      - Reads 5 sample categories from the in-memory menu cache
       - Displays first 5 items from each category
       - Shows item details: Serial Number, Name, Price
     
@@ -74,128 +274,78 @@ def demo_display_menu():
       - Data retrieval and formatting
       - Error handling
     """
-    print("\n" + "="*80)
-    print("DEMO 1: VIEWING MENU BY CATEGORY")
-    print("="*80)
-    
-    connection = connect_to_database()
-    if not connection:
-        return
+    view.section("DEMO 1: VIEWING MENU BY CATEGORY")
     
     categories = ["beverages", "dosaitem", "starters", "curry", "sweets"]
     
-    for category in categories:
-        try:
-            cursor = connection.cursor()
-            query = f"SELECT SL, ItemName, Price FROM {category} ORDER BY SL LIMIT 5"
-            cursor.execute(query)
-            items = cursor.fetchall()
-            
-            print(f"\n📍 {category.upper()} (showing first 5 items)")
-            print("-" * 80)
-            headers = ['SL', 'Item Name', 'Price (Rs)']
-            print(tabulate(items, headers=headers, tablefmt='simple'))
-            
-            cursor.close()
-        except Exception as e:
-            print(f"Error: {e}")
+    from restaurant_data import load_menu_preview
+    try:
+        preview = load_menu_preview(get_menu_cache(), categories, limit=5)
+    except Exception as e:
+        view.error(e)
+        return
     
-    connection.close()
+    view.menu_preview(preview, limit=5)
 
-def demo_place_order():
+def demo_place_order(view=CONSOLE):
     """
     DEMO 2: Place an order with multiple items
     
     This function:
       - Creates a sample order with 3 items from different categories
-      - Retrieves item details from database
+      - Prices all cart lines with one batched lookup (order_pricing.py)
       - Calculates individual item totals
-      - Computes taxes (CGST 2.5% + SGST 2.5%)
-      - Stores order data in the 'orders' table
+      - Applies the pricing rules: tax slabs, happy hours, combos
+        (get_pricing_rules(), default CGST 2.5% + SGST 2.5%)
+      - Stores one order header + all lines in one transaction (order_store.py)
     
     Order Flow:
       1. Select items from menu
       2. Calculate quantities and prices
       3. Add to cart with pricing
       4. Apply taxes
-      5. Insert order records into database
+      5. Insert order header and lines into database
     
-    Tax Calculation:
+    Tax Calculation (standard rules):
       - CGST (Central Goods and Services Tax): 2.5%
       - SGST (State Goods and Services Tax): 2.5%
       - Total Tax: 5%
+      - pricing_rules.json can set other slabs per category
     """
-    print("\n" + "="*80)
-    print("DEMO 2: PLACING AN ORDER")
-    print("="*80)
+    view.section("DEMO 2: PLACING AN ORDER")
     
-    connection = connect_to_database()
-    if not connection:
-        return
+    # Sample order data
+    orders_to_place = [
+        ("beverages", 1, 2),  # (category, item_sl, quantity)
+        ("dosaitem", 2, 1),
+        ("starters", 3, 1),
+    ]
     
-    cursor = connection.cursor()
+    from order_pricing import price_cart
+    from restaurant_data import PlacedOrder, place_order
+    try:
+        # Price every line with one batched lookup
+        priced = price_cart(get_menu_cache(), orders_to_place, rules=get_pricing_rules())
+    except Exception as e:
+        view.error(e)
+        return
+    view.cart(priced)
     
     try:
-        # Sample order data
-        orders_to_place = [
-            ("beverages", 1, 2),  # (category, item_sl, quantity)
-            ("dosaitem", 2, 1),
-            ("starters", 3, 1),
-        ]
-        
-        print("\n🛒 Adding items to cart:")
-        total_price = 0
-        order_items = []
-        
-        for category, item_sl, quantity in orders_to_place:
-            # Get item details
-            query = f"SELECT ItemName, Price FROM {category} WHERE SL = %s"
-            cursor.execute(query, (item_sl,))
-            result = cursor.fetchone()
-            
-            if result:
-                item_name, price = result
-                total_item_price = price * quantity
-                order_items.append((item_name, price, quantity, total_item_price))
-                total_price += total_item_price
-                print(f"   ✓ Added {quantity}x {item_name} @ Rs.{price}/item = Rs.{total_item_price}")
-        
-        # Display order summary
-        print("\n" + "-"*80)
-        print("📋 ORDER SUMMARY")
-        print("-"*80)
-        
-        headers = ['Item', 'Price (Rs)', 'Qty', 'Total (Rs)']
-        table_data = [(item[0], item[1], item[2], item[3]) for item in order_items]
-        print(tabulate(table_data, headers=headers, tablefmt='grid'))
-        
-        # Calculate taxes
-        cgst = total_price * 0.025
-        sgst = total_price * 0.025
-        grand_total = total_price + cgst + sgst
-        
-        print(f"\nSubtotal:          Rs. {total_price:.2f}")
-        print(f"CGST (2.5%):       Rs. {cgst:.2f}")
-        print(f"SGST (2.5%):       Rs. {sgst:.2f}")
-        print(f"{'-'*30}")
-        print(f"GRAND TOTAL:       Rs. {grand_total:.2f}")
-        
-        # Save to database
-        print("\n✅ Saving order to database...")
-        for item_name, price, qty, total in order_items:
-            insert_query = "INSERT INTO orders (ItemName, Price, Quantity, TotalPrice) VALUES (%s, %s, %s, %s)"
-            cursor.execute(insert_query, (item_name, float(price), qty, float(total)))
-        
-        connection.commit()
-        print("✓ Order placed successfully!")
-        
+        if _offline_store is not None:
+            # Saved on the terminal; the sync worker pushes it to MySQL
+            _, local_id = _offline_store.place_order(priced)
+            placed = PlacedOrder(local_id, priced, offline=True)
+            _sync_worker.wake()
+        else:
+            # Save header + all lines in one transaction
+            placed = place_order(get_router().writes(DEMO_SESSION), priced)
     except Exception as e:
-        print(f"Error: {e}")
-        connection.rollback()
-    finally:
-        cursor.close()
+        view.error(e)
+        return
+    view.order_placed(placed)
 
-def demo_view_orders():
+def demo_view_orders(view=CONSOLE):
     """
     DEMO 3: View order history from database
     
@@ -205,7 +355,7 @@ def demo_view_orders():
       - Shows: Order ID, Item, Price, Quantity, Total, Timestamp
       - Calculates aggregate statistics
     
-    Statistics Shown:
+    Statistics Shown (read from the order_stats summary table):
       - Total number of orders placed
       - Total revenue generated
       - Can be extended to show average order value
@@ -218,57 +368,35 @@ def demo_view_orders():
       - TotalPrice: Quantity × Price (before tax)
       - OrderTime: Timestamp of order (auto-set to NOW())
     """
-    print("\n" + "="*80)
-    print("DEMO 3: VIEWING ORDER HISTORY")
-    print("="*80)
-    
-    connection = connect_to_database()
-    if not connection:
-        return
+    view.section("DEMO 3: VIEWING ORDER HISTORY")
     
+    from restaurant_data import load_order_page
     try:
-        cursor = connection.cursor()
-        cursor.execute("SELECT OrderID, ItemName, Price, Quantity, TotalPrice, OrderTime FROM orders ORDER BY OrderID DESC LIMIT 10")
-        orders = cursor.fetchall()
-        
-        if orders:
-            print(f"\n📊 Recent Orders (Last 10)")
-            print("-" * 80)
-            headers = ['Order ID', 'Item Name', 'Price', 'Qty', 'Total', 'Order Time']
-            print(tabulate(orders, headers=headers, tablefmt='grid'))
-            
-            # Calculate statistics
-            cursor.execute("SELECT COUNT(*) FROM orders")
-            total_orders = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT SUM(TotalPrice) FROM orders")
-            total_revenue = cursor.fetchone()[0]
-            
-            print(f"\n📈 Statistics:")
-            print(f"   Total Orders: {total_orders}")
-            print(f"   Total Revenue: Rs. {total_revenue:.2f}")
-        else:
-            print("\n📭 No orders found!")
-        
-        cursor.close()
+        if _offline_store is not None:
+            view.order_page(_offline_store.order_page(page_size=10))
+            return
+        # First keyset page + maintained totals (order_stats.py), from a
+        # replica unless it has not caught up with the order just placed
+        page = load_order_page(get_router().reads(DEMO_SESSION), page_size=10)
     except Exception as e:
-        print(f"Error: {e}")
-    finally:
-        connection.close()
+        view.error(e)
+        return
+    
+    view.order_page(page)
 
-def demo_database_stats():
+def demo_database_stats(view=CONSOLE):
     """
     DEMO 4: Display database statistics
     
     This function:
-      - Counts menu items in each of 14 categories
+      - Counts menu items in each of 14 categories (single query)
       - Shows total menu items in the database
       - Displays table count and structure info
     
     Database Structure:
       - 14 menu item tables (one per category)
-      - 1 orders table (transaction log)
-      - Total: 15 tables
+      - 2 order tables (order_headers + orders line log)
+      - Total: 16 tables (+ optional menu_items)
     
     Menu Categories (14):
       1. beverages - 12 items (coffee, tea, etc.)
@@ -288,54 +416,35 @@ def demo_database_stats():
     
     Total Items: 192
     """
-    print("\n" + "="*80)
-    print("DEMO 4: DATABASE STATISTICS")
-    print("="*80)
-    
-    connection = connect_to_database()
-    if not connection:
-        return
+    view.section("DEMO 4: DATABASE STATISTICS")
     
+    from restaurant_data import load_database_stats
     try:
-        cursor = connection.cursor()
-        
-        categories = [
-            "beverages", "chatitem", "chineseitems", "curry", "dosaitem",
-            "fruitjuice", "icecreams", "indianbreads", "mealcombo",
-            "riceitem", "soup", "southindian", "starters", "sweets"
-        ]
-        
-        print("\n📊 Menu Items Per Category:")
-        print("-" * 80)
-        
-        stats_data = []
-        total_items = 0
-        
-        for category in categories:
-            cursor.execute(f"SELECT COUNT(*) FROM {category}")
-            count = cursor.fetchone()[0]
-            stats_data.append([category.capitalize(), count])
-            total_items += count
-        
-        print(tabulate(stats_data, headers=['Category', 'Items'], tablefmt='grid'))
-        print(f"\n✓ Total Menu Items: {total_items}")
-        print(f"✓ Total Categories: {len(categories)}")
-        
-        # Table structure info
-        cursor.execute("SELECT TABLE_NAME FROM information_schema.TABLES WHERE TABLE_SCHEMA = 'menu' ORDER BY TABLE_NAME")
-        tables = cursor.fetchall()
-        print(f"✓ Total Tables in Database: {len(tables)}")
-        
-        cursor.close()
+        if _offline_store is not None:
+            view.database_stats(_offline_store.database_stats())
+            return
+        # One query for all 14 categories + one for the table list,
+        # both on a replica when one is configured and fresh enough
+        reads = get_router().reads()
+        stats = load_database_stats(reads, get_catalog(reads))
     except Exception as e:
-        print(f"Error: {e}")
-    finally:
-        connection.close()
+        view.error(e)
+        return
+    
+    view.database_stats(stats)
 
-def main():
+def main(headless=False):
     """
     Main entry point - Run all demo sequences
     
+    Args:
+        headless: Run the same queries and writes without rendering
+                  (banner, progress, tables and summary are skipped;
+                  errors go to stderr)
+    
+    Returns:
+        bool: False if the database was unreachable and OFFLINE_MODE is off
+    
     Execution Order:
       1. Connection Test - Verify MySQL connectivity
       2. Demo 1 - View Menu (browse items)
@@ -351,30 +460,72 @@ def main():
       - Displays instructions for other apps
     
     Error Handling:
-      - Aborts if database connection fails
+      - Without MySQL, runs offline from OFFLINE_DB_PATH (aborts if
+        OFFLINE_MODE is off)
       - Catches exceptions in each demo
       - Provides informative error messages
     """
-    print("\n" + "█"*80)
-    print("█" + " "*78 + "█")
-    print("█" + "🍽️  RESTAURANT MANAGEMENT SYSTEM - AUTOMATED DEMO ".center(78) + "█")
-    print("█" + " "*78 + "█")
-    print("█"*80)
+    view = HEADLESS if headless else CONSOLE
+    if not headless:
+        print("\n" + "█"*80)
+        print("█" + " "*78 + "█")
+        print("█" + "🍽️  RESTAURANT MANAGEMENT SYSTEM - AUTOMATED DEMO ".center(78) + "█")
+        print("█" + " "*78 + "█")
+        print("█"*80)
     
     # Test connection first
-    print("\n🔍 Testing database connection...")
-    test_conn = connect_to_database()
+    view.status("\n🔍 Testing database connection...")
+    test_conn = connect_to_database(view)
     if not test_conn:
-        print("❌ Failed to connect to database!")
-        return
-    test_conn.close()
-    print("✅ Database connection successful!\n")
+        view.status("❌ Failed to connect to database!")
+        if not OFFLINE_MODE:
+            return False
+        go_offline()
+        view.status(f"📴 Offline mode: orders are saved in {OFFLINE_DB_PATH} "
+                    f"and synced when MySQL is back\n")
+    else:
+        try:
+            from order_store import ensure_order_schema
+            if ensure_order_schema(test_conn):
+                view.status("✓ Upgraded 'orders' table with HeaderID/Category columns")
+        except Exception as e:
+            view.error(f"preparing order tables: {e}")
+        finally:
+            test_conn.close()
+        view.status("✅ Database connection successful!\n")
     
     # Run demos
-    demo_display_menu()
-    demo_place_order()
-    demo_view_orders()
-    demo_database_stats()
+    demo_display_menu(view)
+    demo_place_order(view)
+    demo_view_orders(view)
+    demo_database_stats(view)
+    if _offline_store is not None:
+        pending = _sync_worker.close()
+        view.status(f"\n📴 {pending} order(s) waiting in {OFFLINE_DB_PATH} "
+                    f"(push later: python3 offline_store.py sync)")
+    if headless:
+        return True
+    
+    # Connection reuse
+    stats = get_db_pool().stats()
+    print(f"\n🔌 Connection Pool: {stats['checkouts']} checkouts served by "
+          f"{stats['created']} connection(s), "
+          f"avg wait {stats['avg_wait_ms']:.2f} ms, avg hold {stats['avg_hold_ms']:.2f} ms")
+    if DB_REPLICAS:
+        stats = get_router().stats()
+        print(f"🔀 Replicas: {stats['replica_reads']} reads served by replicas, "
+              f"{stats['primary_reads']} on the primary "
+              f"({stats['read_your_writes']} read-your-writes, "
+              f"{stats['no_fresh_replica']} with no fresh replica)")
+    stats = get_menu_cache().stats()
+    print(f"📦 Menu Cache: {stats['items']} items, {stats['hits']} hits, "
+          f"{stats['misses']} misses")
+    from tabulate import tabulate
+    print("\n⏱️  Top Queries (by total time):")
+    top = [[q['count'], f"{q['total_ms']:.2f}", f"{q['p95_ms']:.2f}", q['rows'], q['sql'][:60]]
+           for q in get_query_metrics().top(5)]
+    print(tabulate(top, headers=['Calls', 'Total ms', 'p95 ms', 'Rows', 'Statement'],
+                   tablefmt='simple'))
     
     # Final summary
     print("\n" + "="*80)
@@ -399,6 +550,178 @@ Console App: /Users/pranavrao/Documents/REVA/3SEM/DBMS/DBSM-Project/restaurant_c
 GUI App: /Users/pranavrao/Documents/REVA/3SEM/DBMS/DBSM-Project/restaurant_gui.py
     """)
     print("="*80 + "\n")
+    return True
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# COMMAND LINE
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Each command imports only what it uses; run_cli() reports the startup
+# time (module imports + argument parsing) and the command time on stderr.
+
+def cli_menu(args, view=CONSOLE):
+    """menu [CATEGORY ...] - items of some or all categories"""
+    from menu_catalog import CATEGORIES
+    from restaurant_data import load_menu_preview
+    try:
+        offline_if_unreachable(view)
+        preview = load_menu_preview(get_menu_cache(), args.categories or CATEGORIES,
+                                    limit=args.limit)
+    except Exception as e:
+        view.error(e)
+        return 1
+    view.menu_preview(preview, limit=args.limit)
+    return 0
+
+def parse_cart(items):
+    """['beverages:1:2', 'curry:3'] -> [('beverages', 1, 2), ('curry', 3, 1)]"""
+    cart = []
+    for item in items:
+        parts = item.split(':')
+        if len(parts) not in (2, 3):
+            raise ValueError(f"expected CATEGORY:SL[:QTY], got {item!r}")
+        cart.append((parts[0], int(parts[1]), int(parts[2]) if len(parts) == 3 else 1))
+    return cart
+
+def cli_order(args, view=CONSOLE):
+    """order CATEGORY:SL[:QTY] ... - price a cart and store it"""
+    from order_pricing import price_cart
+    from restaurant_data import PlacedOrder, place_order
+    try:
+        cart = parse_cart(args.items)
+        if args.offline:
+            go_offline()
+        priced = price_cart(get_menu_cache(), cart, rules=get_pricing_rules())
+    except Exception as e:
+        view.error(e)
+        return 1
+    view.cart(priced)
+    if args.dry_run:
+        return 0
+    try:
+        if _offline_store is not None:
+            _, local_id = _offline_store.place_order(priced)
+            placed = PlacedOrder(local_id, priced, offline=True)
+            _sync_worker.close()
+        else:
+            placed = place_order(get_router().writes(DEMO_SESSION), priced)
+    except Exception as e:
+        view.error(e)
+        return 1
+    view.order_placed(placed)
+    return 0 if placed.header_id is not None else 1
+
+def cli_history(args, view=CONSOLE):
+    """history [--before ORDER_ID] - one page of order lines, newest first"""
+    from restaurant_data import load_order_page
+    try:
+        store = offline_if_unreachable(view)
+        if store is not None:
+            if args.before is not None:
+                raise ValueError("--before needs MySQL (offline ids are local)")
+            page = store.order_page(page_size=args.page_size)
+        else:
+            page = load_order_page(get_router().reads(), before_id=args.before,
+                                   page_size=args.page_size)
+    except Exception as e:
+        view.error(e)
+        return 1
+    view.order_page(page)
+    return 0
+
+def cli_stats(args, view=CONSOLE):
+    """stats - menu counts, table count and order totals (also a health check)"""
+    from order_stats import read_totals
+    from restaurant_data import load_database_stats
+    try:
+        store = offline_if_unreachable(view)
+        if store is not None:
+            # Local counts still render, but the health check fails
+            view.database_stats(store.database_stats())
+            view.status(f"📴 {store.pending_count()} orders waiting to sync")
+            return 1
+        reads = get_router().reads()
+        stats = load_database_stats(reads, get_catalog(reads))
+        with reads.connection() as connection:
+            line_count, order_count, revenue = read_totals(connection)
+    except Exception as e:
+        view.error(e)
+        return 1
+    view.database_stats(stats)
+    view.status(f"✓ Orders: {order_count} ({line_count} lines), revenue Rs. {revenue:.2f}")
+    return 0
+
+def cli_seed(args, view=CONSOLE):
+    """seed - generated menu items and orders for load testing"""
+    from setup_database import bulk_seed_database
+    ok = bulk_seed_database(args.items, args.orders, batch_size=args.batch_size,
+                            use_infile=args.infile)
+    return 0 if ok else 1
+
+def run_cli(argv=None):
+    """
+    Command Line
+
+    Usage:
+      python3 main.py [--headless]                  # the full demo
+      python3 main.py menu [CATEGORY ...] [--limit N]
+      python3 main.py order beverages:1:2 curry:3 [--dry-run] [--offline]
+      python3 main.py history [--before ORDER_ID] [--page-size N]
+      python3 main.py stats                         # exit status 1 if MySQL is down
+      python3 main.py seed [--items N] [--orders N]
+
+    With MySQL down (and OFFLINE_MODE on), menu, history and stats read
+    the local store instead; order needs --offline to save there.
+
+    Returns:
+        int: Exit status
+    """
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(prog='main.py', description="Restaurant Management System")
+    parser.add_argument('--headless', action='store_true',
+                        help='demo only: run every flow, render nothing')
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND')
+
+    command = commands.add_parser('menu', help='show menu items')
+    command.add_argument('categories', nargs='*', metavar='CATEGORY')
+    command.add_argument('--limit', type=int, default=5, help='items per category')
+
+    command = commands.add_parser('order', help='price a cart and place the order')
+    command.add_argument('items', nargs='+', metavar='CATEGORY:SL[:QTY]')
+    command.add_argument('--dry-run', action='store_true', help='price only, store nothing')
+    command.add_argument('--offline', action='store_true',
+                         help=f'save on this terminal ({os.path.basename(OFFLINE_DB_PATH)})')
+
+    command = commands.add_parser('history', help='order history, newest first')
+    command.add_argument('--before', type=int, default=None, metavar='ORDER_ID',
+                         help='cursor printed by the previous page')
+    command.add_argument('--page-size', type=int, default=10)
+
+    commands.add_parser('stats', help='database statistics and order totals')
+
+    command = commands.add_parser('seed', help='bulk-load generated data (setup_database.py)')
+    command.add_argument('--items', type=int, default=100000)
+    command.add_argument('--orders', type=int, default=1000000)
+    command.add_argument('--batch-size', type=int, default=5000)
+    command.add_argument('--infile', action='store_true', help='use LOAD DATA LOCAL INFILE')
+
+    args = parser.parse_args(argv)
+    started = time.perf_counter()
+    if args.command is None:
+        status = 0 if main(headless=args.headless) else 1
+    else:
+        handler = {'menu': cli_menu, 'order': cli_order, 'history': cli_history,
+                   'stats': cli_stats, 'seed': cli_seed}[args.command]
+        status = handler(args, HEADLESS if args.headless else CONSOLE)
+    finished = time.perf_counter()
+    if args.headless:
+        return status
+    print(f"⏱️  startup {(started - _STARTED) * 1000:.1f} ms, "
+          f"{args.command or 'demo'} {(finished - started) * 1000:.1f} ms", file=sys.stderr)
+    return status
+
 
 if __name__ == "__main__":
-    main()
+    import sys
+    sys.exit(run_cli())
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+In-Process Menu Cache for Restaurant Management System
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  The menu changes rarely but is read on every browse and every cart
+  line. This cache loads the whole menu once (a single query through
+  MenuCatalog.all_items()) and serves reads from memory.
+
+FUNCTIONALITY:
+  1. Whole-catalog snapshot keyed by (category, SL), stored as compact
+     column arrays (compact_menu.py)
+  2. TTL - the snapshot is reloaded on the first read after it expires
+  3. Explicit invalidation with invalidate() after menu writes
+  4. Hit / miss / reload counters via stats()
+
+USAGE:
+  from menu_cache import MenuCache
+
+  cache = MenuCache(catalog, ttl=300)
+  cache.get_item('beverages', 1)    # ('Filter Coffee', 15)
+  cache.list_category('curry')      # [(SL, ItemName, Price), ...]
+  cache.invalidate()                # after editing a menu table
+
+A hit is a read served from a fresh snapshot; a miss is a read that had to
+(re)load the snapshot first.
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+import threading
+import time
+
+from compact_menu import CompactMenu
+from menu_catalog import CATEGORIES, check_category
+
+DEFAULT_TTL = 300.0     # Seconds before the snapshot is reloaded
+
+
+class MenuSnapshot:
+    """
+    Immutable copy of the whole menu as dicts of tuples
+
+    The original snapshot layout, kept for comparison; MenuCache uses
+    compact_menu.CompactMenu unless compact=False. Both offer get(),
+    listing(), count(), keys() and len().
+
+    Attributes:
+        items: {(category, SL): (ItemName, Price)}
+        by_category: {category: [(SL, ItemName, Price), ...]} ordered by SL
+        loaded_at: time.monotonic() when the snapshot was built
+    """
+
+    __slots__ = ('items', 'by_category', 'loaded_at')
+
+    def __init__(self, rows, loaded_at):
+        self.by_category = {c: [] for c in CATEGORIES}
+        self.items = {}
+        for category, sl, name, price in rows:
+            self.items[(category, sl)] = (name, price)
+            self.by_category.setdefault(category, []).append((sl, name, price))
+        for listing in self.by_category.values():
+            listing.sort()
+        self.loaded_at = loaded_at
+
+    def get(self, category, sl):
+        return self.items.get((category, sl))
+
+    def listing(self, category, limit=None):
+        listing = self.by_category.get(category, [])
+        return listing[:limit] if limit is not None else list(listing)
+
+    def count(self, category):
+        return len(self.by_category.get(category, ()))
+
+    def keys(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+
+class MenuCache:
+    """
+    Thread-safe TTL cache over a MenuCatalog
+
+    Args:
+        catalog: menu_catalog.MenuCatalog (anything with all_items())
+        ttl: Seconds a snapshot stays fresh; None never expires
+        compact: Store snapshots as CompactMenu column arrays (default)
+                 instead of MenuSnapshot dicts of tuples
+    """
+
+    def __init__(self, catalog, ttl=DEFAULT_TTL, compact=True):
+        self.catalog = catalog
+        self.ttl = ttl
+        self._snapshot_type = CompactMenu if compact else MenuSnapshot
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._reloads = 0
+        self._invalidations = 0
+
+    def _fresh(self, snapshot):
+        return snapshot is not None and (
+            self.ttl is None or time.monotonic() - snapshot.loaded_at < self.ttl)
+
+    def snapshot(self):
+        """
+        Current snapshot, reloading it if missing or expired
+
+        Only one thread reloads; others wait for it instead of also
+        querying the database.
+        """
+        snapshot = self._snapshot
+        if self._fresh(snapshot):
+            with self._lock:
+                self._hits += 1
+            return snapshot
+        with self._lock:
+            snapshot = self._snapshot
+            if self._fresh(snapshot):       # another thread reloaded it
+                self._hits += 1
+                return snapshot
+            self._misses += 1
+            snapshot = self._snapshot_type(self.catalog.all_items(), time.monotonic())
+            self._snapshot = snapshot
+            self._reloads += 1
+            return snapshot
+
+    def invalidate(self):
+        """Drop the snapshot so the next read reloads from the database"""
+        with self._lock:
+            self._snapshot = None
+            self._invalidations += 1
+
+    def get_item(self, category, sl):
+        """
+        Returns:
+            (ItemName, Price) or None if the item does not exist
+        """
+        check_category(category)
+        return self.snapshot().get(category, sl)
+
+    def get_items(self, keys):
+        """
+        Returns:
+            dict: {(category, SL): (ItemName, Price)}; missing keys are absent
+        """
+        snapshot = self.snapshot()
+        found = {}
+        for key in keys:
+            check_category(key[0])
+            item = snapshot.get(*key)
+            if item is not None:
+                found[key] = item
+        return found
+
+    def list_category(self, category, limit=None):
+        """
+        Returns:
+            list of (SL, ItemName, Price) ordered by SL
+        """
+        check_category(category)
+        return self.snapshot().listing(category, limit)
+
+    def preview(self, categories, limit=5):
+        """
+        Returns:
+            dict: {category: first `limit` items}
+        """
+        return {c: self.list_category(c, limit) for c in categories}
+
+    def category_counts(self, categories=CATEGORIES):
+        """
+        Returns:
+            dict: {category: count}
+        """
+        snapshot = self.snapshot()
+        return {check_category(c): snapshot.count(c) for c in categories}
+
+    def stats(self):
+        """
+        Returns:
+            dict with hits, misses, reloads, invalidations, hit_ratio,
+            item count and snapshot age in seconds (None if not loaded)
+        """
+        with self._lock:
+            snapshot = self._snapshot
+            hits, misses = self._hits, self._misses
+            reloads, invalidations = self._reloads, self._invalidations
+        total = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'reloads': reloads,
+            'invalidations': invalidations,
+            'hit_ratio': hits / total if total else 0.0,
+            'items': len(snapshot) if snapshot else 0,
+            'age': time.monotonic() - snapshot.loaded_at if snapshot else None,
+        }
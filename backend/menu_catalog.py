@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Menu Catalog for Restaurant Management System
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  One place to read the menu, so callers no longer build per-category SQL
+  with f-strings and issue one query per category table.
+
+SCHEMA:
+  Legacy: 14 category tables (beverages, curry, ...) with SL, ItemName, Price
+  Unified (optional): a single menu_items table
+
+    menu_items
+      - Category VARCHAR(32)   one of CATEGORIES
+      - SL INT                 serial number within the category
+      - ItemName VARCHAR(255)
+      - Price INT
+      - PRIMARY KEY (Category, SL)       category listings / item lookups
+      - INDEX idx_menu_items_name (ItemName)   name lookups
+      - FULLTEXT ft_menu_items_name (ItemName) optional, for search_fulltext()
+
+MIGRATION:
+  migrate_legacy_tables() copies all 14 legacy tables into menu_items with
+  one INSERT ... SELECT ... UNION ALL statement. It is idempotent (REPLACE)
+  and leaves the legacy tables in place, so both schemas can coexist while
+  the Express API still reads the legacy tables.
+
+USAGE:
+  from menu_catalog import MenuCatalog
+
+  catalog = MenuCatalog(pool, unified=True)
+  catalog.category_counts()        # {'beverages': 12, ...} in one query
+  catalog.list_category('curry')   # [(SL, ItemName, Price), ...]
+  catalog.get_item('curry', 3)     # ('Dal Makhani', 180)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+import re
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# SCHEMA
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+# The 14 menu categories; also the whitelist of legacy table names
+CATEGORIES = (
+    "beverages", "chatitem", "chineseitems", "curry", "dosaitem",
+    "fruitjuice", "icecreams", "indianbreads", "mealcombo",
+    "riceitem", "soup", "southindian", "starters", "sweets"
+)
+
+CREATE_MENU_ITEMS_TABLE = """
+CREATE TABLE IF NOT EXISTS menu_items (
+    Category VARCHAR(32) NOT NULL,
+    SL INT NOT NULL,
+    ItemName VARCHAR(255) NOT NULL,
+    Price INT NOT NULL,
+    PRIMARY KEY (Category, SL),
+    INDEX idx_menu_items_name (ItemName)
+)
+"""
+
+
+def check_category(category):
+    """
+    Validate a category name before it is used as a table identifier
+
+    Raises:
+        ValueError: If category is not one of CATEGORIES
+    """
+    if category not in CATEGORIES:
+        raise ValueError(f"Unknown menu category: {category!r}")
+    return category
+
+
+# Optional: FULLTEXT index for MenuCatalog.search_fulltext() (InnoDB, MySQL 5.6+)
+CREATE_MENU_ITEMS_FULLTEXT = "ALTER TABLE menu_items ADD FULLTEXT INDEX ft_menu_items_name (ItemName)"
+
+
+def create_menu_items_table(cursor):
+    """Create the unified menu_items table (no-op if it exists)"""
+    cursor.execute(CREATE_MENU_ITEMS_TABLE)
+
+
+def create_fulltext_index(connection):
+    """
+    Add the ItemName FULLTEXT index to menu_items (no-op if it exists)
+
+    Returns:
+        bool: True if the index was created
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT COUNT(*) FROM information_schema.STATISTICS "
+                       "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'menu_items' "
+                       "AND INDEX_NAME = 'ft_menu_items_name'")
+        if cursor.fetchone()[0]:
+            return False
+        cursor.execute(CREATE_MENU_ITEMS_FULLTEXT)
+        connection.commit()
+        return True
+    finally:
+        cursor.close()
+
+
+def migrate_legacy_tables(connection, categories=CATEGORIES):
+    """
+    Copy the legacy category tables into menu_items
+
+    Runs as one INSERT ... SELECT with a UNION ALL branch per category, in
+    a single transaction. Existing (Category, SL) rows are replaced, so the
+    migration can be re-run after editing the legacy tables.
+
+    Returns:
+        int: Number of rows copied
+    """
+    branches = [
+        f"SELECT '{check_category(c)}', SL, ItemName, Price FROM {c}"
+        for c in categories
+    ]
+    cursor = connection.cursor()
+    try:
+        create_menu_items_table(cursor)
+        cursor.execute(
+            "REPLACE INTO menu_items (Category, SL, ItemName, Price) "
+            + " UNION ALL ".join(branches)
+        )
+        copied = cursor.rowcount
+        connection.commit()
+        return copied
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# CATALOG API
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class MenuCatalog:
+    """
+    Read-only access to the menu through a connection pool
+
+    Args:
+        pool: db_pool.ConnectionPool (or anything with .connection())
+        unified: Read from menu_items instead of the 14 legacy tables
+        prepared: Run queries as server-side prepared statements cached on
+                  each pooled connection (needs db_pool.ConnectionPool)
+
+    Every method is a single query on the unified schema. On the legacy
+    schema, counts and name lookups use one UNION ALL query across the
+    category tables instead of one round-trip per table.
+    """
+
+    def __init__(self, pool, unified=False, prepared=False):
+        self.pool = pool
+        self.unified = unified
+        self.prepared = prepared
+
+    def _query(self, sql, params=()):
+        with self.pool.connection() as connection:
+            if self.prepared:
+                return connection.fetch_prepared(sql, params)
+            cursor = connection.cursor()
+            try:
+                cursor.execute(sql, params)
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
+    def category_counts(self, categories=CATEGORIES):
+        """
+        Number of items per category
+
+        Returns:
+            dict: {category: count} in the order of categories
+        """
+        categories = [check_category(c) for c in categories]
+        if self.unified:
+            placeholders = ", ".join(["%s"] * len(categories))
+            rows = self._query(
+                "SELECT Category, COUNT(*) FROM menu_items "
+                f"WHERE Category IN ({placeholders}) GROUP BY Category",
+                tuple(categories))
+        else:
+            rows = self._query(" UNION ALL ".join(
+                f"SELECT '{c}', COUNT(*) FROM {c}" for c in categories))
+        counts = dict(rows)
+        return {c: counts.get(c, 0) for c in categories}
+
+    def list_category(self, category, limit=None):
+        """
+        Items of one category ordered by SL
+
+        Returns:
+            list of (SL, ItemName, Price)
+        """
+        check_category(category)
+        limit_sql = " LIMIT %s" if limit is not None else ""
+        params = (limit,) if limit is not None else ()
+        if self.unified:
+            return self._query(
+                "SELECT SL, ItemName, Price FROM menu_items "
+                f"WHERE Category = %s ORDER BY SL{limit_sql}",
+                (category,) + params)
+        return self._query(
+            f"SELECT SL, ItemName, Price FROM {category} ORDER BY SL{limit_sql}",
+            params)
+
+    def preview(self, categories, limit=5):
+        """
+        First `limit` items of several categories
+
+        Returns:
+            dict: {category: [(SL, ItemName, Price), ...]}
+        """
+        categories = [check_category(c) for c in categories]
+        if not self.unified:
+            return {c: self.list_category(c, limit) for c in categories}
+        placeholders = ", ".join(["%s"] * len(categories))
+        rows = self._query(
+            "SELECT Category, SL, ItemName, Price FROM ("
+            "  SELECT Category, SL, ItemName, Price, "
+            "         ROW_NUMBER() OVER (PARTITION BY Category ORDER BY SL) AS rn"
+            f"  FROM menu_items WHERE Category IN ({placeholders})"
+            ") ranked WHERE rn <= %s ORDER BY Category, SL",
+            tuple(categories) + (limit,))
+        result = {c: [] for c in categories}
+        for category, sl, name, price in rows:
+            result[category].append((sl, name, price))
+        return result
+
+    def get_item(self, category, sl):
+        """
+        Look up one item by its key
+
+        Returns:
+            (ItemName, Price) or None if the item does not exist
+        """
+        check_category(category)
+        if self.unified:
+            rows = self._query(
+                "SELECT ItemName, Price FROM menu_items WHERE Category = %s AND SL = %s",
+                (category, sl))
+        else:
+            rows = self._query(
+                f"SELECT ItemName, Price FROM {category} WHERE SL = %s", (sl,))
+        return rows[0] if rows else None
+
+    def get_items(self, keys):
+        """
+        Look up many items with a single query
+
+        Args:
+            keys: iterable of (category, SL)
+
+        Returns:
+            dict: {(category, SL): (ItemName, Price)}; missing keys are absent
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        if self.unified:
+            for category, _ in keys:
+                check_category(category)
+            pairs = ", ".join(["(%s, %s)"] * len(keys))
+            params = tuple(value for key in keys for value in key)
+            rows = self._query(
+                "SELECT Category, SL, ItemName, Price FROM menu_items "
+                f"WHERE (Category, SL) IN ({pairs})", params)
+        else:
+            by_category = {}
+            for category, sl in keys:
+                by_category.setdefault(check_category(category), []).append(sl)
+            branches, params = [], []
+            for category, sls in by_category.items():
+                placeholders = ", ".join(["%s"] * len(sls))
+                branches.append(f"SELECT '{category}', SL, ItemName, Price "
+                                f"FROM {category} WHERE SL IN ({placeholders})")
+                params.extend(sls)
+            rows = self._query(" UNION ALL ".join(branches), tuple(params))
+        return {(category, sl): (name, price) for category, sl, name, price in rows}
+
+    def all_items(self):
+        """
+        Whole menu in one query (used to build in-memory snapshots)
+
+        Returns:
+            list of (Category, SL, ItemName, Price) ordered by category, SL
+        """
+        if self.unified:
+            return self._query(
+                "SELECT Category, SL, ItemName, Price FROM menu_items "
+                "ORDER BY Category, SL")
+        return self._query(" UNION ALL ".join(
+            f"SELECT '{c}' AS Category, SL, ItemName, Price FROM {c}"
+            for c in CATEGORIES) + " ORDER BY Category, SL")
+
+    def search_fulltext(self, query, limit=10):
+        """
+        Item-name search through the menu_items FULLTEXT index
+
+        Every query word is required and matched as a prefix (boolean mode
+        "+word*"), like menu_search.SearchIndex without the fuzzy step.
+        Needs unified=True and setup_database.py --fulltext.
+
+        Returns:
+            list of (Category, SL, ItemName, Price), best match first
+        """
+        if not self.unified:
+            raise ValueError("FULLTEXT search needs the unified menu_items table")
+        words = re.findall(r"\w+", query)
+        if not words:
+            return []
+        against = " ".join(f"+{word}*" for word in words)
+        return self._query(
+            "SELECT Category, SL, ItemName, Price FROM menu_items "
+            "WHERE MATCH(ItemName) AGAINST (%s IN BOOLEAN MODE) "
+            "ORDER BY MATCH(ItemName) AGAINST (%s IN BOOLEAN MODE) DESC, "
+            "CHAR_LENGTH(ItemName), Category, SL LIMIT %s", (against, against, limit))
+
+    def find_by_name(self, name):
+        """
+        Exact item-name lookup across all categories
+
+        Returns:
+            list of (Category, SL, ItemName, Price)
+        """
+        if self.unified:
+            return self._query(
+                "SELECT Category, SL, ItemName, Price FROM menu_items WHERE ItemName = %s",
+                (name,))
+        sql = " UNION ALL ".join(
+            f"SELECT '{c}', SL, ItemName, Price FROM {c} WHERE ItemName = %s"
+            for c in CATEGORIES)
+        return self._query(sql, (name,) * len(CATEGORIES))
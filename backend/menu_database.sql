@@ -352,23 +352,80 @@ INSERT INTO sweets (SL, ItemName, Price) VALUES
 (4, 'Payasam', 30),
 (5, 'Mysore Pak', 40);
 
+-- ==========================================
+-- ORDER_HEADERS TABLE (Empty - Structure Only)
+-- ==========================================
+-- One row per checkout; lines in orders point at it via HeaderID
+CREATE TABLE IF NOT EXISTS order_headers (
+    HeaderID INT AUTO_INCREMENT PRIMARY KEY,
+    LineCount INT NOT NULL,
+    Subtotal DECIMAL(10,2) NOT NULL,
+    CGST DECIMAL(10,2) NOT NULL,
+    SGST DECIMAL(10,2) NOT NULL,
+    GrandTotal DECIMAL(10,2) NOT NULL,
+    OrderTime DATETIME DEFAULT CURRENT_TIMESTAMP,
+    QueueRef VARCHAR(40) NULL,
+    BranchID INT NOT NULL DEFAULT 1,
+    UNIQUE KEY uq_order_headers_queue_ref (QueueRef)
+);
+
 -- ==========================================
 -- ORDERS TABLE (Empty - Structure Only)
 -- ==========================================
 CREATE TABLE IF NOT EXISTS orders (
     OrderID INT AUTO_INCREMENT PRIMARY KEY,
+    HeaderID INT NULL,
+    Category VARCHAR(32) NULL,
     ItemName VARCHAR(255),
     Price DECIMAL(10,2),
     Quantity INT,
     TotalPrice DECIMAL(10,2),
-    OrderTime DATETIME DEFAULT CURRENT_TIMESTAMP
+    OrderTime DATETIME DEFAULT CURRENT_TIMESTAMP,
+    BranchID INT NOT NULL DEFAULT 1,
+    CreatedAt TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_orders_header (HeaderID),
+    INDEX idx_orders_branch (BranchID, OrderID),
+    INDEX idx_orders_time (OrderTime, OrderID)
+);
+
+-- ==========================================
+-- MENU_ITEMS TABLE (Optional - Unified Catalog)
+-- ==========================================
+-- One indexed table for all categories, used by menu_catalog.py
+-- when USE_UNIFIED_MENU is enabled in main.py
+CREATE TABLE IF NOT EXISTS menu_items (
+    Category VARCHAR(32) NOT NULL,
+    SL INT NOT NULL,
+    ItemName VARCHAR(255) NOT NULL,
+    Price INT NOT NULL,
+    PRIMARY KEY (Category, SL),
+    INDEX idx_menu_items_name (ItemName)
 );
 
+REPLACE INTO menu_items (Category, SL, ItemName, Price)
+SELECT 'beverages', SL, ItemName, Price FROM beverages
+UNION ALL SELECT 'chatitem', SL, ItemName, Price FROM chatitem
+UNION ALL SELECT 'chineseitems', SL, ItemName, Price FROM chineseitems
+UNION ALL SELECT 'curry', SL, ItemName, Price FROM curry
+UNION ALL SELECT 'dosaitem', SL, ItemName, Price FROM dosaitem
+UNION ALL SELECT 'fruitjuice', SL, ItemName, Price FROM fruitjuice
+UNION ALL SELECT 'icecreams', SL, ItemName, Price FROM icecreams
+UNION ALL SELECT 'indianbreads', SL, ItemName, Price FROM indianbreads
+UNION ALL SELECT 'mealcombo', SL, ItemName, Price FROM mealcombo
+UNION ALL SELECT 'riceitem', SL, ItemName, Price FROM riceitem
+UNION ALL SELECT 'soup', SL, ItemName, Price FROM soup
+UNION ALL SELECT 'southindian', SL, ItemName, Price FROM southindian
+UNION ALL SELECT 'starters', SL, ItemName, Price FROM starters
+UNION ALL SELECT 'sweets', SL, ItemName, Price FROM sweets;
+
+-- Optional FULLTEXT index for menu search (menu_catalog.search_fulltext)
+-- ALTER TABLE menu_items ADD FULLTEXT INDEX ft_menu_items_name (ItemName);
+
 -- ==========================================
 -- DATABASE SETUP COMPLETE
 -- ==========================================
--- Total Tables: 15
+-- Total Tables: 16 (+1 optional menu_items)
 -- Menu Item Tables: 14
--- Orders Table: 1
+-- Orders Tables: 2 (order_headers + orders)
 -- Total Menu Items: 229
 -- ==========================================
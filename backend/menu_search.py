@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Menu Search for Restaurant Management System
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Typeahead search over item names in all 14 categories, served from
+  memory so a POS keystroke costs well under a millisecond instead of 14
+  LIKE '%...%' table scans.
+
+INDEX (built once per menu snapshot):
+  - Names are split into lowercase word tokens ("Paneer Butter Masala" ->
+    paneer, butter, masala); each token maps to the items containing it
+  - Prefix matching: the distinct tokens are kept sorted, so every token
+    starting with a prefix is one bisect range (a flattened trie)
+  - Fuzzy matching: a trigram inverted index over the tokens finds
+    candidates for a misspelt term, which are then checked with a
+    bounded edit distance (1 edit for words of 3-5 letters, 2 for longer)
+
+QUERY:
+  Every query word must match some token of the item name (all words are
+  treated as prefixes, so "pan tik" finds "Paneer Tikka"). Words with no
+  exact/prefix match fall back to fuzzy matching. Results are ranked by
+  match quality (exact > prefix > fuzzy), then shorter names first.
+
+MYSQL:
+  With the unified menu_items table, setup_database.py --fulltext adds a
+  FULLTEXT index and MenuCatalog.search_fulltext() queries it in boolean
+  mode - useful when the menu is too large to hold in memory.
+
+USAGE:
+  from menu_search import MenuSearch
+
+  search = MenuSearch(get_menu_cache())     # rebuilds when the cache reloads
+  search.search("panir", limit=5)           # [SearchHit(...), ...]
+
+  python3 menu_search.py paneer             # search the live menu
+  python3 menu_search.py --bench 200000     # latency on a generated menu
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+import heapq
+import re
+import threading
+from bisect import bisect_left
+from collections import namedtuple
+
+SearchHit = namedtuple('SearchHit', 'category sl item_name price score')
+
+# Per-word scores
+EXACT, PREFIX, FUZZY = 3.0, 2.0, 1.0
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    """Lowercase alphanumeric words of a name or query"""
+    return _WORD.findall(text.lower())
+
+
+def _trigrams(token):
+    padded = f" {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def max_edits(term):
+    """Edits allowed when fuzzy matching a query word"""
+    if len(term) < 3:
+        return 0
+    return 1 if len(term) < 6 else 2
+
+
+def edit_distance(a, b, limit):
+    """Levenshtein distance, or limit + 1 as soon as it must exceed limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        best = i
+        for j, cb in enumerate(b, 1):
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            current.append(value)
+            best = min(best, value)
+        if best > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class SearchIndex:
+    """
+    Immutable search index over one set of menu rows
+
+    Args:
+        rows: Iterable of (Category, SL, ItemName, Price)
+    """
+
+    def __init__(self, rows):
+        self.items = [tuple(row) for row in rows]   # (category, sl, name, price) by item id
+        # Tie-break order for equal scores: shorter names first
+        order = sorted(range(len(self.items)), key=lambda i: (
+            len(self.items[i][2]), self.items[i][0], self.items[i][1]))
+        self.rank = [0] * len(self.items)
+        for position, item_id in enumerate(order):
+            self.rank[item_id] = position
+
+        postings = {}
+        for item_id in order:
+            for token in set(tokenize(self.items[item_id][2])):
+                postings.setdefault(token, []).append(item_id)
+
+        # Posting lists are in rank order, so the best items come first
+        self.tokens = sorted(postings)
+        self.postings = [postings[token] for token in self.tokens]
+        token_ids = {token: i for i, token in enumerate(self.tokens)}
+        self.item_tokens = [tuple(token_ids[t] for t in set(tokenize(item[2])))
+                            for item in self.items]
+        self.trigrams = {}
+        for token_id, token in enumerate(self.tokens):
+            for gram in _trigrams(token):
+                self.trigrams.setdefault(gram, []).append(token_id)
+
+    def __len__(self):
+        return len(self.items)
+
+    # ─── Term matching ───────────────────────────────────────────────────
+
+    def _prefix_tokens(self, term):
+        """{token_id: score} for tokens equal to / starting with term"""
+        matches = {}
+        position = bisect_left(self.tokens, term)
+        while position < len(self.tokens) and self.tokens[position].startswith(term):
+            matches[position] = EXACT if self.tokens[position] == term else PREFIX
+            position += 1
+        return matches
+
+    def _fuzzy_tokens(self, term):
+        """{token_id: score} for tokens within max_edits(term) of term"""
+        limit = max_edits(term)
+        if not limit:
+            return {}
+        grams = _trigrams(term)
+        shared = {}
+        for gram in grams:
+            for token_id in self.trigrams.get(gram, ()):
+                shared[token_id] = shared.get(token_id, 0) + 1
+        # q-gram lemma: within k edits, at least |grams| - 3k trigrams are shared
+        needed = max(1, len(grams) - 3 * limit)
+        matches = {}
+        for token_id, count in shared.items():
+            if count < needed:
+                continue
+            token = self.tokens[token_id]
+            distance = edit_distance(term, token, limit)
+            if distance > limit and len(token) > len(term):
+                # typeahead: the misspelt word may be a prefix of the token
+                distance = edit_distance(term, token[:len(term)], limit)
+            if distance <= limit:
+                matches[token_id] = FUZZY - 0.25 * distance
+        return matches
+
+    def search(self, query, limit=10, fuzzy=True):
+        """
+        Find items whose name matches every word of the query
+
+        Returns:
+            list of SearchHit, best first
+        """
+        terms = []
+        for term in set(tokenize(query)):
+            tokens = self._prefix_tokens(term)
+            if not tokens and fuzzy:
+                tokens = self._fuzzy_tokens(term)
+            if not tokens:
+                return []
+            size = sum(len(self.postings[token_id]) for token_id in tokens)
+            terms.append((size, tokens))
+        if not terms:
+            return []
+        terms.sort(key=lambda term: term[0])
+
+        # Candidates come from the most selective word. With a single word,
+        # only the first `limit` items of each posting list can make the cut.
+        _, tokens = terms[0]
+        head = limit if len(terms) == 1 else None
+        scores = {}
+        for token_id, score in tokens.items():
+            for item_id in self.postings[token_id][:head]:
+                if scores.get(item_id, 0) < score:
+                    scores[item_id] = score
+
+        # Every other word must match one of the candidate's own tokens
+        for _, tokens in terms[1:]:
+            narrowed = {}
+            for item_id, score in scores.items():
+                best = max((tokens.get(t, 0) for t in self.item_tokens[item_id]), default=0)
+                if best:
+                    narrowed[item_id] = score + best
+            scores = narrowed
+            if not scores:
+                return []
+
+        rank, items = self.rank, self.items
+        best = heapq.nsmallest(limit, scores.items(), key=lambda e: (-e[1], rank[e[0]]))
+        return [SearchHit(*items[item_id], score) for item_id, score in best]
+
+
+class MenuSearch:
+    """
+    Search over a MenuCache, rebuilt whenever the cache loads a new snapshot
+
+    Args:
+        menu_cache: menu_cache.MenuCache
+    """
+
+    def __init__(self, menu_cache):
+        self.menu_cache = menu_cache
+        self._snapshot = None
+        self._index = None
+        self._lock = threading.Lock()
+
+    def index(self):
+        snapshot = self.menu_cache.snapshot()
+        if snapshot is not self._snapshot:
+            with self._lock:
+                if snapshot is not self._snapshot:
+                    rows = [(category, sl) + snapshot.get(category, sl)
+                            for category, sl in snapshot.keys()]
+                    self._index = SearchIndex(rows)
+                    self._snapshot = snapshot
+        return self._index
+
+    def search(self, query, limit=10, fuzzy=True):
+        """See SearchIndex.search()"""
+        return self.index().search(query, limit, fuzzy)
+
+
+if __name__ == "__main__":
+    """
+    Command Line
+
+    Usage:
+      python3 menu_search.py <query words...>
+      python3 menu_search.py --bench [items]
+    """
+    import sys
+    import time
+
+    if len(sys.argv) < 2:
+        print("Usage: python3 menu_search.py <query> | --bench [items]")
+        sys.exit(1)
+
+    if sys.argv[1] == "--bench":
+        import random
+        from benchmark import summarize
+        from bulk_seed import generate_menu_items
+        from setup_database import MENU_TABLES
+
+        count = int(sys.argv[2]) if len(sys.argv) > 2 else 200000
+        rows = [(c, sl, name, price) for c, items in MENU_TABLES.items()
+                for sl, name, price in items]
+        rows += list(generate_menu_items(count))
+        started = time.perf_counter()
+        index = SearchIndex(rows)
+        print(f"\nIndexed {len(index):,} items ({len(index.tokens):,} distinct words) "
+              f"in {time.perf_counter() - started:.2f}s")
+
+        rng = random.Random(5)
+        words = [t for t in index.tokens if len(t) >= 4 and not t.isdigit()]
+        queries = []
+        for _ in range(2000):
+            word = rng.choice(words)
+            kind = rng.random()
+            if kind < 0.4:
+                queries.append(word[:rng.randint(2, len(word))])            # typeahead
+            elif kind < 0.7:
+                queries.append(f"{rng.choice(words)[:3]} {word}")           # two words
+            else:
+                i = rng.randrange(len(word))
+                queries.append(word[:i] + rng.choice('aeiou') + word[i + 1:])   # typo
+        samples = []
+        for query in queries:
+            started = time.perf_counter()
+            index.search(query, limit=10)
+            samples.append((time.perf_counter() - started) * 1000)
+        stats = summarize(samples)
+        print(f"{len(queries)} queries: p50 {stats['p50_ms']:.3f} ms, p95 {stats['p95_ms']:.3f} ms, "
+              f"p99 {stats['p99_ms']:.3f} ms")
+        sys.exit(0)
+
+    from main import get_menu_cache
+    query = " ".join(sys.argv[1:])
+    try:
+        search = MenuSearch(get_menu_cache())
+        search.index()
+        started = time.perf_counter()
+        hits = search.search(query)
+        elapsed = (time.perf_counter() - started) * 1000
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    for hit in hits:
+        print(f"  {hit.category:<14} {hit.sl:>4}  {hit.item_name:<32} Rs.{hit.price}")
+    print(f"\n✓ {len(hits)} match(es) for '{query}' in {elapsed:.3f} ms")
@@ -0,0 +1,564 @@
+#!/usr/bin/env python3
+"""
+Offline Mode for Restaurant POS Terminals
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Keeps a terminal taking orders while MySQL is unreachable. The terminal
+  works against a local SQLite file; a background worker pushes the
+  orders taken offline to MySQL and pulls menu changes whenever the
+  server is reachable again.
+
+LOCAL STORE (terminal.db, SQLite in WAL mode):
+  - the 14 menu tables of setup_database.py (SL, ItemName, Price), seeded
+    with the bundled menu until the first successful sync
+  - pending_orders
+      LocalID INTEGER PRIMARY KEY   shown on the receipt while offline
+      QueueRef TEXT UNIQUE          idempotency key, becomes
+                                    order_headers.QueueRef in MySQL
+      OrderTime TEXT, Payload TEXT  the priced cart (order_queue format)
+      HeaderID, SyncedAt            set once the order is in MySQL
+  - sync_state  key/value: menu fingerprint, last push / pull times
+
+  WAL lets the sync worker read pending orders while a checkout writes;
+  a checkout is one INSERT and one fsync'ed local commit.
+
+SYNC:
+  push  unsynced orders in LocalID order, batch_size per transaction,
+        with order_store.insert_orders(). Refs already in MySQL (a push
+        whose COMMIT reply was lost) are skipped via find_queued(), so an
+        order is never written twice.
+  pull  the whole menu (MenuCatalog.all_items()); the local menu tables
+        are replaced in one transaction when the fingerprint changed.
+  The worker syncs every `interval` seconds (sooner after a checkout via
+  wake()) and backs off while MySQL is down.
+
+USAGE:
+  from offline_store import OfflineStore, SyncWorker
+
+  store = OfflineStore('terminal.db')
+  menu = MenuCache(store)                          # store.all_items()
+  ref, local_id = store.place_order(price_cart(menu, cart))
+  worker = SyncWorker(store, pool, on_menu_change=menu.invalidate)
+  ...
+  worker.close()
+
+  python3 offline_store.py status                  # pending orders
+  python3 offline_store.py sync                    # push/pull once (main.DB_CONFIG)
+  python3 offline_store.py bench                   # outage drill on the fake
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from menu_catalog import CATEGORIES, MenuCatalog
+from order_queue import decode_order, encode_order
+from order_store import find_queued, insert_orders
+
+DEFAULT_OFFLINE_DB = 'terminal.db'
+DEFAULT_SYNC_INTERVAL = 5.0     # Seconds between syncs while online
+DEFAULT_SYNC_BATCH = 50
+MAX_SYNC_DELAY = 60.0           # Longest backoff while MySQL is down
+KEEP_SYNCED_DAYS = 7            # Synced orders kept locally for reprints
+
+CREATE_LOCAL_MENU_TABLE = """
+CREATE TABLE IF NOT EXISTS {table} (
+    SL INTEGER PRIMARY KEY,
+    ItemName TEXT NOT NULL,
+    Price INTEGER NOT NULL
+)
+"""
+
+CREATE_PENDING_ORDERS_TABLE = """
+CREATE TABLE IF NOT EXISTS pending_orders (
+    LocalID INTEGER PRIMARY KEY AUTOINCREMENT,
+    QueueRef TEXT NOT NULL UNIQUE,
+    OrderTime TEXT NOT NULL,
+    Payload TEXT NOT NULL,
+    HeaderID INTEGER NULL,
+    SyncedAt TEXT NULL
+)
+"""
+
+# Unsynced orders are found through this index, not a table scan
+CREATE_UNSYNCED_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_pending_unsynced
+ON pending_orders (LocalID) WHERE SyncedAt IS NULL
+"""
+
+CREATE_SYNC_STATE_TABLE = """
+CREATE TABLE IF NOT EXISTS sync_state (
+    Key TEXT PRIMARY KEY,
+    Value TEXT NOT NULL
+)
+"""
+
+# Result of one SyncWorker.sync_once()
+SyncResult = namedtuple('SyncResult', 'pushed already_stored menu_changed')
+
+
+def menu_fingerprint(rows):
+    """Digest of a whole menu as returned by all_items()"""
+    digest = hashlib.sha1()
+    for row in sorted(rows):
+        digest.update(repr(tuple(row)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# LOCAL STORE
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class OfflineStore:
+    """
+    Terminal-local SQLite database: menu copy plus orders waiting for MySQL
+
+    Args:
+        path: Database file (created if missing)
+        synchronous: SQLite synchronous level; FULL (default) fsyncs every
+                     checkout, NORMAL may lose the last orders on power loss
+        menu_tables: Menu to seed an empty store with, defaults to
+                     setup_database.MENU_TABLES
+
+    Thread-safe: every thread gets its own SQLite connection.
+    """
+
+    def __init__(self, path=DEFAULT_OFFLINE_DB, synchronous='FULL', menu_tables=None):
+        self.path = path
+        self.synchronous = synchronous
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        self._create_schema(menu_tables)
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode = WAL')
+            connection.execute(f'PRAGMA synchronous = {self.synchronous}')
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def _create_schema(self, menu_tables):
+        connection = self._connection()
+        with connection:
+            for category in CATEGORIES:
+                connection.execute(CREATE_LOCAL_MENU_TABLE.format(table=category))
+            connection.execute(CREATE_PENDING_ORDERS_TABLE)
+            connection.execute(CREATE_UNSYNCED_INDEX)
+            connection.execute(CREATE_SYNC_STATE_TABLE)
+        if self.state('menu_fingerprint') is None:
+            if menu_tables is None:
+                from setup_database import MENU_TABLES
+                menu_tables = MENU_TABLES
+            self.replace_menu([(category, sl, name, price)
+                               for category, items in menu_tables.items()
+                               for sl, name, price in items], source='bundled')
+
+    # ─── Sync state ──────────────────────────────────────────────────────
+
+    def state(self, key, default=None):
+        row = self._connection().execute(
+            "SELECT Value FROM sync_state WHERE Key = ?", (key,)).fetchone()
+        return default if row is None else row[0]
+
+    def _set_state(self, connection, **values):
+        connection.executemany("INSERT OR REPLACE INTO sync_state (Key, Value) VALUES (?, ?)",
+                               [(key, str(value)) for key, value in values.items()])
+
+    # ─── Menu ────────────────────────────────────────────────────────────
+
+    def all_items(self):
+        """
+        Local menu in MenuCatalog.all_items() form, so MenuCache(store) works
+
+        Returns:
+            list of (Category, SL, ItemName, Price) ordered by category, SL
+        """
+        return self._connection().execute(" UNION ALL ".join(
+            f"SELECT '{c}' AS Category, SL, ItemName, Price FROM {c}"
+            for c in CATEGORIES) + " ORDER BY Category, SL").fetchall()
+
+    def replace_menu(self, rows, source='mysql'):
+        """
+        Replace the local menu in one transaction if it changed
+
+        Args:
+            rows: [(Category, SL, ItemName, Price), ...] - the whole menu;
+                  unknown categories are ignored
+            source: Recorded in sync_state ('bundled' or 'mysql')
+
+        Returns:
+            bool: True if the menu changed
+        """
+        rows = [row for row in rows if row[0] in CATEGORIES]
+        fingerprint = menu_fingerprint(rows)
+        if fingerprint == self.state('menu_fingerprint'):
+            return False
+        connection = self._connection()
+        with connection:
+            for category in CATEGORIES:
+                connection.execute(f"DELETE FROM {category}")
+                connection.executemany(
+                    f"INSERT INTO {category} (SL, ItemName, Price) VALUES (?, ?, ?)",
+                    [(sl, name, price) for c, sl, name, price in rows if c == category])
+            self._set_state(connection, menu_fingerprint=fingerprint, menu_source=source,
+                            menu_pulled_at=datetime.now().isoformat(timespec='seconds'))
+        return True
+
+    # ─── Orders ──────────────────────────────────────────────────────────
+
+    def place_order(self, priced):
+        """
+        Save a checkout on the terminal (one local commit)
+
+        Returns:
+            (queue_ref, local_id)
+
+        Raises:
+            ValueError: If the cart has no priced lines
+        """
+        if not priced.lines:
+            raise ValueError("Cannot place an order without items")
+        ref = uuid.uuid4().hex
+        order_time = datetime.now().replace(microsecond=0)
+        connection = self._connection()
+        with connection:
+            cursor = connection.execute(
+                "INSERT INTO pending_orders (QueueRef, OrderTime, Payload) VALUES (?, ?, ?)",
+                (ref, order_time.isoformat(), encode_order(ref, order_time, priced)))
+        return ref, cursor.lastrowid
+
+    def unsynced(self, limit=DEFAULT_SYNC_BATCH):
+        """
+        Oldest orders not yet in MySQL
+
+        Returns:
+            list of (queue_ref, order_time, PricedCart)
+        """
+        rows = self._connection().execute(
+            "SELECT Payload FROM pending_orders WHERE SyncedAt IS NULL "
+            "ORDER BY LocalID LIMIT ?", (limit,)).fetchall()
+        return [decode_order(json.loads(payload)) for payload, in rows]
+
+    def mark_synced(self, stored):
+        """Record MySQL HeaderIDs for pushed orders ({QueueRef: HeaderID})"""
+        synced_at = datetime.now().isoformat(timespec='seconds')
+        connection = self._connection()
+        with connection:
+            connection.executemany(
+                "UPDATE pending_orders SET HeaderID = ?, SyncedAt = ? WHERE QueueRef = ?",
+                [(header_id, synced_at, ref) for ref, header_id in stored.items()])
+            self._set_state(connection, pushed_at=synced_at)
+
+    def pending_count(self):
+        return self._connection().execute(
+            "SELECT COUNT(*) FROM pending_orders WHERE SyncedAt IS NULL").fetchone()[0]
+
+    def prune_synced(self, keep_days=KEEP_SYNCED_DAYS):
+        """Delete synced orders older than keep_days; returns the count"""
+        cutoff = (datetime.now() - timedelta(days=keep_days)).isoformat(timespec='seconds')
+        connection = self._connection()
+        with connection:
+            cursor = connection.execute(
+                "DELETE FROM pending_orders WHERE SyncedAt IS NOT NULL AND SyncedAt < ?",
+                (cutoff,))
+        return cursor.rowcount
+
+    def order_page(self, page_size=10):
+        """
+        Newest order lines taken on this terminal, for the history screen
+
+        Returns:
+            restaurant_data.OrderPage - order ids are LocalIDs, totals
+            cover the orders still held locally
+        """
+        from restaurant_data import OrderPage, OrderRow
+        connection = self._connection()
+        recent = connection.execute(
+            "SELECT LocalID, Payload FROM pending_orders ORDER BY LocalID DESC LIMIT ?",
+            (page_size,)).fetchall()
+        rows = []
+        for local_id, payload in recent:
+            _, order_time, priced = decode_order(json.loads(payload))
+            rows.extend(OrderRow(local_id, line.item_name, line.price, line.quantity,
+                                 line.total, order_time) for line in priced.lines)
+        line_count = order_count = revenue = 0
+        for payload, in connection.execute("SELECT Payload FROM pending_orders"):
+            _, _, priced = decode_order(json.loads(payload))
+            order_count += 1
+            line_count += len(priced.lines)
+            revenue += priced.subtotal
+        return OrderPage(rows[:page_size], None, line_count, order_count, revenue)
+
+    def database_stats(self):
+        """
+        Menu counts and table count of the local store, for the stats screen
+
+        Returns:
+            restaurant_data.DatabaseStats
+        """
+        from restaurant_data import CategoryCount, DatabaseStats
+        connection = self._connection()
+        counts = [CategoryCount(category, connection.execute(
+                      f"SELECT COUNT(*) FROM {category}").fetchone()[0])
+                  for category in CATEGORIES]
+        table_count = connection.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' "
+            "AND name NOT LIKE 'sqlite_%'").fetchone()[0]
+        return DatabaseStats(counts, sum(count.items for count in counts), table_count)
+
+    def close(self):
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# SYNC WORKER
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class SyncWorker:
+    """
+    Background thread pushing offline orders and pulling the menu
+
+    Args:
+        store: OfflineStore
+        pool: ConnectionPool for MySQL
+        catalog: MenuCatalog to pull the menu from (default MenuCatalog(pool))
+        interval: Seconds between syncs while MySQL is reachable
+        batch_size: Orders per MySQL transaction
+        on_menu_change: Called after a pull changed the local menu, e.g.
+                        MenuCache.invalidate
+        start: Start the thread now (False: call sync_once() yourself)
+    """
+
+    def __init__(self, store, pool, catalog=None, interval=DEFAULT_SYNC_INTERVAL,
+                 batch_size=DEFAULT_SYNC_BATCH, on_menu_change=None, start=True):
+        self.store = store
+        self.pool = pool
+        self.catalog = catalog or MenuCatalog(pool)
+        self.interval = interval
+        self.batch_size = batch_size
+        self.on_menu_change = on_menu_change
+        self.online = None          # None until the first attempt
+        self.last_error = None
+        self._stats = {'syncs': 0, 'failures': 0, 'pushed': 0, 'already_stored': 0,
+                       'menu_pulls': 0}
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        if start:
+            self._thread = threading.Thread(target=self._run, name='offline-sync', daemon=True)
+            self._thread.start()
+
+    def wake(self):
+        """
+        Sync now instead of at the next interval (e.g. after a checkout);
+        ignored while MySQL is down, so checkouts do not cut the backoff
+        """
+        if self.online is not False:
+            self._wake.set()
+
+    def sync_once(self):
+        """
+        Push every unsynced order, then pull the menu
+
+        Returns:
+            SyncResult
+
+        Raises:
+            Exception: Database errors; orders pushed before the error stay
+                       marked as synced
+        """
+        pushed = already = 0
+        while True:
+            batch = self.store.unsynced(self.batch_size)
+            if not batch:
+                break
+            with self.pool.connection() as connection:
+                stored = find_queued(connection, [ref for ref, _, _ in batch])
+                todo = [entry for entry in batch if entry[0] not in stored]
+                if todo:
+                    stored.update(zip((ref for ref, _, _ in todo),
+                                      insert_orders(connection, todo)))
+            self.store.mark_synced(stored)
+            pushed += len(todo)
+            already += len(batch) - len(todo)
+        menu_changed = self.store.replace_menu(self.catalog.all_items())
+        if menu_changed and self.on_menu_change is not None:
+            self.on_menu_change()
+        self.store.prune_synced()
+        self._stats['syncs'] += 1
+        self._stats['pushed'] += pushed
+        self._stats['already_stored'] += already
+        self._stats['menu_pulls'] += menu_changed
+        return SyncResult(pushed, already, menu_changed)
+
+    def _run(self):
+        failures = 0
+        while not self._stop.is_set():
+            try:
+                self.sync_once()
+                self.online, self.last_error = True, None
+                failures = 0
+                delay = self.interval
+            except Exception as e:
+                self.online, self.last_error = False, e
+                self._stats['failures'] += 1
+                failures += 1
+                delay = min(self.interval * (2 ** (failures - 1)), MAX_SYNC_DELAY)
+            self._wake.wait(delay)
+            self._wake.clear()
+
+    def close(self, final_sync=True):
+        """
+        Stop the worker, optionally trying one last sync
+
+        Returns:
+            int: Orders still waiting for MySQL
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        if final_sync:
+            try:
+                self.sync_once()
+            except Exception as e:
+                self.last_error = e
+        return self.store.pending_count()
+
+    def stats(self):
+        return dict(self._stats, online=self.online, pending=self.store.pending_count())
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# COMMAND LINE
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def main():
+    import argparse
+    import os
+    import tempfile
+
+    from benchmark import summarize
+    from db_pool import ConnectionPool
+    from menu_cache import MenuCache
+    from order_pricing import price_cart
+    from order_service import random_carts
+    from order_stats import read_totals
+    from order_store import ensure_order_schema, insert_order
+
+    parser = argparse.ArgumentParser(description="POS terminal offline store")
+    parser.add_argument('command', nargs='?', default='status', choices=('status', 'sync', 'bench'))
+    parser.add_argument('--db', default=DEFAULT_OFFLINE_DB, help='terminal database file')
+    parser.add_argument('--checkouts', type=int, default=200, help='bench: checkouts during the outage')
+    parser.add_argument('--latency-ms', type=float, default=2.0,
+                        help='bench: fake MySQL per-statement latency in ms (default 2)')
+    args = parser.parse_args()
+
+    if args.command == 'status':
+        store = OfflineStore(args.db)
+        print(f"✓ {args.db}: {store.pending_count()} order(s) waiting for MySQL; "
+              f"menu from {store.state('menu_source')} ({store.state('menu_pulled_at')}), "
+              f"last push {store.state('pushed_at', 'never')}")
+        store.close()
+        return
+
+    if args.command == 'sync':
+        from main import DB_CONFIG
+        store = OfflineStore(args.db)
+        pool = ConnectionPool(DB_CONFIG, size=1)
+        try:
+            with pool.connection() as connection:
+                ensure_order_schema(connection)
+            result = SyncWorker(store, pool, start=False).sync_once()
+        except Exception as e:
+            print(f"❌ Sync failed, {store.pending_count()} order(s) still waiting: {e}")
+            raise SystemExit(1)
+        finally:
+            pool.close_all()
+        print(f"✓ Pushed {result.pushed} order(s) ({result.already_stored} already in MySQL); "
+              f"menu {'updated' if result.menu_changed else 'unchanged'}")
+        store.close()
+        return
+
+    # bench: an outage drill against the in-process fake
+    from fake_db import FakeDatabase
+    fake = FakeDatabase(latency=args.latency_ms / 1000).load_menu()
+    reachable = threading.Event()
+
+    def connect(**config):
+        if not reachable.is_set():
+            raise ConnectionError("MySQL unreachable (simulated outage)")
+        return fake.connect(**config)
+
+    pool = ConnectionPool({}, size=2, connect=connect)
+    store = OfflineStore(os.path.join(tempfile.mkdtemp(), DEFAULT_OFFLINE_DB))
+    menu = MenuCache(store, ttl=None)
+    carts = [price_cart(menu, cart) for cart in
+             random_carts(list(menu.snapshot().keys()), args.checkouts)]
+
+    print(f"\nOffline drill: {args.checkouts} checkouts during a MySQL outage, "
+          f"fake MySQL at {args.latency_ms} ms/statement")
+    print("-" * 64)
+    worker = SyncWorker(store, pool, interval=0.2, on_menu_change=menu.invalidate)
+    samples = []
+    for priced in carts:
+        t = time.perf_counter()
+        store.place_order(priced)
+        samples.append((time.perf_counter() - t) * 1000)
+        worker.wake()
+    local = summarize(samples)
+
+    reachable.set()
+    samples = []
+    for priced in carts[:50]:
+        t = time.perf_counter()
+        with pool.connection() as connection:
+            insert_order(connection, priced)
+        samples.append((time.perf_counter() - t) * 1000)
+    direct = summarize(samples)
+    print(f"{'checkout':<18}{'p50 ms':>10}{'p99 ms':>10}")
+    print(f"{'local (offline)':<18}{local['p50_ms']:>10.3f}{local['p99_ms']:>10.3f}")
+    print(f"{'direct to MySQL':<18}{direct['p50_ms']:>10.3f}{direct['p99_ms']:>10.3f}")
+
+    # MySQL is back: the worker drains the backlog and picks up a price change
+    with pool.connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute("UPDATE beverages SET Price = Price + 5 WHERE SL = 1")
+        connection.commit()
+        cursor.close()
+    started = time.perf_counter()
+    while store.pending_count() or menu.get_item('beverages', 1)[1] == carts[0].lines[0].price:
+        if time.perf_counter() - started > 30:
+            break
+        time.sleep(0.05)
+    drained = time.perf_counter() - started
+    stats = worker.stats()
+    pending = worker.close(final_sync=False)
+    with pool.connection() as connection:
+        _, order_count, _ = read_totals(connection)
+    print(f"\n✓ Backlog synced {drained:.2f}s after reconnect: {stats['pushed']} pushed, "
+          f"{pending} pending, {order_count} order(s) in MySQL; "
+          f"{stats['failures']} failed attempt(s) during the outage")
+    print(f"✓ Menu pulls: {stats['menu_pulls']} (local menu now "
+          f"Rs.{menu.get_item('beverages', 1)[1]} for {menu.get_item('beverages', 1)[0]})")
+    store.close()
+    pool.close_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Parallel Columnar Export of Order History for Restaurant Management System
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Nightly export of the orders table for analytics. Tens of millions of
+  order lines are split into OrderID ranges that are read and written in
+  parallel, so the export time is set by the number of workers rather
+  than the size of the table.
+
+PIPELINE:
+  1. plan     MIN/MAX(OrderID) after `after_id`, cut into ranges of
+              range_size ids. The upper bound is fixed here and taken
+              only from lines inserted at least settle_seconds ago
+              (orders.CreatedAt, compared with the server's NOW()): an
+              AUTO_INCREMENT id can commit after a higher one, and a
+              bound raced past it would lose that line for this run and
+              every incremental run after it (as in sales_rollup.py).
+              Newer orders are left for the next run (pass the
+              manifest's max_order_id as after_id).
+  2. export   every range in its own worker process with its own MySQL
+              connection; rows are streamed by primary-key range
+              (order_history.stream_orders) and written batch by batch,
+              one file per day the range touches
+  3. manifest manifest.json lists every file with its day, row count,
+              OrderID span, size and SHA-256. It is written last (and
+              atomically), so a directory without one is an unfinished
+              export.
+
+OUTPUT (partitioned by day, Hive style):
+  OUT_DIR/day=2026-10-17/part-00000001-00250000.parquet
+  OUT_DIR/manifest.json
+
+FORMATS:
+  parquet  Parquet, zstd-compressed (default; needs pyarrow)
+  arrow    Arrow IPC file, zstd-compressed (needs pyarrow)
+  csv.gz   gzip CSV - row-oriented fallback when pyarrow is not installed
+
+USAGE:
+  python3 order_export.py exports/2026-10-18 --workers 8
+  python3 order_export.py exports/2026-10-19 --after-id 41250000
+  python3 order_export.py /tmp/export --fake 200000    # in-process fake data
+
+  from order_export import export_orders
+  manifest = export_orders(DB_CONFIG, 'exports/2026-10-18', workers=8)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+import csv
+import gzip
+import hashlib
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime
+from decimal import Decimal
+
+from order_history import ORDER_COLUMNS, stream_orders
+from sales_rollup import DEFAULT_SETTLE_SECONDS
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:         # optional - only csv.gz is available without it
+    pyarrow = None
+
+DEFAULT_WORKERS = 4
+DEFAULT_RANGE_SIZE = 250000     # OrderIDs per worker task
+DEFAULT_BATCH_SIZE = 10000      # Rows per round-trip and per written batch
+MANIFEST = 'manifest.json'
+
+FORMATS = ('parquet', 'arrow', 'csv.gz')
+EXTENSIONS = {'parquet': '.parquet', 'arrow': '.arrow', 'csv.gz': '.csv.gz'}
+
+
+def default_format():
+    return 'parquet' if pyarrow is not None else 'csv.gz'
+
+
+def settle_cutoff(connection, settle_seconds):
+    """Server time settle_seconds ago - lines inserted by then count as settled"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT NOW() - INTERVAL %s SECOND", (settle_seconds,))
+        return cursor.fetchone()[0]
+    finally:
+        cursor.close()
+
+
+def plan_ranges(connection, after_id=0, range_size=DEFAULT_RANGE_SIZE, settled_before=None):
+    """
+    OrderID ranges covering every order line after after_id
+
+    Args:
+        settled_before: Take the upper bound only from lines with CreatedAt
+                        at or before this server time (settle_cutoff();
+                        None = every line)
+
+    Returns:
+        list of (after_id, until_id) - rows with after_id < OrderID <= until_id
+    """
+    cursor = connection.cursor()
+    try:
+        if settled_before is None:
+            cursor.execute("SELECT MIN(OrderID), MAX(OrderID) FROM orders WHERE OrderID > %s",
+                           (after_id,))
+        else:
+            cursor.execute("SELECT MIN(OrderID), MAX(OrderID) FROM orders "
+                           "WHERE OrderID > %s AND CreatedAt <= %s", (after_id, settled_before))
+        low, high = cursor.fetchone()
+    finally:
+        cursor.close()
+    if low is None:
+        return []
+    start = max(after_id, low - 1)
+    return [(lo, min(lo + range_size, high)) for lo in range(start, high, range_size)]
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# FILE WRITERS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _arrow_schema():
+    return pyarrow.schema([
+        ('OrderID', pyarrow.int64()),
+        ('HeaderID', pyarrow.int64()),
+        ('Category', pyarrow.string()),
+        ('ItemName', pyarrow.string()),
+        ('Price', pyarrow.decimal128(12, 2)),
+        ('Quantity', pyarrow.int32()),
+        ('TotalPrice', pyarrow.decimal128(12, 2)),
+        ('OrderTime', pyarrow.timestamp('s')),
+    ])
+
+
+def _as_datetime(value):
+    """OrderTime as datetime (MySQL returns datetime, the fake text)"""
+    return value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+
+
+def _as_money(value):
+    return None if value is None else Decimal(str(value)).quantize(Decimal('0.01'))
+
+
+class _ArrowWriter:
+    """Incremental Parquet / Arrow IPC file writer"""
+
+    def __init__(self, path, fmt):
+        self.schema = _arrow_schema()
+        if fmt == 'parquet':
+            self._writer = pyarrow.parquet.ParquetWriter(path, self.schema, compression='zstd')
+        else:
+            options = pyarrow.ipc.IpcWriteOptions(compression='zstd')
+            self._writer = pyarrow.ipc.new_file(path, self.schema, options=options)
+
+    def write(self, rows):
+        columns = list(zip(*rows))
+        columns[4] = [_as_money(v) for v in columns[4]]
+        columns[6] = [_as_money(v) for v in columns[6]]
+        columns[7] = [_as_datetime(v) for v in columns[7]]
+        self._writer.write_table(pyarrow.Table.from_arrays(
+            [pyarrow.array(column, type=field.type)
+             for column, field in zip(columns, self.schema)], schema=self.schema))
+
+    def close(self):
+        self._writer.close()
+
+
+class _CsvGzWriter:
+    """gzip CSV writer with the same interface"""
+
+    def __init__(self, path, fmt):
+        self._handle = gzip.open(path, 'wt', newline='', compresslevel=6)
+        self._writer = csv.writer(self._handle)
+        self._writer.writerow(ORDER_COLUMNS)
+
+    def write(self, rows):
+        self._writer.writerows(rows)
+
+    def close(self):
+        self._handle.close()
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for block in iter(lambda: handle.read(io.DEFAULT_BUFFER_SIZE * 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# WORKER
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def export_range(config, connect, after_id, until_id, out_dir, fmt=None,
+                 batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Export the order lines after_id < OrderID <= until_id, one file per day
+
+    Runs in a worker process: opens its own connection with
+    connect(**config) (default mysql.connector) and closes it when done.
+
+    Returns:
+        list of manifest entries (dicts), one per file written
+    """
+    from db_pool import mysql_connect
+    fmt = fmt or default_format()
+    writer_type = _CsvGzWriter if fmt == 'csv.gz' else _ArrowWriter
+    name = f"part-{after_id + 1:08d}-{until_id:08d}{EXTENSIONS[fmt]}"
+    files = {}                  # day -> [writer, path, rows, min id, max id]
+
+    connection = (connect or mysql_connect)(**config)
+    try:
+        batch = []
+
+        def flush():
+            by_day = {}
+            for row in batch:
+                by_day.setdefault(str(row[7])[:10], []).append(row)
+            for day, rows in by_day.items():
+                entry = files.get(day)
+                if entry is None:
+                    partition = os.path.join(out_dir, f"day={day}")
+                    os.makedirs(partition, exist_ok=True)
+                    path = os.path.join(partition, name)
+                    entry = files[day] = [writer_type(path, fmt), path, 0, rows[0][0], 0]
+                entry[0].write(rows)
+                entry[2] += len(rows)
+                entry[4] = rows[-1][0]
+            batch.clear()
+
+        for row in stream_orders(connection, after_id, until_id, batch_size=batch_size):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+    finally:
+        for entry in files.values():
+            entry[0].close()
+        connection.close()
+
+    return [{
+        'path': os.path.relpath(path, out_dir),
+        'day': day,
+        'rows': rows,
+        'min_order_id': min_id,
+        'max_order_id': max_id,
+        'bytes': os.path.getsize(path),
+        'sha256': _sha256(path),
+    } for day, (_, path, rows, min_id, max_id) in sorted(files.items())]
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# EXPORT
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def export_orders(config, out_dir, fmt=None, workers=DEFAULT_WORKERS,
+                  range_size=DEFAULT_RANGE_SIZE, batch_size=DEFAULT_BATCH_SIZE,
+                  after_id=0, settle_seconds=DEFAULT_SETTLE_SECONDS, connect=None,
+                  processes=True):
+    """
+    Export every order line after after_id to out_dir and write the manifest
+
+    Args:
+        config: Connection config (e.g. main.DB_CONFIG)
+        out_dir: Export directory (created; must not hold a manifest yet)
+        fmt: 'parquet', 'arrow' or 'csv.gz' (default parquet if pyarrow
+             is installed)
+        workers: Ranges exported at the same time
+        range_size: OrderIDs per range
+        batch_size: Rows per fetch and per write
+        after_id: Export only OrderIDs above this (incremental runs)
+        settle_seconds: Bound the export by lines inserted at least this
+                        long ago (server clock), so ids
+                        still being committed are left for the next run
+                        (0 = up to MAX(OrderID), only safe with no writers)
+        connect: Connection factory (default mysql.connector); with
+                 processes=True it must be picklable (module level)
+        processes: Worker processes (True) or threads (False - for
+                   in-process fakes, whose data other processes cannot see)
+
+    Returns:
+        dict: The manifest
+
+    Raises:
+        ValueError: Unknown format, or a format that needs pyarrow without it
+        FileExistsError: out_dir already holds a finished export
+        Exception: The first failed range (no manifest is written)
+    """
+    from db_pool import mysql_connect
+    fmt = fmt or default_format()
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown format {fmt!r} (choose from {', '.join(FORMATS)})")
+    if fmt != 'csv.gz' and pyarrow is None:
+        raise ValueError(f"{fmt} export needs pyarrow (pip install pyarrow) - or use csv.gz")
+    manifest_path = os.path.join(out_dir, MANIFEST)
+    if os.path.exists(manifest_path):
+        raise FileExistsError(f"{out_dir} already holds an export ({MANIFEST})")
+    os.makedirs(out_dir, exist_ok=True)
+
+    started = time.perf_counter()
+    settled_before = None
+    connection = (connect or mysql_connect)(**config)
+    try:
+        if settle_seconds:
+            settled_before = settle_cutoff(connection, settle_seconds)
+        ranges = plan_ranges(connection, after_id, range_size, settled_before)
+    finally:
+        connection.close()
+
+    executor_type = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    files = []
+    with executor_type(max_workers=max(1, min(workers, len(ranges) or 1))) as executor:
+        futures = [executor.submit(export_range, config, connect, lo, hi, out_dir, fmt,
+                                   batch_size) for lo, hi in ranges]
+        for future in as_completed(futures):
+            files.extend(future.result())
+
+    files.sort(key=lambda entry: (entry['day'], entry['min_order_id']))
+    manifest = {
+        'table': 'orders',
+        'format': fmt,
+        'compression': 'gzip' if fmt == 'csv.gz' else 'zstd',
+        'columns': list(ORDER_COLUMNS),
+        'partitioning': 'day',
+        'after_id': after_id,
+        'max_order_id': ranges[-1][1] if ranges else after_id,
+        'settle_seconds': settle_seconds,
+        'settled_before': str(settled_before) if settled_before is not None else None,
+        'ranges': len(ranges),
+        'rows': sum(entry['rows'] for entry in files),
+        'bytes': sum(entry['bytes'] for entry in files),
+        'days': sorted({entry['day'] for entry in files}),
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'seconds': round(time.perf_counter() - started, 3),
+        'files': files,
+    }
+    temporary = manifest_path + '.tmp'
+    with open(temporary, 'w', encoding='utf-8') as handle:
+        json.dump(manifest, handle, indent=2)
+    os.replace(temporary, manifest_path)
+    return manifest
+
+
+if __name__ == "__main__":
+    """
+    Command Line
+
+    Usage:
+      python3 order_export.py OUT_DIR [--format parquet|arrow|csv.gz]
+                              [--workers N] [--range-size N] [--after-id N]
+                              [--settle-seconds N] [--fake ROWS]
+
+    Exports from main.DB_CONFIG, or with --fake from an in-process fake
+    seeded with ROWS order lines (worker threads instead of processes).
+    """
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Parallel columnar export of order history")
+    parser.add_argument('out_dir')
+    parser.add_argument('--format', choices=FORMATS, default=None,
+                        help=f'file format (default {default_format()})')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    parser.add_argument('--range-size', type=int, default=DEFAULT_RANGE_SIZE,
+                        help=f'OrderIDs per task (default {DEFAULT_RANGE_SIZE})')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--after-id', type=int, default=0,
+                        help="export only newer orders (a previous manifest's max_order_id)")
+    parser.add_argument('--settle-seconds', type=int, default=None,
+                        help=f'leave orders inserted less than this long ago for the next '
+                             f'run (default {DEFAULT_SETTLE_SECONDS}, 0 with --fake)')
+    parser.add_argument('--fake', type=int, metavar='ROWS',
+                        help='export generated orders from the in-process fake')
+    args = parser.parse_args()
+
+    settle = args.settle_seconds
+    if settle is None:
+        # Just-seeded fake rows have not settled yet, and nothing else writes
+        settle = 0 if args.fake else DEFAULT_SETTLE_SECONDS
+    if args.fake:
+        from bulk_seed import bulk_seed
+        from fake_db import FakeDatabase
+        fake = FakeDatabase().load_menu()
+        connection = fake.connect()
+        bulk_seed(connection, orders=args.fake, report=lambda *a: None)
+        connection.close()
+        config, connect, processes = {}, fake.connect, False
+        source = f"fake ({args.fake:,} generated order lines)"
+    else:
+        from main import DB_CONFIG
+        config, connect, processes = DB_CONFIG, None, True
+        source = f"MySQL {DB_CONFIG['host']}"
+
+    try:
+        manifest = export_orders(config, args.out_dir, fmt=args.format, workers=args.workers,
+                                 range_size=args.range_size, batch_size=args.batch_size,
+                                 after_id=args.after_id, settle_seconds=settle,
+                                 connect=connect, processes=processes)
+    except Exception as e:
+        print(f"❌ Export failed: {e}")
+        sys.exit(1)
+    seconds = manifest['seconds']
+    print(f"✓ Exported {manifest['rows']:,} order lines from {source} in {seconds:.2f}s "
+          f"({manifest['rows'] / seconds if seconds else 0:,.0f} rows/s)")
+    print(f"   {len(manifest['files'])} {manifest['format']} file(s), "
+          f"{manifest['bytes'] / 1e6:.1f} MB, {len(manifest['days'])} day(s), "
+          f"{manifest['ranges']} range(s) on {args.workers} worker(s)")
+    print(f"   manifest: {os.path.join(args.out_dir, MANIFEST)} "
+          f"(next run: --after-id {manifest['max_order_id']})")
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Order History Paging and Export for Restaurant Management System
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Reads order history a page or a chunk at a time, so deep pages and full
+  exports cost the same per row as the first page and never hold the
+  whole table in memory.
+
+PAGINATION (keyset):
+  Pages are addressed by the last OrderID seen, not by OFFSET:
+
+    WHERE OrderID < :cursor ORDER BY OrderID DESC LIMIT :page_size
+
+  This is a primary-key range scan, so page 1000 costs the same as page 1.
+
+  fetch_time_page() pages by (OrderTime, OrderID) instead, for merging the
+  pages of several databases whose OrderIDs are unrelated (order_shards.py);
+  it scans idx_orders_time.
+
+STREAMING:
+  stream_orders() yields rows oldest first in constant memory:
+    - mode='keyset'      repeated PK-range queries of batch_size rows; the
+                         connection is free between batches (default)
+    - mode='unbuffered'  one query read with an unbuffered cursor and
+                         fetchmany(); fastest, but the connection stays
+                         busy until the last row is read
+
+USAGE:
+  python3 order_history.py page [before_id|-] [size]   # one page, newest first
+  python3 order_history.py export orders.csv     # stream everything to CSV
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+import csv
+import sys
+
+ORDER_COLUMNS = ('OrderID', 'HeaderID', 'Category', 'ItemName', 'Price',
+                 'Quantity', 'TotalPrice', 'OrderTime')
+PAGE_COLUMNS = ('OrderID', 'ItemName', 'Price', 'Quantity', 'TotalPrice', 'OrderTime')
+DEFAULT_PAGE_SIZE = 10
+DEFAULT_BATCH_SIZE = 1000
+
+
+def fetch_page(connection, before_id=None, page_size=DEFAULT_PAGE_SIZE, branch_id=None):
+    """
+    One page of order lines, newest first
+
+    Args:
+        before_id: Cursor from the previous page (None for the first page)
+        page_size: Rows per page
+        branch_id: Only this outlet's lines (uses idx_orders_branch)
+
+    Returns:
+        (rows, next_cursor) - rows are PAGE_COLUMNS tuples; next_cursor is
+        None when there are no older rows
+    """
+    cursor = connection.cursor()
+    try:
+        columns = ", ".join(PAGE_COLUMNS)
+        conditions, params = [], []
+        if branch_id is not None:
+            conditions.append("BranchID = %s")
+            params.append(branch_id)
+        if before_id is not None:
+            conditions.append("OrderID < %s")
+            params.append(before_id)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        cursor.execute(f"SELECT {columns} FROM orders{where} ORDER BY OrderID DESC LIMIT %s",
+                       tuple(params) + (page_size + 1,))
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+    # One extra row tells us whether another page exists
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        return rows, rows[-1][0]
+    return rows, None
+
+
+def fetch_time_page(connection, before=None, page_size=DEFAULT_PAGE_SIZE, branch_id=None):
+    """
+    One page of order lines, newest OrderTime first (OrderID breaks ties)
+
+    Args:
+        before: (OrderTime, OrderID) cursor from the previous page (None
+                for the first page)
+        page_size: Rows per page
+        branch_id: Only this outlet's lines
+
+    Returns:
+        (rows, next_cursor) - rows are PAGE_COLUMNS tuples; next_cursor is
+        (OrderTime, OrderID) of the last row, or None when there are no
+        older rows
+    """
+    cursor = connection.cursor()
+    try:
+        columns = ", ".join(PAGE_COLUMNS)
+        conditions, params = [], []
+        if branch_id is not None:
+            conditions.append("BranchID = %s")
+            params.append(branch_id)
+        if before is not None:
+            conditions.append("(OrderTime < %s OR (OrderTime = %s AND OrderID < %s))")
+            params.extend((before[0], before[0], before[1]))
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        cursor.execute(f"SELECT {columns} FROM orders{where} "
+                       "ORDER BY OrderTime DESC, OrderID DESC LIMIT %s",
+                       tuple(params) + (page_size + 1,))
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        return rows, (rows[-1][-1], rows[-1][0])
+    return rows, None
+
+
+def stream_orders(connection, after_id=0, until_id=None, batch_size=DEFAULT_BATCH_SIZE,
+                  mode='keyset'):
+    """
+    Yield order lines (ORDER_COLUMNS tuples) oldest first
+
+    Args:
+        connection: Open connection; with mode='unbuffered' it must not be
+                    used for anything else until the generator finishes
+        after_id: Start after this OrderID
+        until_id: Stop at this OrderID (inclusive); None = no upper bound
+        batch_size: Rows fetched per round-trip
+        mode: 'keyset' or 'unbuffered' (see module docstring)
+    """
+    columns = ", ".join(ORDER_COLUMNS)
+    upper = " AND OrderID <= %s" if until_id is not None else ""
+    upper_params = (until_id,) if until_id is not None else ()
+
+    if mode == 'unbuffered':
+        cursor = connection.cursor(buffered=False)
+        try:
+            cursor.execute(f"SELECT {columns} FROM orders WHERE OrderID > %s{upper} "
+                           "ORDER BY OrderID", (after_id,) + upper_params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+        return
+
+    if mode != 'keyset':
+        raise ValueError(f"Unknown stream mode: {mode!r}")
+
+    last_id = after_id
+    while True:
+        cursor = connection.cursor()
+        try:
+            cursor.execute(f"SELECT {columns} FROM orders WHERE OrderID > %s{upper} "
+                           "ORDER BY OrderID LIMIT %s", (last_id,) + upper_params + (batch_size,))
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+        if not rows:
+            return
+        yield from rows
+        if len(rows) < batch_size:
+            return
+        last_id = rows[-1][0]
+
+
+def export_csv(connection, path, after_id=0, batch_size=DEFAULT_BATCH_SIZE, mode='keyset'):
+    """
+    Stream the order history to a CSV file
+
+    Returns:
+        (rows written, last OrderID written or None)
+    """
+    written = 0
+    last_id = None
+    with open(path, 'w', newline='') as handle:
+        writer = csv.writer(handle)
+        writer.writerow(ORDER_COLUMNS)
+        for row in stream_orders(connection, after_id, batch_size=batch_size, mode=mode):
+            writer.writerow(row)
+            written += 1
+            last_id = row[0]
+    return written, last_id
+
+
+if __name__ == "__main__":
+    """
+    Command Line
+
+    Usage:
+      python3 order_history.py page [before_id|-] [page_size]
+      python3 order_history.py export <file.csv> [after_id]
+    """
+    from main import connect_to_database
+    from restaurant_views import print_table
+
+    command = sys.argv[1] if len(sys.argv) > 1 else "page"
+    if command not in ("page", "export") or (command == "export" and len(sys.argv) < 3):
+        print("Usage: python3 order_history.py page [before_id|-] [page_size] | "
+              "export <file.csv> [after_id]")
+        sys.exit(1)
+
+    connection = connect_to_database()
+    if not connection:
+        sys.exit(1)
+    try:
+        if command == "page":
+            before_id = int(sys.argv[2]) if len(sys.argv) > 2 and sys.argv[2] != '-' else None
+            page_size = int(sys.argv[3]) if len(sys.argv) > 3 else DEFAULT_PAGE_SIZE
+            rows, next_cursor = fetch_page(connection, before_id, page_size)
+            connection.close()      # release before rendering
+            print_table(rows, ['Order ID', 'Item Name', 'Price', 'Qty', 'Total', 'Order Time'])
+            if next_cursor is not None:
+                print(f"\nNext page: python3 order_history.py page {next_cursor} {page_size}")
+        else:
+            after_id = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+            written, last_id = export_csv(connection, sys.argv[2], after_id, mode='unbuffered')
+            print(f"✓ Exported {written} order lines to {sys.argv[2]} (last OrderID {last_id})")
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    finally:
+        connection.close()
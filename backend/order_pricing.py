@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Cart Pricing for Restaurant Management System
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Prices a whole cart at once. Every (category, SL) in the cart is
+  resolved with a single get_items() call - one query on MenuCatalog,
+  no query at all on MenuCache - instead of one SELECT per cart line.
+
+USAGE:
+  from order_pricing import price_cart
+
+  cart = [("beverages", 1, 2), ("dosaitem", 2, 1)]   # (category, SL, qty)
+  priced = price_cart(catalog_or_cache, cart)
+  priced.lines          # [PricedLine(...), ...] in cart order
+  priced.missing        # [(category, SL, qty), ...] not on the menu
+  priced.grand_total
+
+TAX AND DISCOUNTS:
+  Applied from a compiled pricing_rules.PricingRules table (default: CGST
+  2.5% + SGST 2.5% on the subtotal, as in the original demo). Each line
+  looks up its rule once; happy-hour and combo prices change the line
+  total, and each tax slab is taxed on its own subtotal. Amounts are
+  computed exactly by billing.py: cgst, sgst, grand_total and discount
+  are Decimal rupees with two places, ready for the DECIMAL(10,2) columns.
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+from collections import namedtuple
+from datetime import datetime
+
+from billing import tax, to_paise, to_rupees
+from pricing_rules import STANDARD_RULES
+
+# One priced cart line; total = price * quantity less any discount
+PricedLine = namedtuple('PricedLine', 'category sl item_name price quantity total')
+
+# Result of price_cart(); subtotal is after discounts
+PricedCart = namedtuple('PricedCart', 'lines missing subtotal cgst sgst grand_total discount',
+                        defaults=(0,))
+
+
+def price_cart(menu, cart, rules=None, at=None):
+    """
+    Price every line of a cart with one batched item lookup
+
+    Args:
+        menu: MenuCatalog or MenuCache (anything with get_items(keys))
+        cart: iterable of (category, item_sl, quantity)
+        rules: pricing_rules.PricingRules (default: standard GST, no discounts)
+        at: Order time for happy hours (default: now)
+
+    Returns:
+        PricedCart
+
+    Raises:
+        ValueError: For a non-positive quantity or unknown category
+    """
+    rules = rules or STANDARD_RULES
+    cart = list(cart)
+    for category, item_sl, quantity in cart:
+        if quantity <= 0:
+            raise ValueError(f"Quantity must be positive: {category} #{item_sl} x {quantity}")
+
+    items = menu.get_items((category, item_sl) for category, item_sl, _ in cart)
+
+    found = []
+    missing = []
+    combo_units = [0] * len(rules.combos)
+    for category, item_sl, quantity in cart:
+        item = items.get((category, item_sl))
+        if item is None:
+            missing.append((category, item_sl, quantity))
+            continue
+        rule = rules.rule_for(category, item_sl)
+        for combo in rule.triggers:
+            combo_units[combo] += quantity
+        found.append((category, item_sl, quantity, item, rule))
+
+    moment = None
+    lines = []
+    slab_totals = [0] * len(rules.slabs)
+    gross = 0
+    for category, item_sl, quantity, (item_name, price), rule in found:
+        total = price * quantity
+        gross += total
+        if rule.happy_hours or rule.combo is not None:
+            unit = to_paise(price)
+            if rule.happy_hours:
+                if moment is None:
+                    now = at or datetime.now()
+                    moment = (now.weekday(), now.hour * 60 + now.minute)
+                # percentage off, rounded half-up to the paisa like a tax
+                unit -= tax(unit, rules.discount_bp(rule, moment))
+            paise = unit * quantity
+            if rule.combo is not None and combo_units[rule.combo]:
+                combo = rules.combos[rule.combo]
+                units = min(quantity, combo_units[rule.combo])
+                combo_units[rule.combo] -= units
+                paise -= units * max(unit - combo.price, 0)
+            if paise != to_paise(total):
+                total = to_rupees(paise)
+        lines.append(PricedLine(category, item_sl, item_name, price, quantity, total))
+        slab_totals[rule.slab] += total
+
+    subtotal = sum(slab_totals)
+    cgst = sgst = 0
+    for (cgst_bp, sgst_bp), slab_total in zip(rules.slabs, slab_totals):
+        if slab_total:
+            cgst += tax(to_paise(slab_total), cgst_bp)
+            sgst += tax(to_paise(slab_total), sgst_bp)
+    subtotal_paise = to_paise(subtotal)
+    return PricedCart(lines, missing, subtotal, to_rupees(cgst), to_rupees(sgst),
+                      to_rupees(subtotal_paise + cgst + sgst),
+                      to_rupees(to_paise(gross) - subtotal_paise))
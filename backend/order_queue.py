@@ -0,0 +1,643 @@
+#!/usr/bin/env python3
+"""
+Write-Behind Order Queue for Restaurant Management System
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Accepts checkouts immediately and writes them to MySQL in the
+  background, so checkout latency stays flat at peak hours even when the
+  database is slow or briefly unavailable.
+
+DESIGN:
+  1. submit() appends the priced order to a local append-only journal
+     (one JSON line, fsync'ed) and puts it on an in-process queue. Once
+     submit() returns, the order survives a crash.
+  2. A background writer thread takes up to batch_size orders, waiting at
+     most max_wait seconds for a batch to fill, and stores the whole batch
+     in one transaction (order_store.insert_orders).
+  3. After the commit a "done" record for the batch goes to the journal.
+     Transient failures (connection lost, pool timeout, deadlock) are
+     retried with backoff (capped at MAX_RETRY_DELAY) for as long as the
+     outage lasts; submit() keeps accepting orders meanwhile. Only after
+     close() does a batch give up, after max_attempts tries: it stays in
+     the journal (no "done" record) and is replayed on the next start.
+     A permanent failure (constraint violation, bad data, schema error)
+     is not retried: the batch is split so the good orders are still
+     stored, and each order that fails on its own is moved to the
+     dead-letter journal (<journal>.dead) and its future fails with the
+     error. One bad order no longer blocks the orders behind it.
+  4. On start, orders in the journal without a "done" record are
+     replayed. Every order carries a unique QueueRef (order_headers has a
+     UNIQUE index on it), and replayed or retried batches skip refs that
+     are already stored, so a crash between COMMIT and the "done" record
+     never writes an order twice.
+  5. The journal is truncated whenever every order in it is done.
+
+USAGE:
+  from order_queue import OrderQueue
+
+  orders = OrderQueue(pool, journal_path='orders.journal')
+  ref, result = orders.submit(price_cart(menu_cache, cart))   # returns at once
+  header_id = result.result(timeout=5)    # optional: wait for the write
+  orders.close()                          # drain, then stop the writer
+
+  python3 order_queue.py --checkouts 500 --latency-ms 2    # load test (fake)
+  python3 order_queue.py outage --outage-seconds 3         # outage drill (fake)
+  python3 order_queue.py --mysql replay                    # flush a journal
+  python3 order_queue.py --mysql replay --journal orders.journal.dead
+                                              # retry dead letters once fixed
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+import json
+import os
+import queue
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from datetime import datetime
+from decimal import Decimal
+
+from db_pool import PoolTimeout
+from order_pricing import PricedCart, PricedLine
+from order_service import ServiceBusy
+from order_store import find_queued, insert_orders
+
+DEFAULT_JOURNAL = 'orders.journal'
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_MAX_WAIT = 0.05         # Seconds to wait for a batch to fill
+DEFAULT_MAX_QUEUE = 10000
+MAX_RETRY_DELAY = 5.0
+DEFAULT_MAX_ATTEMPTS = 8        # Tries per batch on transient errors once closing
+
+# mysql.connector errnos a retry can fix: too many connections, lock wait
+# timeout, deadlock, cannot connect, server gone away, connection lost
+TRANSIENT_ERRNOS = {1040, 1205, 1213, 2002, 2003, 2006, 2013, 2055}
+
+_STOP = object()
+
+
+def is_transient(error):
+    """
+    True for errors worth retrying (connection trouble, lock timeouts),
+    False for errors in the orders themselves (constraints, bad data,
+    schema) that would fail again on every attempt
+    """
+    if isinstance(error, (PoolTimeout, ConnectionError, TimeoutError)):
+        return True
+    if getattr(error, 'errno', None) in TRANSIENT_ERRNOS:
+        return True
+    # mysql.connector raises these for lost / refused connections
+    return (type(error).__module__.startswith('mysql.connector')
+            and type(error).__name__ in ('InterfaceError', 'OperationalError'))
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# JOURNAL
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def encode_order(ref, order_time, priced):
+    return json.dumps({
+        'op': 'order',
+        'ref': ref,
+        'time': order_time.isoformat(),
+        # Money as strings so Decimal amounts round-trip exactly
+        'lines': [[line.category, line.sl, line.item_name, str(line.price), line.quantity,
+                   str(line.total)] for line in priced.lines],
+        'subtotal': str(priced.subtotal),
+        'cgst': str(priced.cgst),
+        'sgst': str(priced.sgst),
+        'grand_total': str(priced.grand_total),
+    }, separators=(',', ':'))
+
+
+def decode_order(record):
+    """Returns: (ref, order_time, PricedCart)"""
+    lines = [PricedLine(category, sl, name, Decimal(str(price)), quantity, Decimal(str(total)))
+             for category, sl, name, price, quantity, total in record['lines']]
+    subtotal, cgst, sgst, grand_total = (
+        Decimal(str(record[key])) for key in ('subtotal', 'cgst', 'sgst', 'grand_total'))
+    priced = PricedCart(lines, [], subtotal, cgst, sgst, grand_total)
+    return record['ref'], datetime.fromisoformat(record['time']), priced
+
+
+class OrderJournal:
+    """
+    Append-only JSON-lines journal of queued orders
+
+    Args:
+        path: Journal file (created if missing)
+        fsync: fsync after every append (turn off only for tests/benchmarks)
+
+    Orders that cannot be stored go to the dead-letter journal path +
+    '.dead' - order records in the same format plus the error, so it can
+    be replayed as a journal of its own.
+    """
+
+    def __init__(self, path, fsync=True):
+        self.path = path
+        self.dead_letter_path = path + '.dead'
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._pending = self._load()
+        self._rewrite(self._pending.values())
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def _load(self):
+        """Orders in the journal without a done record, in journal order"""
+        pending = {}
+        if not os.path.exists(self.path):
+            return pending
+        with open(self.path, encoding='utf-8') as handle:
+            for line in handle:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue        # torn last line from a crash mid-append
+                if record.get('op') == 'order':
+                    pending[record['ref']] = record
+                elif record.get('op') == 'done':
+                    for ref in record['refs']:
+                        pending.pop(ref, None)
+        return pending
+
+    def _rewrite(self, records):
+        """Atomically replace the journal with just `records`"""
+        temporary = self.path + '.tmp'
+        with open(temporary, 'w', encoding='utf-8') as handle:
+            for record in records:
+                handle.write(json.dumps(record, separators=(',', ':')) + '\n')
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, self.path)
+
+    def _append(self, line):
+        self._file.write(line + '\n')
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def recovered(self):
+        """Orders to replay: list of (ref, order_time, PricedCart)"""
+        with self._lock:
+            return [decode_order(record) for record in self._pending.values()]
+
+    def append_order(self, ref, order_time, priced):
+        with self._lock:
+            self._append(encode_order(ref, order_time, priced))
+            self._pending[ref] = None
+
+    def append_done(self, refs, truncate_over=0):
+        """
+        Mark orders as stored; truncates the journal when nothing is pending
+        and the file is larger than truncate_over bytes
+        """
+        with self._lock:
+            self._append(json.dumps({'op': 'done', 'refs': list(refs)}, separators=(',', ':')))
+            for ref in refs:
+                self._pending.pop(ref, None)
+            if not self._pending and self._file.tell() > truncate_over:
+                self._file.seek(0)
+                self._file.truncate()
+                if self.fsync:
+                    os.fsync(self._file.fileno())
+
+    def append_dead(self, entries, error, truncate_over=0):
+        """
+        Move orders to the dead-letter journal, then mark them done here
+
+        Args:
+            entries: [(ref, order_time, PricedCart), ...]
+            error: Exception that made them fail
+        """
+        with self._lock, open(self.dead_letter_path, 'a', encoding='utf-8') as handle:
+            for ref, order_time, priced in entries:
+                record = json.loads(encode_order(ref, order_time, priced))
+                record['error'] = f"{type(error).__name__}: {error}"
+                handle.write(json.dumps(record, separators=(',', ':')) + '\n')
+            handle.flush()
+            os.fsync(handle.fileno())
+        self.append_done([entry[0] for entry in entries], truncate_over)
+
+    @property
+    def pending(self):
+        return len(self._pending)
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# QUEUE
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class OrderQueue:
+    """
+    Journaled producer/consumer queue with one background writer thread
+
+    Args:
+        pool: db_pool.ConnectionPool
+        journal_path: Append-only journal file
+        batch_size: Most orders written per transaction
+        max_wait: Seconds the writer waits for a batch to fill
+        max_queue: Orders waiting before submit() raises ServiceBusy
+        fsync: fsync the journal on every submit
+        retry_delay: First retry delay after a failed batch (doubles, up
+                     to MAX_RETRY_DELAY)
+        max_attempts: Tries per batch on transient errors after close();
+                      until then transient errors are retried indefinitely
+        truncate_over: Truncate the drained journal once it exceeds this
+                       many bytes
+    """
+
+    def __init__(self, pool, journal_path=DEFAULT_JOURNAL, batch_size=DEFAULT_BATCH_SIZE,
+                 max_wait=DEFAULT_MAX_WAIT, max_queue=DEFAULT_MAX_QUEUE, fsync=True,
+                 retry_delay=0.2, max_attempts=DEFAULT_MAX_ATTEMPTS, truncate_over=1 << 20):
+        self.pool = pool
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.retry_delay = retry_delay
+        self.max_attempts = max_attempts
+        self.truncate_over = truncate_over
+        self.journal = OrderJournal(journal_path, fsync)
+        self.last_error = None
+        self._queue = queue.Queue(max_queue)
+        self._closing = False
+        self._closed = threading.Event()    # cuts a retry backoff short
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'submitted': 0,
+            'replayed': 0,
+            'written': 0,
+            'already_stored': 0,
+            'batches': 0,
+            'retries': 0,
+            'dead_lettered': 0,
+            'left_in_journal': 0,
+            'commit_total': 0.0,
+            'commit_max': 0.0,
+        }
+
+        # Replay what the last run left behind, ahead of new orders
+        for ref, order_time, priced in self.journal.recovered():
+            self._queue.put((ref, order_time, priced, None, True))
+            self._stats['replayed'] += 1
+
+        self._writer = threading.Thread(target=self._run, name='order-writer', daemon=True)
+        self._writer.start()
+
+    # ─── Producer side ───────────────────────────────────────────────────
+
+    def submit(self, priced):
+        """
+        Queue a priced checkout for writing
+
+        Returns:
+            (queue_ref, Future) - the future resolves to the HeaderID once
+            the order is stored; it fails with the error if the order was
+            dead-lettered, or if close() gave up while MySQL was down (the
+            order then stays in the journal for the next start)
+
+        Raises:
+            ValueError: If the cart has no priced lines
+            ServiceBusy: If max_queue orders are already waiting
+            RuntimeError: After close()
+        """
+        if not priced.lines:
+            raise ValueError("Cannot place an order without items")
+        if self._closing:
+            raise RuntimeError("order queue is closed")
+        if self._queue.full():
+            raise ServiceBusy(f"{self._queue.qsize()} orders waiting to be written")
+        ref = uuid.uuid4().hex
+        order_time = datetime.now().replace(microsecond=0)
+        result = Future()
+        self.journal.append_order(ref, order_time, priced)   # durable from here on
+        self._queue.put((ref, order_time, priced, result, False))
+        with self._stats_lock:
+            self._stats['submitted'] += 1
+        return ref, result
+
+    def flush(self):
+        """Block until every queued order has been written"""
+        self._queue.join()
+
+    def close(self):
+        """
+        Write everything still queued, then stop the writer thread
+
+        While MySQL is down each remaining batch gets max_attempts more
+        tries; what is still unwritten then is replayed on the next start.
+        """
+        if self._closing:
+            return
+        self._closing = True
+        self._closed.set()
+        self._queue.put(_STOP)
+        self._writer.join()
+        self.journal.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    # ─── Writer thread ───────────────────────────────────────────────────
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 \
+                        else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    self._queue.task_done()
+                    stopping = True
+                    break
+                batch.append(item)
+            self._write(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    def _write(self, batch):
+        """
+        Store one batch; transient errors are retried with backoff until
+        it is stored (or close() gives up), a permanent error splits the
+        batch to dead-letter just the orders that fail on their own
+        """
+        attempt = 0
+        closing_attempts = 0
+        while True:
+            try:
+                stored = self._store(batch, check_all=attempt > 0)
+                break
+            except Exception as e:
+                self.last_error = e
+                attempt += 1
+                if is_transient(e):
+                    if self._closing:
+                        closing_attempts += 1
+                        if closing_attempts >= self.max_attempts:
+                            self._leave_in_journal(batch, e)
+                            return
+                    with self._stats_lock:
+                        self._stats['retries'] += 1
+                    self._closed.wait(min(self.retry_delay * (2 ** min(attempt - 1, 16)),
+                                          MAX_RETRY_DELAY))
+                    continue
+                if len(batch) > 1:
+                    # The batch is one transaction: find the orders that fail
+                    for entry in batch:
+                        self._write([entry])
+                    return
+                self._dead_letter(batch, e)
+                return
+
+        self.journal.append_done([entry[0] for entry in batch], self.truncate_over)
+        for ref, _, _, result, _ in batch:
+            if result is not None:
+                result.set_result(stored[ref])
+
+    def _leave_in_journal(self, batch, error):
+        """Closing with MySQL still down: replay these on the next start"""
+        with self._stats_lock:
+            self._stats['left_in_journal'] += len(batch)
+        for _, _, _, result, _ in batch:
+            if result is not None:
+                result.set_exception(error)
+
+    def _dead_letter(self, batch, error):
+        """Move orders that could not be stored out of the way"""
+        self.journal.append_dead([entry[:3] for entry in batch], error, self.truncate_over)
+        with self._stats_lock:
+            self._stats['dead_lettered'] += len(batch)
+        for _, _, _, result, _ in batch:
+            if result is not None:
+                result.set_exception(error)
+
+    def _store(self, batch, check_all):
+        """
+        Returns:
+            dict: {QueueRef: HeaderID} for the whole batch
+        """
+        started = time.perf_counter()
+        with self.pool.connection() as connection:
+            # A retry may follow a COMMIT whose reply was lost, and a replay
+            # may follow a crash after COMMIT - skip refs already stored
+            maybe_stored = [entry[0] for entry in batch if check_all or entry[4]]
+            stored = find_queued(connection, maybe_stored)
+            todo = [(ref, order_time, priced) for ref, order_time, priced, _, _ in batch
+                    if ref not in stored]
+            if todo:
+                header_ids = insert_orders(connection, todo)
+                stored.update(zip((entry[0] for entry in todo), header_ids))
+        elapsed = time.perf_counter() - started
+        with self._stats_lock:
+            self._stats['batches'] += 1
+            self._stats['written'] += len(todo)
+            self._stats['already_stored'] += len(batch) - len(todo)
+            self._stats['commit_total'] += elapsed
+            self._stats['commit_max'] = max(self._stats['commit_max'], elapsed)
+        return stored
+
+    def stats(self):
+        """
+        Returns:
+            dict with submitted/replayed/written/already_stored/
+            dead_lettered/left_in_journal counts, batches, retries, average batch size, queue depth, journal
+            backlog and average/max batch commit time in ms
+        """
+        with self._stats_lock:
+            s = dict(self._stats)
+        batches = s['batches'] or 1
+        return {
+            'submitted': s['submitted'],
+            'replayed': s['replayed'],
+            'written': s['written'],
+            'already_stored': s['already_stored'],
+            'batches': s['batches'],
+            'retries': s['retries'],
+            'dead_lettered': s['dead_lettered'],
+            'left_in_journal': s['left_in_journal'],
+            'avg_batch': (s['written'] + s['already_stored']) / batches,
+            'queued': self._queue.qsize(),
+            'journal_pending': self.journal.pending,
+            'avg_commit_ms': s['commit_total'] / batches * 1000,
+            'max_commit_ms': s['commit_max'] * 1000,
+        }
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# LOAD TEST / REPLAY
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def outage_drill(outage_seconds, checkouts=20, max_attempts=3, retry_delay=0.05):
+    """
+    Take orders while the (fake) database is down for longer than the
+    retry budget of max_attempts tries, bring it back, and check that
+    every order is stored exactly once and nothing was dead-lettered
+
+    Returns:
+        bool: True if the drill passed
+    """
+    import tempfile
+
+    from db_pool import ConnectionPool
+    from fake_db import FakeDatabase
+    from menu_cache import MenuCache
+    from menu_catalog import MenuCatalog
+    from order_pricing import price_cart
+    from order_service import random_carts
+
+    fake = FakeDatabase().load_menu()
+    down = threading.Event()
+
+    def connect(**config):
+        if down.is_set():
+            raise ConnectionError("MySQL unreachable (simulated outage)")
+        return fake.connect(**config)
+
+    pool = ConnectionPool({}, size=2, connect=connect, max_idle=0)
+    cache = MenuCache(MenuCatalog(pool), ttl=None)
+    carts = [price_cart(cache, cart) for cart in
+             random_carts(list(cache.snapshot().keys()), checkouts)]
+    budget = sum(retry_delay * 2 ** attempt for attempt in range(max_attempts))
+    print(f"\nOutage drill: {checkouts} checkouts, MySQL down {outage_seconds:g}s "
+          f"(retry budget of {max_attempts} tries: {budget:.2f}s)")
+
+    journal = os.path.join(tempfile.mkdtemp(), 'orders.journal')
+    down.set()
+    with OrderQueue(pool, journal, fsync=False, retry_delay=retry_delay,
+                    max_attempts=max_attempts) as orders:
+        results = [orders.submit(priced)[1] for priced in carts]
+        time.sleep(outage_seconds)
+        waiting = sum(not result.done() for result in results)
+        down.clear()
+        header_ids = [result.result(timeout=MAX_RETRY_DELAY + 10) for result in results]
+    stats = orders.stats()
+    with pool.connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute("SELECT COUNT(*), COUNT(DISTINCT QueueRef) FROM order_headers")
+        rows, refs = cursor.fetchone()
+        cursor.close()
+    pool.close_all()
+
+    passed = (waiting == checkouts and len(set(header_ids)) == checkouts
+              and rows == refs == checkouts and stats['dead_lettered'] == 0
+              and not os.path.exists(journal + '.dead'))
+    print(f"{'✓' if passed else '❌'} {waiting} order(s) still pending when MySQL came back, "
+          f"{rows} stored ({refs} distinct refs), {stats['retries']} retries, "
+          f"{stats['dead_lettered']} dead-lettered")
+    return passed
+
+
+def main():
+    import argparse
+    import tempfile
+
+    from benchmark import summarize
+    from db_pool import ConnectionPool
+    from menu_cache import MenuCache
+    from menu_catalog import MenuCatalog
+    from order_pricing import price_cart
+    from order_service import random_carts
+    from order_store import ensure_order_schema, insert_order
+
+    parser = argparse.ArgumentParser(description="Write-behind order queue load test")
+    parser.add_argument('command', nargs='?', default='bench',
+                        choices=('bench', 'replay', 'outage'))
+    parser.add_argument('--mysql', action='store_true', help='use main.DB_CONFIG instead of the fake')
+    parser.add_argument('--journal', help='journal file (bench default: a temporary file)')
+    parser.add_argument('--checkouts', type=int, default=500, help='checkouts per run')
+    parser.add_argument('--latency-ms', type=float, default=2.0,
+                        help='fake per-statement latency in ms (default 2)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--outage-seconds', type=float, default=3.0,
+                        help='outage: how long MySQL stays unreachable (default 3)')
+    args = parser.parse_args()
+
+    if args.command == 'outage':
+        sys.exit(0 if outage_drill(args.outage_seconds, args.checkouts) else 1)
+
+    if args.mysql:
+        from main import DB_CONFIG
+        pool = ConnectionPool(DB_CONFIG, size=2)
+        target = f"MySQL {DB_CONFIG['host']}"
+    else:
+        from fake_db import FakeDatabase
+        fake = FakeDatabase(latency=args.latency_ms / 1000).load_menu()
+        pool = ConnectionPool({}, size=2, connect=fake.connect)
+        target = f"fake ({args.latency_ms} ms/statement)"
+    with pool.connection() as connection:
+        ensure_order_schema(connection)
+
+    if args.command == 'replay':
+        journal = args.journal or DEFAULT_JOURNAL
+        with OrderQueue(pool, journal) as orders:
+            replayed = orders.stats()['replayed']
+        stats = orders.stats()
+        print(f"✓ Replayed {replayed} order(s) from {journal}: {stats['written']} written, "
+              f"{stats['already_stored']} already stored")
+        if stats['dead_lettered']:
+            print(f"❌ {stats['dead_lettered']} order(s) failed again, see "
+                  f"{orders.journal.dead_letter_path}")
+        pool.close_all()
+        return
+
+    cache = MenuCache(MenuCatalog(pool), ttl=None)
+    carts = [price_cart(cache, cart) for cart in
+             random_carts(list(cache.snapshot().keys()), args.checkouts)]
+
+    print(f"\nCheckout latency: {args.checkouts} checkouts, target: {target}")
+    print("-" * 64)
+
+    samples = []
+    started = time.perf_counter()
+    for priced in carts:
+        t = time.perf_counter()
+        with pool.connection() as connection:
+            insert_order(connection, priced)
+        samples.append((time.perf_counter() - t) * 1000)
+    sync = summarize(samples)
+    sync_total = time.perf_counter() - started
+
+    journal = args.journal or os.path.join(tempfile.mkdtemp(), 'orders.journal')
+    samples = []
+    started = time.perf_counter()
+    with OrderQueue(pool, journal, batch_size=args.batch_size) as orders:
+        for priced in carts:
+            t = time.perf_counter()
+            orders.submit(priced)
+            samples.append((time.perf_counter() - t) * 1000)
+        accepted = time.perf_counter() - started
+        orders.flush()
+    queued = summarize(samples)
+    queued_total = time.perf_counter() - started
+    stats = orders.stats()
+
+    print(f"{'mode':<14}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}{'all stored s':>15}")
+    print(f"{'synchronous':<14}{sync['p50_ms']:>10.3f}{sync['p99_ms']:>10.3f}"
+          f"{sync['max_ms']:>10.3f}{sync_total:>15.2f}")
+    print(f"{'write-behind':<14}{queued['p50_ms']:>10.3f}{queued['p99_ms']:>10.3f}"
+          f"{queued['max_ms']:>10.3f}{queued_total:>15.2f}")
+    print(f"\n✓ All {args.checkouts} accepted in {accepted:.2f}s; {stats['batches']} batches "
+          f"(avg {stats['avg_batch']:.1f} orders, avg commit {stats['avg_commit_ms']:.1f} ms)")
+    pool.close_all()
+
+
+if __name__ == "__main__":
+    main()
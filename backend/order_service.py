@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Asyncio Order Service for Restaurant Management System
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Runs many checkouts at the same time, so one slow query no longer
+  holds up every other order the way the sequential demo flow does.
+
+DESIGN:
+  - mysql.connector is blocking, so each database job runs on a thread
+    pool (run_in_executor) sized to the connection pool
+  - Bounded concurrency: at most max_concurrency jobs touch the database
+    at once (asyncio.Semaphore); the rest wait on the event loop
+  - Backpressure: once max_pending jobs are in flight or waiting, new
+    calls fail fast with ServiceBusy instead of queueing without limit
+
+USAGE:
+  from order_service import AsyncOrderService
+
+  async with AsyncOrderService(pool, menu_cache, rules=get_pricing_rules()) as service:
+      header_id, priced = await service.place_order(cart)
+      rows = await service.view_orders(limit=10)
+
+  python3 order_service.py --checkouts 50          # load generator (fake)
+  python3 order_service.py --mysql --checkouts 50  # against main.DB_CONFIG
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from order_pricing import price_cart
+from order_store import fetch_recent_orders, insert_order
+
+DEFAULT_MAX_PENDING = 200
+
+
+class ServiceBusy(Exception):
+    """Raised when more than max_pending jobs are already queued"""
+
+
+class AsyncOrderService:
+    """
+    Coroutine API over the synchronous pricing / order-store functions
+
+    Args:
+        pool: db_pool.ConnectionPool
+        menu: MenuCache or MenuCatalog used for pricing
+        rules: pricing_rules.PricingRules applied to every checkout (tax
+               slabs, happy hours, combos; default: standard GST only)
+        max_concurrency: Database jobs running at once (default: pool size)
+        max_pending: Jobs allowed in flight + waiting before ServiceBusy
+    """
+
+    def __init__(self, pool, menu, rules=None, max_concurrency=None,
+                 max_pending=DEFAULT_MAX_PENDING):
+        self.pool = pool
+        self.menu = menu
+        self.rules = rules
+        self.max_concurrency = max_concurrency or pool.size
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                            thread_name_prefix='order-service')
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._pending = 0
+
+    async def _run(self, func, *args):
+        if self._pending >= self.max_pending:
+            raise ServiceBusy(f"{self._pending} order jobs pending")
+        self._pending += 1
+        try:
+            async with self._semaphore:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+
+    # ─── Blocking jobs (run on the executor) ─────────────────────────────
+
+    def _place_order_job(self, cart):
+        priced = price_cart(self.menu, cart, rules=self.rules)
+        with self.pool.connection() as connection:
+            return insert_order(connection, priced), priced
+
+    def _view_orders_job(self, limit):
+        with self.pool.connection() as connection:
+            return fetch_recent_orders(connection, limit)
+
+    # ─── Coroutines ──────────────────────────────────────────────────────
+
+    async def place_order(self, cart):
+        """
+        Price and store one checkout
+
+        Returns:
+            (HeaderID, PricedCart)
+
+        Raises:
+            ServiceBusy: If too many jobs are pending
+            ValueError: For an empty or invalid cart
+        """
+        return await self._run(self._place_order_job, list(cart))
+
+    async def view_orders(self, limit=10):
+        """
+        Returns:
+            list of recent order lines (see order_store.fetch_recent_orders)
+        """
+        return await self._run(self._view_orders_job, limit)
+
+    @property
+    def pending(self):
+        """Jobs currently running or waiting for a slot"""
+        return self._pending
+
+    def close(self):
+        """Wait for running jobs and stop the worker threads"""
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        # shutdown(wait=True) blocks, so wait for it off the event loop
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+        return False
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# LOAD GENERATOR
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def random_carts(menu_keys, count, max_lines=6, seed=7):
+    """`count` random carts of 1..max_lines distinct items"""
+    rng = random.Random(seed)
+    return [
+        [(category, sl, rng.randint(1, 3))
+         for category, sl in rng.sample(menu_keys, rng.randint(1, max_lines))]
+        for _ in range(count)
+    ]
+
+
+async def timed_checkout(service, cart):
+    started = time.perf_counter()
+    await service.place_order(cart)
+    return time.perf_counter() - started
+
+
+async def run_load(service, carts):
+    """
+    Place every cart sequentially, then all of them concurrently
+
+    Returns:
+        dict with sequential and concurrent wall times and the slowest
+        single checkout seen in the concurrent run
+    """
+    started = time.perf_counter()
+    for cart in carts:
+        await timed_checkout(service, cart)
+    sequential = time.perf_counter() - started
+
+    started = time.perf_counter()
+    latencies = await asyncio.gather(*(timed_checkout(service, cart) for cart in carts))
+    concurrent = time.perf_counter() - started
+    return {'sequential': sequential, 'concurrent': concurrent, 'slowest': max(latencies)}
+
+
+async def _main(args):
+    from db_pool import ConnectionPool
+    from main import get_pricing_rules
+    from menu_cache import MenuCache
+    from menu_catalog import MenuCatalog
+
+    if args.mysql:
+        from main import DB_CONFIG
+        pool = ConnectionPool(DB_CONFIG, size=args.concurrency)
+        target = f"MySQL {DB_CONFIG['host']}"
+    else:
+        from fake_db import FakeDatabase
+        fake = FakeDatabase(latency=args.latency_ms / 1000).load_menu()
+        pool = ConnectionPool({}, size=args.concurrency, connect=fake.connect)
+        target = f"fake ({args.latency_ms} ms/statement)"
+
+    menu = MenuCache(MenuCatalog(pool), ttl=None)
+    carts = random_carts(list(menu.snapshot().keys()), args.checkouts)
+
+    async with AsyncOrderService(pool, menu, rules=get_pricing_rules(),
+                                 max_concurrency=args.concurrency) as service:
+        result = await run_load(service, carts)
+    pool.close_all()
+
+    print(f"\n{args.checkouts} checkouts, concurrency {args.concurrency}, target: {target}")
+    print("-" * 60)
+    print(f"Sequential (sum):      {result['sequential'] * 1000:9.1f} ms")
+    print(f"Concurrent (gather):   {result['concurrent'] * 1000:9.1f} ms")
+    print(f"Slowest checkout:      {result['slowest'] * 1000:9.1f} ms")
+    print(f"Speedup:               {result['sequential'] / result['concurrent']:9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Concurrent checkout load generator")
+    parser.add_argument('--mysql', action='store_true', help='use main.DB_CONFIG instead of the fake')
+    parser.add_argument('--checkouts', type=int, default=50, help='number of checkouts (default 50)')
+    parser.add_argument('--concurrency', type=int, default=50,
+                        help='connection pool size / concurrent jobs (default 50)')
+    parser.add_argument('--latency-ms', type=float, default=5.0,
+                        help='fake per-statement latency in ms (default 5)')
+    asyncio.run(_main(parser.parse_args()))
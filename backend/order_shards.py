@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Sharded Multi-Branch Order Storage for Restaurant Management System
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Spreads the orders of many outlets over several MySQL instances
+  (shards), so order write throughput grows with the number of database
+  nodes instead of being capped by one server.
+
+ROUTING:
+  Every order carries the BranchID of the outlet that took it. Each
+  branch lives on exactly one shard: explicitly assigned branches first
+  (e.g. to give a busy outlet its own node), otherwise
+  BranchID % number of shards. A checkout is therefore always a
+  single-node transaction, and a branch's orders and running totals
+  (order_stats) stay together. The menu is not sharded.
+
+SCATTER-GATHER (the reads behind demo_view_orders):
+  fetch_page()     newest page of every shard, fetched in parallel and
+                   merged newest first. Every shard sorts its page by the
+                   merge key (OrderTime, then OrderID - OrderIDs alone are
+                   unrelated across shards), and the cursor holds that key
+                   per shard, so every page is a keyset scan of
+                   idx_orders_time on every node. With branch_id only that
+                   branch's shard is read.
+  totals()         order_stats of every shard, read in parallel and summed
+  branch_totals()  lines and revenue per branch, GROUP BY on every shard
+
+LOCAL TESTING:
+  Several local MySQL instances, e.g. with Docker:
+    docker run -d -p 3307:3306 -e MYSQL_ROOT_PASSWORD=pw -e MYSQL_DATABASE=menu mysql:8
+    docker run -d -p 3308:3306 -e MYSQL_ROOT_PASSWORD=pw -e MYSQL_DATABASE=menu mysql:8
+
+    python3 order_shards.py --shards 127.0.0.1:3307,127.0.0.1:3308 --password pw bench
+    python3 order_shards.py --fake 4 bench     # one in-process fake per shard
+
+USAGE:
+  from order_shards import ShardedOrderStore
+
+  store = ShardedOrderStore({'east': east_config, 'west': west_config},
+                            branches={7: 'west'})
+  store.ensure_schema()
+  shard, header_id = store.place_order(branch_id=3, priced=priced)
+  rows, cursor = store.fetch_page(page_size=10)   # [(shard, OrderID, ...), ...]
+  rows, cursor = store.fetch_page(cursor, page_size=10)
+  lines, orders, revenue = store.totals()
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from db_pool import ConnectionPool
+from order_history import DEFAULT_PAGE_SIZE, fetch_time_page
+from order_stats import read_totals
+from order_store import ensure_order_schema, insert_order
+
+DEFAULT_SHARD_POOL_SIZE = 5
+
+# Cursor entry for a shard with no older rows
+EXHAUSTED = 0
+
+
+class ShardError(Exception):
+    """A query on one shard failed; .shard names it"""
+
+    def __init__(self, shard, error):
+        super().__init__(f"shard {shard}: {error}")
+        self.shard = shard
+
+
+def format_cursor(cursor):
+    """Shard cursor as text for the command line, e.g. '2026-10-18T12:30:00/120,-,0'"""
+    return ",".join("-" if entry is None else str(entry) if entry == EXHAUSTED
+                    else f"{str(entry[0]).replace(' ', 'T')}/{entry[1]}" for entry in cursor)
+
+
+def _parse_entry(entry):
+    if entry == "-":
+        return None
+    if "/" not in entry:
+        return int(entry)
+    order_time, order_id = entry.rsplit("/", 1)
+    return order_time.replace('T', ' '), int(order_id)
+
+
+def parse_cursor(text):
+    return tuple(_parse_entry(entry) for entry in text.split(","))
+
+
+class ShardedOrderStore:
+    """
+    Order storage spread over several databases by branch
+
+    Args:
+        shards: {shard name: connection config}; the order of the names is
+                the order of the cursor entries and of BranchID % N
+        branches: {BranchID: shard name} for explicitly placed branches
+        pool_size: Connections per shard
+        connect: Connection factory for every shard (default mysql.connector),
+                 or a {shard name: factory} dict
+        metrics: QueryMetrics shared by all shard pools (None = off)
+
+    Raises:
+        ValueError: With no shards, or a branch assigned to an unknown shard
+    """
+
+    def __init__(self, shards, branches=None, pool_size=DEFAULT_SHARD_POOL_SIZE,
+                 connect=None, metrics=None):
+        if not shards:
+            raise ValueError("at least one shard is required")
+        self.names = list(shards)
+        self.branches = dict(branches or {})
+        unknown = set(self.branches.values()) - set(self.names)
+        if unknown:
+            raise ValueError(f"branches assigned to unknown shard(s): {sorted(unknown)}")
+        factories = connect if isinstance(connect, dict) else dict.fromkeys(self.names, connect)
+        self.pools = {name: ConnectionPool(shards[name], size=pool_size,
+                                           connect=factories[name], metrics=metrics)
+                      for name in self.names}
+        self._executor = ThreadPoolExecutor(max_workers=len(self.names),
+                                            thread_name_prefix='shard')
+
+    # ─── Routing ─────────────────────────────────────────────────────────
+
+    def shard_for(self, branch_id):
+        """Name of the shard holding a branch's orders"""
+        shard = self.branches.get(branch_id)
+        if shard is None:
+            shard = self.names[branch_id % len(self.names)]
+        return shard
+
+    def _scatter(self, job, shards=None):
+        """
+        Run job(shard name, connection) on every shard (or those named)
+        in parallel
+
+        Returns:
+            dict: {shard name: result}
+
+        Raises:
+            ShardError: For the first shard whose job failed
+        """
+        def run(name):
+            with self.pools[name].connection() as connection:
+                return job(name, connection)
+
+        names = self.names if shards is None else shards
+        futures = {name: self._executor.submit(run, name) for name in names}
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                raise ShardError(name, e) from e
+        return results
+
+    # ─── Writes ──────────────────────────────────────────────────────────
+
+    def ensure_schema(self):
+        """Create / upgrade the order tables on every shard"""
+        self._scatter(lambda name, connection: ensure_order_schema(connection))
+
+    def place_order(self, branch_id, priced):
+        """
+        Store one checkout on its branch's shard
+
+        Returns:
+            (shard name, HeaderID) - HeaderIDs are only unique per shard
+        """
+        shard = self.shard_for(branch_id)
+        with self.pools[shard].connection() as connection:
+            return shard, insert_order(connection, priced, branch_id=branch_id)
+
+    # ─── Scatter-gather reads ────────────────────────────────────────────
+
+    def fetch_page(self, cursor=None, page_size=DEFAULT_PAGE_SIZE, branch_id=None):
+        """
+        One page of order lines across all shards, newest first
+
+        Args:
+            cursor: Cursor from the previous page (None for the first page)
+            page_size: Rows per page
+            branch_id: Only this branch (reads its shard only)
+
+        Returns:
+            (rows, next_cursor) - rows are (shard name,) + PAGE_COLUMNS;
+            next_cursor is None when no shard has older rows
+        """
+        before = dict(zip(self.names, cursor)) if cursor else dict.fromkeys(self.names)
+        shards = [name for name in self.names if before[name] != EXHAUSTED]
+        if branch_id is not None:
+            shards = [name for name in shards if name == self.shard_for(branch_id)]
+        pages = self._scatter(
+            lambda name, connection: fetch_time_page(connection, before[name], page_size,
+                                                     branch_id),
+            shards)
+
+        # k-way merge of the per-shard pages, each sorted newest first by
+        # the same (OrderTime, OrderID) key; taking only heads keeps what
+        # is consumed from each shard a prefix
+        streams = [[(row[-1], row[0], name, row) for row in pages[name][0]] for name in shards]
+        merged = list(islice(heapq.merge(*streams, reverse=True), page_size))
+        taken = dict.fromkeys(shards, 0)
+        for _, _, name, _ in merged:
+            taken[name] += 1
+
+        next_cursor = {}
+        for name in self.names:
+            if name not in pages:
+                # not read: exhausted, or another branch's shard
+                next_cursor[name] = EXHAUSTED
+                continue
+            rows, more = pages[name]
+            if taken[name] < len(rows) or (taken[name] and more is not None):
+                last = rows[taken[name] - 1] if taken[name] else None
+                next_cursor[name] = (last[-1], last[0]) if last else before[name]
+            else:
+                next_cursor[name] = EXHAUSTED
+        rows = [(name,) + row for _, _, name, row in merged]
+        if all(entry == EXHAUSTED for entry in next_cursor.values()):
+            return rows, None
+        return rows, tuple(next_cursor[name] for name in self.names)
+
+    def totals(self):
+        """
+        Maintained totals summed over all shards
+
+        Returns:
+            (line_count, order_count, revenue)
+        """
+        per_shard = self._scatter(lambda name, connection: read_totals(connection))
+        return tuple(sum(totals[i] for totals in per_shard.values()) for i in range(3))
+
+    def branch_totals(self):
+        """
+        Returns:
+            dict: {BranchID: (line_count, revenue)} over all shards
+        """
+        def job(name, connection):
+            cursor = connection.cursor()
+            try:
+                cursor.execute("SELECT BranchID, COUNT(*), COALESCE(SUM(TotalPrice), 0) "
+                               "FROM orders GROUP BY BranchID")
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
+        result = {}
+        for rows in self._scatter(job).values():
+            for branch_id, line_count, revenue in rows:
+                lines, total = result.get(branch_id, (0, 0))
+                result[branch_id] = (lines + line_count, total + revenue)
+        return dict(sorted(result.items()))
+
+    def stats(self):
+        """Pool statistics per shard"""
+        return {name: pool.stats() for name, pool in self.pools.items()}
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        for pool in self.pools.values():
+            pool.close_all()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# LOAD TEST
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def main():
+    import argparse
+    import random
+    import time
+
+    from menu_cache import MenuCache
+    from menu_catalog import MenuCatalog
+    from order_pricing import price_cart
+    from order_service import random_carts
+
+    parser = argparse.ArgumentParser(description="Sharded order store load test")
+    parser.add_argument('command', nargs='?', default='bench', choices=('bench', 'history', 'stats'))
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--shards', help='comma-separated host:port list of MySQL shards '
+                                         '(user/database from main.DB_CONFIG)')
+    target.add_argument('--fake', type=int, default=2, metavar='N',
+                        help='N in-process fake shards (default 2)')
+    parser.add_argument('--password', help='MySQL password for the shards')
+    parser.add_argument('--orders', type=int, default=400, help='checkouts per bench run')
+    parser.add_argument('--branches', type=int, default=8, help='outlets to spread orders over')
+    parser.add_argument('--threads', type=int, default=8, help='concurrent checkout threads')
+    parser.add_argument('--pool-size', type=int, default=2,
+                        help='connections per shard - the write capacity of one node (default 2)')
+    parser.add_argument('--latency-ms', type=float, default=2.0,
+                        help='fake per-statement latency in ms (default 2)')
+    parser.add_argument('--page-size', type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument('--cursor', help='history: cursor printed by the previous page')
+    parser.add_argument('--branch', type=int, help='history: only this branch')
+    args = parser.parse_args()
+
+    if args.shards:
+        from main import DB_CONFIG
+        shards = {}
+        for address in args.shards.split(','):
+            host, _, port = address.partition(':')
+            config = dict(DB_CONFIG, host=host, port=int(port or 3306))
+            if args.password is not None:
+                config['password'] = args.password
+            shards[address] = config
+        connect = None
+        menu_config, menu_connect = DB_CONFIG, None
+        target = f"{len(shards)} MySQL shard(s)"
+    else:
+        from fake_db import FakeDatabase
+        fakes = [FakeDatabase(latency=args.latency_ms / 1000).load_menu() for _ in range(args.fake)]
+        shards = {f"shard{i}": {} for i in range(args.fake)}
+        connect = {name: fake.connect for name, fake in zip(shards, fakes)}
+        menu_config, menu_connect = {}, fakes[0].connect
+        target = f"{args.fake} fake shard(s), {args.latency_ms} ms/statement"
+
+    def open_store(names):
+        store = ShardedOrderStore({name: shards[name] for name in names},
+                                  pool_size=args.pool_size,
+                                  connect=connect if connect is None else
+                                  {name: connect[name] for name in names})
+        store.ensure_schema()
+        return store
+
+    store = open_store(shards)
+    try:
+        if args.command == 'history':
+            cursor = parse_cursor(args.cursor) if args.cursor else None
+            rows, cursor = store.fetch_page(cursor, args.page_size, branch_id=args.branch)
+            for shard, order_id, item_name, price, quantity, total, order_time in rows:
+                print(f"   {shard:<16}{order_id:>8}  {item_name:<28}{quantity:>4} x Rs.{price:<6}"
+                      f"Rs.{total:<8}{order_time}")
+            print(f"\n✓ {len(rows)} line(s); "
+                  + (f"next page: --cursor {format_cursor(cursor)}" if cursor else "no older orders"))
+            return
+
+        if args.command == 'stats':
+            lines, orders, revenue = store.totals()
+            print(f"✓ {orders} order(s), {lines} line(s), Rs.{revenue} over {len(shards)} shard(s)")
+            for branch_id, (branch_lines, branch_revenue) in store.branch_totals().items():
+                print(f"   branch {branch_id:<6} on {store.shard_for(branch_id):<16}"
+                      f"{branch_lines:>8} line(s)  Rs.{branch_revenue}")
+            return
+
+        menu_pool = ConnectionPool(menu_config, size=1, connect=menu_connect)
+        cache = MenuCache(MenuCatalog(menu_pool), ttl=None)
+        rng = random.Random(21)
+        checkouts = [(rng.randrange(1, args.branches + 1), price_cart(cache, cart))
+                     for cart in random_carts(list(cache.snapshot().keys()), args.orders)]
+        menu_pool.close_all()
+
+        print(f"\nCheckout throughput: {args.orders} checkouts from {args.branches} branches, "
+              f"{args.threads} threads, {args.pool_size} connection(s) per shard, target: {target}")
+        print("-" * 64)
+        print(f"{'shards':<14}{'seconds':>10}{'orders/s':>12}")
+        runs = [list(shards)[:1]] + ([list(shards)] if len(shards) > 1 else [])
+        rates = []
+        for names in runs:
+            run_store = store if len(names) == len(shards) else open_store(names)
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.threads) as writers:
+                list(writers.map(lambda checkout: run_store.place_order(*checkout), checkouts))
+            seconds = time.perf_counter() - started
+            rates.append(args.orders / seconds)
+            print(f"{len(names):<14}{seconds:>10.2f}{rates[-1]:>12,.0f}")
+            if run_store is not store:
+                run_store.close()
+
+        lines, orders, revenue = store.totals()
+        page_rows, cursor, pages = 0, None, 0
+        while True:
+            rows, cursor = store.fetch_page(cursor, page_size=100)
+            page_rows += len(rows)
+            pages += 1
+            if cursor is None:
+                break
+        print(f"\n✓ {orders} order(s), {lines} line(s), Rs.{revenue} stored; history paged "
+              f"{page_rows} line(s) in {pages} scatter-gather page(s)")
+        if len(rates) > 1:
+            print(f"✓ {len(shards)} shards: {rates[1] / rates[0]:.2f}x the write throughput of one")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
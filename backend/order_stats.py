@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Running Order Statistics for Restaurant Management System
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Keeps order totals in a small summary table that is updated in the
+  same transaction as every order insert, so "total orders" and "total
+  revenue" are a constant-time read instead of COUNT(*) / SUM() scans
+  over the whole order history.
+
+SCHEMA:
+  order_stats (STATS_SLOTS rows)
+    - Slot INT PRIMARY KEY
+    - LineCount BIGINT     order lines (rows in orders)
+    - OrderCount BIGINT    checkouts (rows in order_headers)
+    - Revenue DECIMAL(14,2) sum of orders.TotalPrice
+
+  Each checkout adds to one slot (HeaderID % STATS_SLOTS) and readers sum
+  all slots. Spreading the counters over several rows keeps concurrent
+  checkouts from queueing on a single hot row lock.
+
+RECONCILE:
+  Orders written outside insert_order() (e.g. the Express API) are not
+  counted. Reconcile recomputes the totals from the raw tables:
+
+    python3 order_stats.py reconcile
+
+USAGE:
+  from order_stats import read_totals
+  line_count, order_count, revenue = read_totals(connection)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+import sys
+
+STATS_SLOTS = 8
+
+CREATE_ORDER_STATS_TABLE = """
+CREATE TABLE IF NOT EXISTS order_stats (
+    Slot INT PRIMARY KEY,
+    LineCount BIGINT NOT NULL DEFAULT 0,
+    OrderCount BIGINT NOT NULL DEFAULT 0,
+    Revenue DECIMAL(14,2) NOT NULL DEFAULT 0
+)
+"""
+
+
+def ensure_stats_schema(connection):
+    """
+    Create order_stats; a newly created table is reconciled immediately
+
+    Returns:
+        bool: True if the table was created (and filled from history)
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute(CREATE_ORDER_STATS_TABLE)
+        cursor.execute("SELECT COUNT(*) FROM order_stats")
+        if cursor.fetchone()[0] == STATS_SLOTS:
+            connection.commit()
+            return False
+    finally:
+        cursor.close()
+    reconcile(connection)
+    return True
+
+
+def record_order(cursor, header_id, line_count, revenue):
+    """
+    Add one checkout to the running totals
+
+    Must run on the cursor of the transaction that inserts the order, so
+    the totals commit or roll back together with it.
+    """
+    cursor.execute(
+        "UPDATE order_stats SET LineCount = LineCount + %s, "
+        "OrderCount = OrderCount + 1, Revenue = Revenue + %s WHERE Slot = %s",
+        (line_count, revenue, header_id % STATS_SLOTS))
+
+
+def record_orders(cursor, checkouts):
+    """
+    Add a batch of checkouts to the running totals, one UPDATE per slot
+
+    Args:
+        checkouts: Iterable of (header_id, line_count, revenue)
+    """
+    slots = {}
+    for header_id, line_count, revenue in checkouts:
+        delta = slots.setdefault(header_id % STATS_SLOTS, [0, 0, 0])
+        delta[0] += line_count
+        delta[1] += 1
+        delta[2] += revenue
+    for slot, (line_count, order_count, revenue) in sorted(slots.items()):
+        cursor.execute(
+            "UPDATE order_stats SET LineCount = LineCount + %s, "
+            "OrderCount = OrderCount + %s, Revenue = Revenue + %s WHERE Slot = %s",
+            (line_count, order_count, revenue, slot))
+
+
+def read_totals(connection):
+    """
+    Current totals from the summary table (reads STATS_SLOTS rows)
+
+    Returns:
+        (line_count, order_count, revenue)
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            "SELECT COALESCE(SUM(LineCount), 0), COALESCE(SUM(OrderCount), 0), "
+            "COALESCE(SUM(Revenue), 0) FROM order_stats")
+        return tuple(cursor.fetchone())
+    finally:
+        cursor.close()
+
+
+def reconcile(connection):
+    """
+    Recompute the totals from orders / order_headers
+
+    The slot rows are locked first (SELECT ... FOR UPDATE), so checkouts
+    committing during the recount wait for it rather than being lost.
+
+    Returns:
+        (line_count, order_count, revenue) after reconciling
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute(CREATE_ORDER_STATS_TABLE)
+        cursor.executemany(
+            "INSERT IGNORE INTO order_stats (Slot) VALUES (%s)",
+            [(slot,) for slot in range(STATS_SLOTS)])
+        cursor.execute("SELECT Slot FROM order_stats FOR UPDATE")
+        cursor.fetchall()
+
+        cursor.execute("SELECT COUNT(*), COALESCE(SUM(TotalPrice), 0) FROM orders")
+        line_count, revenue = cursor.fetchone()
+        cursor.execute("SELECT COUNT(*) FROM order_headers")
+        order_count = cursor.fetchone()[0]
+
+        cursor.execute("UPDATE order_stats SET LineCount = 0, OrderCount = 0, Revenue = 0")
+        cursor.execute(
+            "UPDATE order_stats SET LineCount = %s, OrderCount = %s, Revenue = %s "
+            "WHERE Slot = 0", (line_count, order_count, revenue))
+        connection.commit()
+        return line_count, order_count, revenue
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+if __name__ == "__main__":
+    """
+    Command Line
+
+    Usage:
+      python3 order_stats.py reconcile   # recompute totals from history
+      python3 order_stats.py show        # print the maintained totals
+    """
+    from main import connect_to_database
+
+    command = sys.argv[1] if len(sys.argv) > 1 else "show"
+    if command not in ("reconcile", "show"):
+        print(f"Unknown command: {command} (use 'reconcile' or 'show')")
+        sys.exit(1)
+
+    connection = connect_to_database()
+    if not connection:
+        sys.exit(1)
+    try:
+        ensure_stats_schema(connection)
+        if command == "reconcile":
+            before = read_totals(connection)
+            after = reconcile(connection)
+            print(f"Before: {before[0]} lines, {before[1]} orders, Rs. {before[2]}")
+            print(f"After:  {after[0]} lines, {after[1]} orders, Rs. {after[2]}")
+        else:
+            lines, orders, revenue = read_totals(connection)
+            print(f"{lines} lines, {orders} orders, Rs. {revenue}")
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    finally:
+        connection.close()
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Order Storage for Restaurant Management System
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Writes one checkout as one order header plus all of its lines, in a
+  single transaction, with the lines sent as one batched INSERT.
+
+SCHEMA:
+  order_headers (one row per checkout)
+    - HeaderID INT AUTO_INCREMENT PRIMARY KEY
+    - LineCount INT
+    - Subtotal, CGST, SGST, GrandTotal DECIMAL(10,2)
+    - OrderTime TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    - QueueRef VARCHAR(40) NULL UNIQUE - set for checkouts written by the
+      order queue (order_queue.py), makes journal replay idempotent
+    - BranchID INT DEFAULT 1 - outlet that took the order (order_shards.py)
+
+  orders (one row per cart line - unchanged for the Express API)
+    - OrderID INT AUTO_INCREMENT PRIMARY KEY
+    - HeaderID INT NULL -> order_headers.HeaderID (NULL for rows written
+      by older clients), indexed
+    - Category VARCHAR(32) NULL - menu category of the item (for rollups)
+    - ItemName, Quantity, OrderTime
+    - Price, TotalPrice DECIMAL(10,2) - rule-priced lines (order_pricing.py)
+      carry fractional amounts; older INT columns are widened on startup
+    - BranchID INT DEFAULT 1, indexed with OrderID for per-branch history
+    - CreatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP - insert time, always
+      set by the server (OrderTime is the business time, which queued and
+      offline orders carry over from when they were taken); settle bounds
+      of sales_rollup.py and order_export.py use it
+    - idx_orders_time (OrderTime, OrderID) for newest-first history merged
+      across shards (order_shards.py)
+
+WRITE PATH:
+  insert_order() inserts the header, then every line with one
+  cursor.executemany() (which mysql.connector rewrites into a single
+  multi-row INSERT), adds the checkout to the running totals in
+  order_stats (see order_stats.py), then commits once. Any failure rolls
+  back the whole checkout, so there are never lines without a header.
+
+  insert_orders() does the same for a batch of checkouts in one
+  transaction (used by the write-behind queue in order_queue.py).
+
+USAGE:
+  from order_store import ensure_order_schema, insert_order
+
+  ensure_order_schema(connection)              # once, upgrades old tables
+  header_id = insert_order(connection, priced) # priced = price_cart(...)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+from order_history import fetch_page
+from order_stats import ensure_stats_schema, record_order, record_orders
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# SCHEMA
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+CREATE_ORDER_HEADERS_TABLE = """
+CREATE TABLE IF NOT EXISTS order_headers (
+    HeaderID INT AUTO_INCREMENT PRIMARY KEY,
+    LineCount INT NOT NULL,
+    Subtotal DECIMAL(10,2) NOT NULL,
+    CGST DECIMAL(10,2) NOT NULL,
+    SGST DECIMAL(10,2) NOT NULL,
+    GrandTotal DECIMAL(10,2) NOT NULL,
+    OrderTime TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    QueueRef VARCHAR(40) NULL,
+    BranchID INT NOT NULL DEFAULT 1,
+    UNIQUE KEY uq_order_headers_queue_ref (QueueRef)
+)
+"""
+
+CREATE_ORDERS_TABLE = """
+CREATE TABLE IF NOT EXISTS orders (
+    OrderID INT AUTO_INCREMENT PRIMARY KEY,
+    HeaderID INT NULL,
+    Category VARCHAR(32) NULL,
+    ItemName VARCHAR(255) NOT NULL,
+    Price DECIMAL(10,2) NOT NULL,
+    Quantity INT NOT NULL,
+    TotalPrice DECIMAL(10,2) NOT NULL,
+    OrderTime TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    BranchID INT NOT NULL DEFAULT 1,
+    CreatedAt TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_orders_header (HeaderID),
+    INDEX idx_orders_branch (BranchID, OrderID),
+    INDEX idx_orders_time (OrderTime, OrderID)
+)
+"""
+
+INSERT_HEADER = (
+    "INSERT INTO order_headers (LineCount, Subtotal, CGST, SGST, GrandTotal) "
+    "VALUES (%s, %s, %s, %s, %s)"
+)
+
+INSERT_LINE = (
+    "INSERT INTO orders (HeaderID, Category, ItemName, Price, Quantity, TotalPrice) "
+    "VALUES (%s, %s, %s, %s, %s, %s)"
+)
+
+# Queued checkouts keep the time they were taken, not the time they are written
+INSERT_QUEUED_HEADER = (
+    "INSERT INTO order_headers (LineCount, Subtotal, CGST, SGST, GrandTotal, OrderTime, "
+    "QueueRef) VALUES (%s, %s, %s, %s, %s, %s, %s)"
+)
+
+INSERT_TIMED_LINE = (
+    "INSERT INTO orders (HeaderID, Category, ItemName, Price, Quantity, TotalPrice, "
+    "OrderTime) VALUES (%s, %s, %s, %s, %s, %s, %s)"
+)
+
+# Orders of a specific outlet (sharded multi-branch storage)
+INSERT_BRANCH_HEADER = (
+    "INSERT INTO order_headers (LineCount, Subtotal, CGST, SGST, GrandTotal, BranchID) "
+    "VALUES (%s, %s, %s, %s, %s, %s)"
+)
+
+INSERT_BRANCH_LINE = (
+    "INSERT INTO orders (HeaderID, Category, ItemName, Price, Quantity, TotalPrice, "
+    "BranchID) VALUES (%s, %s, %s, %s, %s, %s, %s)"
+)
+
+
+def table_columns(cursor, table):
+    """Column names of a table, read from an empty result set"""
+    cursor.execute(f"SELECT * FROM {table} LIMIT 0")
+    cursor.fetchall()
+    return [column[0] for column in cursor.description]
+
+
+def column_types(cursor, table):
+    """
+    Declared data type of every column of a table
+
+    Returns:
+        {column name: lower-case type, e.g. 'int', 'decimal'}
+    """
+    cursor.execute("SELECT COLUMN_NAME, DATA_TYPE FROM information_schema.COLUMNS "
+                   "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s", (table,))
+    return {name: data_type.lower() for name, data_type in cursor.fetchall()}
+
+
+def index_names(cursor, table):
+    """Names of the indexes on a table"""
+    cursor.execute("SELECT INDEX_NAME FROM information_schema.STATISTICS "
+                   "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s", (table,))
+    return {row[0] for row in cursor.fetchall()}
+
+
+def ensure_order_schema(connection):
+    """
+    Create order_headers/orders/order_stats, adding HeaderID, Category and
+    BranchID to an older orders table (and widening its INT Price and
+    TotalPrice to DECIMAL(10,2), indexing OrderTime, adding CreatedAt), and QueueRef and BranchID to an older
+    order_headers table
+
+    Returns:
+        bool: True if the orders table had to be upgraded
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute(CREATE_ORDER_HEADERS_TABLE)
+        cursor.execute(CREATE_ORDERS_TABLE)
+        upgraded = False
+        columns = table_columns(cursor, 'orders')
+        if 'HeaderID' not in columns:
+            cursor.execute("ALTER TABLE orders ADD COLUMN HeaderID INT NULL")
+            cursor.execute("CREATE INDEX idx_orders_header ON orders (HeaderID)")
+            upgraded = True
+        if 'Category' not in columns:
+            cursor.execute("ALTER TABLE orders ADD COLUMN Category VARCHAR(32) NULL")
+            upgraded = True
+        if 'BranchID' not in columns:
+            cursor.execute("ALTER TABLE orders ADD COLUMN BranchID INT NOT NULL DEFAULT 1")
+            cursor.execute("CREATE INDEX idx_orders_branch ON orders (BranchID, OrderID)")
+            upgraded = True
+        types = column_types(cursor, 'orders')
+        if not types.get('Price', 'decimal').startswith('decimal') or \
+                not types.get('TotalPrice', 'decimal').startswith('decimal'):
+            cursor.execute("ALTER TABLE orders MODIFY COLUMN Price DECIMAL(10,2) NOT NULL, "
+                           "MODIFY COLUMN TotalPrice DECIMAL(10,2) NOT NULL")
+            upgraded = True
+        if 'CreatedAt' not in columns:
+            # Existing rows get the current time: they are settled anyway
+            cursor.execute("ALTER TABLE orders ADD COLUMN CreatedAt TIMESTAMP NOT NULL "
+                           "DEFAULT CURRENT_TIMESTAMP")
+            upgraded = True
+        if 'idx_orders_time' not in index_names(cursor, 'orders'):
+            cursor.execute("CREATE INDEX idx_orders_time ON orders (OrderTime, OrderID)")
+            upgraded = True
+        header_columns = table_columns(cursor, 'order_headers')
+        if 'QueueRef' not in header_columns:
+            cursor.execute("ALTER TABLE order_headers ADD COLUMN QueueRef VARCHAR(40) NULL")
+            cursor.execute("CREATE UNIQUE INDEX uq_order_headers_queue_ref "
+                           "ON order_headers (QueueRef)")
+            upgraded = True
+        if 'BranchID' not in header_columns:
+            cursor.execute("ALTER TABLE order_headers ADD COLUMN BranchID INT NOT NULL DEFAULT 1")
+            upgraded = True
+        connection.commit()
+    finally:
+        cursor.close()
+    ensure_stats_schema(connection)
+    return upgraded
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# WRITE PATH
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def insert_order(connection, priced, branch_id=None):
+    """
+    Store one checkout: header row + all lines in one transaction
+
+    Args:
+        connection: Open database connection (committed on success)
+        priced: order_pricing.PricedCart
+        branch_id: Outlet to record on the header and lines (None = the
+                   column default)
+
+    Returns:
+        int: HeaderID of the new order
+
+    Raises:
+        ValueError: If the cart has no priced lines
+        Exception: Database errors, after rolling the transaction back
+    """
+    if not priced.lines:
+        raise ValueError("Cannot place an order without items")
+
+    header = (len(priced.lines), priced.subtotal, priced.cgst, priced.sgst, priced.grand_total)
+    cursor = connection.cursor()
+    try:
+        if branch_id is None:
+            cursor.execute(INSERT_HEADER, header)
+        else:
+            cursor.execute(INSERT_BRANCH_HEADER, header + (branch_id,))
+        header_id = cursor.lastrowid
+        lines = [(header_id, line.category, line.item_name, line.price, line.quantity, line.total)
+                 for line in priced.lines]
+        if branch_id is None:
+            cursor.executemany(INSERT_LINE, lines)
+        else:
+            cursor.executemany(INSERT_BRANCH_LINE, [line + (branch_id,) for line in lines])
+        record_order(cursor, header_id, len(priced.lines), priced.subtotal)
+        connection.commit()
+        return header_id
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def insert_orders(connection, checkouts):
+    """
+    Store a batch of checkouts in one transaction
+
+    Args:
+        connection: Open database connection (committed on success)
+        checkouts: List of (queue_ref, order_time, PricedCart); every cart
+                   must have priced lines
+
+    Returns:
+        list of HeaderIDs, in the order of `checkouts`
+
+    Raises:
+        Exception: Database errors, after rolling the whole batch back
+    """
+    cursor = connection.cursor()
+    try:
+        header_ids = []
+        lines = []
+        for queue_ref, order_time, priced in checkouts:
+            cursor.execute(INSERT_QUEUED_HEADER, (
+                len(priced.lines), priced.subtotal, priced.cgst, priced.sgst,
+                priced.grand_total, order_time, queue_ref))
+            header_id = cursor.lastrowid
+            header_ids.append(header_id)
+            lines.extend((header_id, line.category, line.item_name, line.price,
+                          line.quantity, line.total, order_time) for line in priced.lines)
+        # Every line of the batch in one multi-row INSERT
+        cursor.executemany(INSERT_TIMED_LINE, lines)
+        record_orders(cursor, [(header_id, len(priced.lines), priced.subtotal)
+                               for header_id, (_, _, priced) in zip(header_ids, checkouts)])
+        connection.commit()
+        return header_ids
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def find_queued(connection, queue_refs):
+    """
+    Checkouts already stored for some queue references
+
+    Returns:
+        dict: {QueueRef: HeaderID}
+    """
+    if not queue_refs:
+        return {}
+    cursor = connection.cursor()
+    try:
+        placeholders = ", ".join(["%s"] * len(queue_refs))
+        cursor.execute(f"SELECT QueueRef, HeaderID FROM order_headers "
+                       f"WHERE QueueRef IN ({placeholders})", tuple(queue_refs))
+        return dict(cursor.fetchall())
+    finally:
+        cursor.close()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# READ PATH
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def fetch_recent_orders(connection, limit=10):
+    """
+    Most recent order lines, newest first (first page of order_history)
+
+    Returns:
+        list of (OrderID, ItemName, Price, Quantity, TotalPrice, OrderTime)
+    """
+    return fetch_page(connection, page_size=limit)[0]
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Pricing Rules for Restaurant Management System
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Tax slabs, happy-hour discounts and combo prices, loaded once and
+  compiled into a lookup table so pricing a cart costs one or two dict
+  lookups per line - rule definitions are never re-read per order.
+
+RULES (a dict, or a JSON file - see pricing_rules.example.json):
+  tax          default slab plus per-category slabs, as percentages
+                 {"default": {"cgst": "2.5", "sgst": "2.5"},
+                  "categories": {"icecreams": {"cgst": "9", "sgst": "9"}}}
+  happy_hours  percentage off the unit price during a daily window
+                 {"name": "Evening drinks", "categories": ["beverages"],
+                  "days": ["mon", "tue"], "start": "16:00", "end": "19:00",
+                  "discount": "20"}
+  combos       fixed unit price for add-ons bought with a trigger item,
+               one add-on unit per trigger unit
+                 {"name": "Meal + drink", "with": ["mealcombo"],
+                  "categories": ["beverages"], "price": 20}
+  Targets are whole categories ("categories": [...]) and/or single items
+  ("items": [["starters", 3], ...]); combo triggers likewise use "with"
+  and/or "with_items".
+
+COMPILED TABLE:
+  Every category or item named by any rule gets one LineRule (tax slab,
+  happy-hour windows, combo it is an add-on for, combos it triggers);
+  item entries already include their category's rules. Everything else
+  shares the default LineRule. Overlapping happy hours do not stack - the
+  largest discount applies.
+
+USAGE:
+  from pricing_rules import PricingRules
+
+  rules = PricingRules.load('pricing_rules.json')   # or PricingRules(dict)
+  priced = price_cart(menu_cache, cart, rules=rules)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+import json
+from collections import namedtuple
+from decimal import Decimal, InvalidOperation
+
+from billing import to_paise
+
+DEFAULT_RULES = {
+    'tax': {'default': {'cgst': '2.5', 'sgst': '2.5'}},
+}
+
+DAYS = ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun')
+
+# Compiled rules for one category or item
+LineRule = namedtuple('LineRule', 'slab happy_hours combo triggers')
+
+# A daily discount window; days is a set of weekday numbers (Monday = 0)
+HappyHour = namedtuple('HappyHour', 'name days start end discount_bp')
+
+# Add-on unit price (paise) while trigger units are available
+Combo = namedtuple('Combo', 'name price')
+
+
+def percent_to_bp(value, rule):
+    """'2.5' -> 250 basis points"""
+    try:
+        bp = Decimal(str(value)) * 100
+    except InvalidOperation:
+        raise ValueError(f"{rule}: not a percentage: {value!r}")
+    if bp != bp.to_integral_value() or not 0 <= bp <= 10000:
+        raise ValueError(f"{rule}: percentage must be 0-100 in steps of 0.01: {value!r}")
+    return int(bp)
+
+
+def parse_minute(value, rule):
+    """'16:30' -> minutes since midnight"""
+    try:
+        hours, minutes = (int(part) for part in value.split(':'))
+    except (AttributeError, ValueError):
+        raise ValueError(f"{rule}: time must be HH:MM: {value!r}")
+    if not (0 <= hours <= 24 and 0 <= minutes < 60):
+        raise ValueError(f"{rule}: time must be HH:MM: {value!r}")
+    return hours * 60 + minutes
+
+
+def _targets(definition, rule, field_categories='categories', field_items='items'):
+    """Category names and (category, SL) keys a rule applies to"""
+    categories = list(definition.get(field_categories, ()))
+    items = [(category, int(sl)) for category, sl in definition.get(field_items, ())]
+    if not categories and not items:
+        raise ValueError(f"{rule}: names no categories or items")
+    return categories, items
+
+
+class PricingRules:
+    """
+    Compiled pricing rules
+
+    Args:
+        definitions: Rule dict (see module docstring); None for the
+                     standard CGST 2.5% + SGST 2.5% and no discounts
+
+    Raises:
+        ValueError: For a malformed or conflicting rule
+    """
+
+    def __init__(self, definitions=None):
+        definitions = DEFAULT_RULES if definitions is None else definitions
+        self.slabs = []                 # [(cgst_bp, sgst_bp)] indexed by LineRule.slab
+        self.combos = []                # [Combo] indexed by LineRule.combo / triggers
+        self.happy_hours = []
+        slab_ids = {}
+
+        def slab(definition, rule):
+            key = (percent_to_bp(definition.get('cgst', 0), rule),
+                   percent_to_bp(definition.get('sgst', 0), rule))
+            if key not in slab_ids:
+                slab_ids[key] = len(self.slabs)
+                self.slabs.append(key)
+            return slab_ids[key]
+
+        tax = definitions.get('tax', {})
+        default_slab = slab(tax.get('default', DEFAULT_RULES['tax']['default']), 'tax default')
+        self._default = LineRule(default_slab, (), None, ())
+
+        # Gather rule parts per target, then freeze them into LineRules
+        parts = {}
+
+        def part(target):
+            if target not in parts:
+                parts[target] = {'slab': None, 'happy_hours': [], 'combo': None, 'triggers': []}
+            return parts[target]
+
+        for category, definition in tax.get('categories', {}).items():
+            part(category)['slab'] = slab(definition, f"tax {category}")
+
+        for definition in definitions.get('happy_hours', ()):
+            name = definition.get('name', 'happy hour')
+            days = definition.get('days', DAYS)
+            unknown = [day for day in days if day not in DAYS]
+            if unknown:
+                raise ValueError(f"{name}: unknown day(s) {unknown}")
+            window = HappyHour(name, frozenset(DAYS.index(day) for day in days),
+                               parse_minute(definition['start'], name),
+                               parse_minute(definition['end'], name),
+                               percent_to_bp(definition['discount'], name))
+            self.happy_hours.append(window)
+            categories, items = _targets(definition, name)
+            for target in categories + items:
+                part(target)['happy_hours'].append(window)
+
+        for definition in definitions.get('combos', ()):
+            name = definition.get('name', 'combo')
+            combo_id = len(self.combos)
+            self.combos.append(Combo(name, to_paise(Decimal(str(definition['price'])))))
+            categories, items = _targets(definition, name)
+            for target in categories + items:
+                if part(target)['combo'] is not None:
+                    raise ValueError(f"{name}: {target} is already an add-on of "
+                                     f"{self.combos[part(target)['combo']].name}")
+                part(target)['combo'] = combo_id
+            triggers, trigger_items = _targets(definition, f"{name} (with)", 'with', 'with_items')
+            for target in triggers + trigger_items:
+                part(target)['triggers'].append(combo_id)
+
+        self._categories = {}
+        for target, p in parts.items():
+            if isinstance(target, str):
+                self._categories[target] = LineRule(
+                    default_slab if p['slab'] is None else p['slab'],
+                    tuple(p['happy_hours']), p['combo'], tuple(p['triggers']))
+        self._items = {}
+        for target, p in parts.items():
+            if not isinstance(target, str):
+                base = self._categories.get(target[0], self._default)
+                self._items[target] = LineRule(
+                    base.slab, base.happy_hours + tuple(p['happy_hours']),
+                    base.combo if p['combo'] is None else p['combo'],
+                    base.triggers + tuple(p['triggers']))
+
+    @classmethod
+    def load(cls, path):
+        """Compile the rules in a JSON file"""
+        with open(path, encoding='utf-8') as handle:
+            return cls(json.load(handle))
+
+    def rule_for(self, category, sl):
+        """LineRule for one menu item"""
+        if self._items:
+            rule = self._items.get((category, sl))
+            if rule is not None:
+                return rule
+        return self._categories.get(category, self._default)
+
+    def discount_bp(self, rule, moment):
+        """
+        Happy-hour discount for a line
+
+        Args:
+            rule: LineRule
+            moment: (weekday, minute of day) of the order
+        """
+        weekday, minute = moment
+        best = 0
+        for window in rule.happy_hours:
+            if window.start <= window.end:
+                active = window.start <= minute < window.end and weekday in window.days
+            else:       # window crosses midnight - the day is the day it started
+                active = ((minute >= window.start and weekday in window.days) or
+                          (minute < window.end and (weekday - 1) % 7 in window.days))
+            if active and window.discount_bp > best:
+                best = window.discount_bp
+        return best
+
+    def __repr__(self):
+        return (f"PricingRules({len(self.slabs)} tax slab(s), {len(self.happy_hours)} "
+                f"happy hour(s), {len(self.combos)} combo(s), "
+                f"{len(self._categories) + len(self._items)} table entries)")
+
+
+STANDARD_RULES = PricingRules()
+
+
+if __name__ == "__main__":
+    """
+    Command Line
+
+    Usage:
+      python3 pricing_rules.py <rules.json>
+
+    Compiles a rules file and prints the resulting table.
+    """
+    import sys
+
+    if len(sys.argv) != 2:
+        print("Usage: python3 pricing_rules.py <rules.json>")
+        sys.exit(1)
+    try:
+        rules = PricingRules.load(sys.argv[1])
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Invalid rules: {e}")
+        sys.exit(1)
+    print(f"✓ {rules}")
+    for cgst, sgst in rules.slabs:
+        print(f"   slab: CGST {cgst / 100}% + SGST {sgst / 100}%")
+    for window in rules.happy_hours:
+        print(f"   happy hour: {window.name}, {window.discount_bp / 100}% off")
+    for combo in rules.combos:
+        print(f"   combo: {combo.name}, add-on at Rs.{combo.price / 100:.2f}")
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Query Instrumentation for Restaurant Management System
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Times every statement run through a pooled connection, so the menu,
+  order and stats queries that dominate under load can be found without
+  guessing.
+
+FUNCTIONALITY:
+  1. Per-statement latency histograms, keyed by normalized SQL
+     (literals -> ?, IN / VALUES lists collapsed, whitespace squeezed)
+  2. Row counts - rows affected by writes, rows fetched by reads
+  3. Error counts per statement (the exception is re-raised unchanged)
+  4. Slow-query log - statements slower than slow_ms are logged to the
+     'restaurant.slow_query' logger with their normalized SQL
+  5. Prometheus text export (to_prometheus(), or serve_metrics(port))
+
+USAGE:
+  from query_metrics import QueryMetrics
+
+  metrics = QueryMetrics(slow_ms=100)
+  pool = get_pool(DB_CONFIG, metrics=metrics)    # cursors are instrumented
+  ...
+  for row in metrics.top(5): print(row)
+  print(metrics.to_prometheus())
+
+  Any cursor can also be wrapped by hand:
+  cursor = InstrumentedCursor(connection.cursor(), metrics)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+
+DEFAULT_SLOW_MS = 100.0
+
+# Histogram bucket upper bounds in seconds (Prometheus 'le' labels)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5)
+
+slow_query_log = logging.getLogger('restaurant.slow_query')
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# SQL NORMALIZATION
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_STRING = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|%\(\w+\)s")
+_TUPLE = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_TUPLE_LIST = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+_SPACE = re.compile(r"\s+")
+
+_normalized = {}
+
+
+def normalize_sql(sql):
+    """
+    Statement fingerprint used as the metrics key
+
+    "SELECT ... WHERE SL IN (%s, %s, %s)" and "... IN (4, 7)" both become
+    "SELECT ... WHERE SL IN (?)", so one histogram covers every variant.
+    """
+    cached = _normalized.get(sql)
+    if cached is not None:
+        return cached
+    text = _STRING.sub('?', sql)
+    text = _PLACEHOLDER.sub('?', text)
+    text = _NUMBER.sub('?', text)
+    text = _TUPLE.sub('(?)', text)
+    text = _TUPLE_LIST.sub('(?)', text)
+    text = _TUPLE.sub('(?)', text)      # row-value lists: ((?), (?)) -> (?)
+    text = _SPACE.sub(' ', text).strip()
+    if len(_normalized) < 10000:
+        _normalized[sql] = text
+    return text
+
+
+def statement_type(normalized):
+    """First keyword of a statement: SELECT, INSERT, UPDATE, ..."""
+    return normalized.split(' ', 1)[0].upper() if normalized else ''
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# METRICS REGISTRY
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class StatementStats:
+    """Latency histogram and counters for one normalized statement"""
+
+    __slots__ = ('sql', 'buckets', 'count', 'total', 'max', 'rows', 'errors', 'slow')
+
+    def __init__(self, sql):
+        self.sql = sql
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)     # last = +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.errors = 0
+        self.slow = 0
+
+    def observe(self, seconds):
+        self.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, fraction):
+        """Approximate quantile in seconds (upper bound of its bucket)"""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.buckets):
+            seen += count
+            if seen >= target:
+                return min(bound, self.max)
+        return self.max
+
+
+class QueryMetrics:
+    """
+    Thread-safe registry of per-statement query metrics
+
+    Args:
+        slow_ms: Log statements slower than this (None disables the log)
+        logger: Logger for slow queries (default 'restaurant.slow_query')
+    """
+
+    def __init__(self, slow_ms=DEFAULT_SLOW_MS, logger=None):
+        self.slow_ms = slow_ms
+        self.logger = logger or slow_query_log
+        self._lock = threading.Lock()
+        self._statements = {}
+
+    def _get(self, normalized):
+        stats = self._statements.get(normalized)
+        if stats is None:
+            stats = self._statements[normalized] = StatementStats(normalized)
+        return stats
+
+    def record(self, sql, seconds, rows=0, error=None):
+        """
+        Record one execution
+
+        Args:
+            sql: Statement text as passed to execute()
+            seconds: Wall time of the execute call
+            rows: Rows affected (writes); fetched rows are added later
+            error: Exception raised by execute, if any
+        """
+        normalized = normalize_sql(sql)
+        slow = self.slow_ms is not None and seconds * 1000 >= self.slow_ms
+        with self._lock:
+            stats = self._get(normalized)
+            stats.observe(seconds)
+            if rows > 0:
+                stats.rows += rows
+            if error is not None:
+                stats.errors += 1
+            if slow:
+                stats.slow += 1
+        if slow:
+            self.logger.warning("slow query (%.1f ms, %d rows%s): %s", seconds * 1000, rows,
+                                f", error {error}" if error is not None else "", normalized)
+        return normalized
+
+    def add_rows(self, normalized, rows):
+        """Count rows fetched from an already recorded statement"""
+        if rows:
+            with self._lock:
+                self._get(normalized).rows += rows
+
+    def reset(self):
+        with self._lock:
+            self._statements.clear()
+
+    # ─── Reporting ───────────────────────────────────────────────────────
+
+    def snapshot(self):
+        """
+        Returns:
+            list of dicts (sql, type, count, total_ms, avg_ms, p50_ms,
+            p95_ms, p99_ms, max_ms, rows, errors, slow), busiest first
+        """
+        with self._lock:
+            statements = list(self._statements.values())
+            rows = []
+            for s in statements:
+                rows.append({
+                    'sql': s.sql,
+                    'type': statement_type(s.sql),
+                    'count': s.count,
+                    'total_ms': s.total * 1000,
+                    'avg_ms': s.total / s.count * 1000 if s.count else 0.0,
+                    'p50_ms': s.quantile(0.50) * 1000,
+                    'p95_ms': s.quantile(0.95) * 1000,
+                    'p99_ms': s.quantile(0.99) * 1000,
+                    'max_ms': s.max * 1000,
+                    'rows': s.rows,
+                    'errors': s.errors,
+                    'slow': s.slow,
+                })
+        rows.sort(key=lambda r: r['total_ms'], reverse=True)
+        return rows
+
+    def top(self, n=10):
+        """The n statements with the most total time"""
+        return self.snapshot()[:n]
+
+    def to_prometheus(self, prefix='restaurant_db'):
+        """Render every counter in the Prometheus text exposition format"""
+        with self._lock:
+            statements = [(s.sql, list(s.buckets), s.count, s.total, s.rows, s.errors, s.slow)
+                          for s in self._statements.values()]
+        name = f"{prefix}_query_duration_seconds"
+        lines = [
+            f"# HELP {name} Query execution time by normalized statement.",
+            f"# TYPE {name} histogram",
+        ]
+        counters = {'rows': [], 'errors': [], 'slow': []}
+        for sql, buckets, count, total, rows, errors, slow in sorted(statements):
+            labels = f'statement="{_escape(sql)}",type="{statement_type(sql)}"'
+            cumulative = 0
+            for bound, bucket in zip(LATENCY_BUCKETS, buckets):
+                cumulative += bucket
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f"{name}_sum{{{labels}}} {total:.6f}")
+            lines.append(f"{name}_count{{{labels}}} {count}")
+            counters['rows'].append(f"{prefix}_query_rows_total{{{labels}}} {rows}")
+            counters['errors'].append(f"{prefix}_query_errors_total{{{labels}}} {errors}")
+            counters['slow'].append(f"{prefix}_slow_queries_total{{{labels}}} {slow}")
+        for kind, help_text in (('rows', 'Rows affected or fetched.'),
+                                ('errors', 'Statements that raised an error.'),
+                                ('slow', 'Statements slower than the slow-query threshold.')):
+            metric = (f"{prefix}_slow_queries_total" if kind == 'slow'
+                      else f"{prefix}_query_{kind}_total")
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            lines.extend(counters[kind])
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def serve_metrics(metrics, port=9108, host='127.0.0.1'):
+    """
+    Serve metrics.to_prometheus() on http://host:port/metrics from a
+    daemon thread
+
+    Returns:
+        The HTTPServer (call shutdown() to stop it)
+    """
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != '/metrics':
+                self.send_error(404)
+                return
+            body = metrics.to_prometheus().encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# CURSOR WRAPPER
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class InstrumentedCursor:
+    """
+    Cursor wrapper that records every execute() in a QueryMetrics
+
+    Behaves like the wrapped cursor (other attributes are forwarded).
+    Rows fetched with fetchone/fetchall/fetchmany are added to the row
+    count of the statement that produced them.
+    """
+
+    def __init__(self, cursor, metrics):
+        self._cursor = cursor
+        self._metrics = metrics
+        self._statement = None
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._cursor.close()
+        return False
+
+    def _run(self, sql, call):
+        started = time.perf_counter()
+        try:
+            result = call()
+        except Exception as e:
+            self._statement = self._metrics.record(sql, time.perf_counter() - started, error=e)
+            raise
+        elapsed = time.perf_counter() - started
+        rowcount = getattr(self._cursor, 'rowcount', -1)
+        # SELECT rowcount is unreliable before fetching; reads count fetched rows
+        is_read = sql.lstrip()[:6].upper() in ('SELECT', 'WITH')
+        rows = 0 if is_read or rowcount is None else max(rowcount, 0)
+        self._statement = self._metrics.record(sql, elapsed, rows)
+        return result
+
+    def execute(self, sql, params=None, **kwargs):
+        if params is None:
+            return self._run(sql, lambda: self._cursor.execute(sql, **kwargs))
+        return self._run(sql, lambda: self._cursor.execute(sql, params, **kwargs))
+
+    def executemany(self, sql, seq_params):
+        return self._run(sql, lambda: self._cursor.executemany(sql, seq_params))
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None and self._statement:
+            self._metrics.add_rows(self._statement, 1)
+        return row
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        if self._statement:
+            self._metrics.add_rows(self._statement, len(rows))
+        return rows
+
+    def fetchmany(self, size=None):
+        rows = self._cursor.fetchmany(size) if size is not None else self._cursor.fetchmany()
+        if self._statement:
+            self._metrics.add_rows(self._statement, len(rows))
+        return rows
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Read/Write Splitting for Restaurant Management System
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Sends reporting reads (order history and totals, database statistics)
+  to MySQL replicas, so checkouts keep the primary's connections and
+  CPU to themselves. Writes always go to the primary.
+
+ROUTING A READ:
+  1. Read-your-writes: a session (a till, a screen, the demo) that
+     committed on the primary reads from the primary until a replica is
+     known to have caught up past that commit.
+  2. Lag: replicas are probed at most every `check_interval` seconds
+     (SHOW REPLICA STATUS -> Seconds_Behind_Source). A replica more than
+     `max_lag` seconds behind, not replicating, or unreachable is skipped.
+  3. Of the usable replicas the least lagged one serves the read; with
+     none usable the read falls back to the primary.
+
+  A replica counts as caught up with a commit made at time t once a probe
+  at time c reported lag L with c - L - 1 >= t (the extra second covers
+  the whole-second resolution of Seconds_Behind_Source).
+
+USAGE:
+  from replica_router import ReplicaRouter
+
+  router = ReplicaRouter(primary_pool, {'replica1': replica_config})
+  with router.writes('till-3').connection() as connection:
+      insert_order(connection, priced)              # marks the session
+  page = load_order_page(router.reads('till-3'))    # primary: own write
+  stats = load_database_stats(router.reads(), catalog)
+
+  reads() / writes() return pool-like objects (only .connection()), so
+  everything taking a pool (restaurant_data.py, MenuCatalog) works as is.
+
+LOCAL TESTING:
+    python3 replica_router.py                 # fake replicas, simulated lag
+    python3 replica_router.py --replicas 127.0.0.1:3307,127.0.0.1:3308
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+from db_pool import DEFAULT_POOL_SIZE, ConnectionPool
+
+DEFAULT_MAX_LAG = 5.0           # Seconds a replica may trail the primary
+DEFAULT_CHECK_INTERVAL = 2.0    # Seconds between lag probes per replica
+
+# Resolution of Seconds_Behind_Source
+LAG_RESOLUTION = 1.0
+
+
+def replica_lag(connection):
+    """
+    Replication lag of the server behind a connection
+
+    Returns:
+        float seconds, or None if the server is not replicating (not a
+        replica, or its replication threads are stopped)
+    """
+    cursor = connection.cursor()
+    try:
+        try:
+            cursor.execute("SHOW REPLICA STATUS")           # MySQL 8.0.22+
+        except Exception:
+            cursor.execute("SHOW SLAVE STATUS")
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        status = dict(zip([column[0] for column in cursor.description], row))
+        cursor.fetchall()
+    finally:
+        cursor.close()
+    lag = status.get('Seconds_Behind_Source', status.get('Seconds_Behind_Master'))
+    return None if lag is None else float(lag)
+
+
+class Replica:
+    """One replica endpoint and its last probe result"""
+
+    def __init__(self, name, pool):
+        self.name = name
+        self.pool = pool
+        self.lag = None             # seconds behind at the last probe (None = unusable)
+        self.checked_at = None      # time.time() of the last probe
+        self.error = None           # why the last probe failed
+        self.reads = 0
+        self._probing = threading.Lock()
+
+    @property
+    def caught_up_to(self):
+        """Commits up to this time.time() are visible on the replica"""
+        if self.lag is None:
+            return None
+        return self.checked_at - self.lag - LAG_RESOLUTION
+
+
+class _Target:
+    """Pool-like view handed to data-access code: only .connection()"""
+
+    def __init__(self, router, session, write):
+        self._router = router
+        self._session = session
+        self._write = write
+
+    @contextmanager
+    def connection(self, timeout=None):
+        if self._write:
+            with self._router.primary.connection(timeout) as connection:
+                yield connection
+            self._router.note_write(self._session)
+            return
+        with self._router._read_connection(self._session, timeout) as connection:
+            yield connection
+
+
+class ReplicaRouter:
+    """
+    Routes writes to the primary and reads to fresh-enough replicas
+
+    Args:
+        primary: ConnectionPool of the primary
+        replicas: {name: connection config} of the replicas (empty = every
+                  read goes to the primary)
+        max_lag: Most seconds a replica may be behind and still serve reads
+        check_interval: Seconds a lag probe result is trusted
+        pool_size: Connections per replica
+        connect: Connection factory for every replica (default
+                 mysql.connector), or a {name: factory} dict
+        metrics: QueryMetrics for the replica pools (None = off)
+        probe: Function(connection) -> lag seconds or None (default
+               replica_lag)
+    """
+
+    def __init__(self, primary, replicas=None, max_lag=DEFAULT_MAX_LAG,
+                 check_interval=DEFAULT_CHECK_INTERVAL, pool_size=DEFAULT_POOL_SIZE,
+                 connect=None, metrics=None, probe=replica_lag):
+        self.primary = primary
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._probe = probe
+        replicas = replicas or {}
+        factories = connect if isinstance(connect, dict) else dict.fromkeys(replicas, connect)
+        self.replicas = [Replica(name, ConnectionPool(config, size=pool_size,
+                                                      connect=factories[name], metrics=metrics))
+                         for name, config in replicas.items()]
+        self._writes = {}           # session -> time.time() of its last commit
+        self._lock = threading.Lock()
+        self._stats = {'primary_reads': 0, 'read_your_writes': 0, 'no_fresh_replica': 0,
+                       'replica_errors': 0}
+
+    # ─── Sessions ────────────────────────────────────────────────────────
+
+    def writes(self, session=None):
+        """Pool-like target for writes; every checkout marks the session"""
+        return _Target(self, session, write=True)
+
+    def reads(self, session=None):
+        """Pool-like target for read-only / reporting queries"""
+        return _Target(self, session, write=False)
+
+    def note_write(self, session, at=None):
+        """Record that a session committed on the primary (at = time.time())"""
+        if session is None:
+            return
+        with self._lock:
+            self._writes[session] = time.time() if at is None else at
+            # Sessions every replica has caught up with need no tracking
+            horizon = time.time() - self.max_lag - self.check_interval - LAG_RESOLUTION
+            if len(self._writes) > 1000:
+                self._writes = {s: t for s, t in self._writes.items() if t > horizon}
+
+    # ─── Routing ─────────────────────────────────────────────────────────
+
+    def _check(self, replica):
+        """Re-probe a replica whose lag reading is stale"""
+        now = time.time()
+        if replica.checked_at is not None and now - replica.checked_at < self.check_interval:
+            return
+        # One probe at a time; other readers use the previous reading
+        if not replica._probing.acquire(blocking=False):
+            return
+        try:
+            try:
+                with replica.pool.connection() as connection:
+                    lag = self._probe(connection)
+                replica.error = None if lag is not None else "not replicating"
+            except Exception as e:
+                lag = None
+                replica.error = str(e)
+            replica.lag, replica.checked_at = lag, time.time()
+        finally:
+            replica._probing.release()
+
+    def choose(self, session=None):
+        """
+        Replica to serve a read for a session
+
+        Returns:
+            Replica, or None for the primary
+        """
+        if not self.replicas:
+            return None
+        for replica in self.replicas:
+            self._check(replica)
+        with self._lock:
+            wrote_at = self._writes.get(session) if session is not None else None
+        fresh = [r for r in self.replicas if r.lag is not None and r.lag <= self.max_lag]
+        if wrote_at is not None:
+            caught_up = [r for r in fresh if r.caught_up_to >= wrote_at]
+            if not caught_up:
+                with self._lock:
+                    self._stats['read_your_writes'] += 1
+                return None
+            fresh = caught_up
+        if not fresh:
+            with self._lock:
+                self._stats['no_fresh_replica'] += 1
+            return None
+        return min(fresh, key=lambda r: r.lag)
+
+    @contextmanager
+    def _read_connection(self, session, timeout):
+        replica = self.choose(session)
+        pooled = None
+        if replica is not None:
+            try:
+                pooled = replica.pool.acquire(timeout)
+            except Exception as e:
+                # Unreachable: skip it until the next probe
+                replica.lag, replica.error = None, str(e)
+                replica.checked_at = time.time()
+                with self._lock:
+                    self._stats['replica_errors'] += 1
+        if pooled is None:
+            with self._lock:
+                self._stats['primary_reads'] += 1
+            with self.primary.connection(timeout) as connection:
+                yield connection
+            return
+        replica.reads += 1
+        try:
+            yield pooled
+        finally:
+            pooled.close()
+
+    # ─── Monitoring ──────────────────────────────────────────────────────
+
+    def stats(self):
+        """
+        Returns:
+            dict: reads served by the primary and each replica, why reads
+                  fell back to the primary, and the last lag per replica
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats['replicas'] = {r.name: {'reads': r.reads, 'lag': r.lag, 'error': r.error}
+                             for r in self.replicas}
+        stats['replica_reads'] = sum(r.reads for r in self.replicas)
+        return stats
+
+    def close(self):
+        """Close the replica pools (the primary pool belongs to the caller)"""
+        for replica in self.replicas:
+            replica.pool.close_all()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# LOAD TEST
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def main():
+    import argparse
+    from concurrent.futures import ThreadPoolExecutor
+
+    from benchmark import summarize
+    from menu_cache import MenuCache
+    from menu_catalog import MenuCatalog
+    from order_pricing import price_cart
+    from order_service import random_carts
+    from order_store import ensure_order_schema, insert_order
+    from restaurant_data import load_database_stats, load_order_page
+
+    parser = argparse.ArgumentParser(description="Checkout latency with reporting on replicas")
+    parser.add_argument('--replicas', help='comma-separated host:port list of MySQL replicas '
+                                           '(primary and user from main.DB_CONFIG); '
+                                           'default: fake replicas')
+    parser.add_argument('--fake-replicas', type=int, default=2, metavar='N')
+    parser.add_argument('--fake-lag', type=float, default=0.0,
+                        help='lag the fake replicas report, in seconds (default 0)')
+    parser.add_argument('--checkouts', type=int, default=300)
+    parser.add_argument('--reporters', type=int, default=4, help='concurrent reporting threads')
+    parser.add_argument('--report-pause-ms', type=float, default=5.0,
+                        help='pause between reports per thread, in ms (default 5)')
+    parser.add_argument('--pool-size', type=int, default=4, help='primary connections (default 4)')
+    parser.add_argument('--latency-ms', type=float, default=2.0,
+                        help='fake per-statement latency in ms (default 2)')
+    args = parser.parse_args()
+
+    if args.replicas:
+        from main import DB_CONFIG
+        primary = ConnectionPool(DB_CONFIG, size=args.pool_size)
+        replicas = {}
+        for address in args.replicas.split(','):
+            host, _, port = address.partition(':')
+            replicas[address] = dict(DB_CONFIG, host=host, port=int(port or 3306))
+        connect, probe = None, replica_lag
+        target = f"MySQL primary {DB_CONFIG['host']} + {len(replicas)} replica(s)"
+    else:
+        from fake_db import FakeDatabase
+        # The fake replicas share the primary's data (replication is
+        # instantaneous) but have their own connections; lag is simulated
+        fake = FakeDatabase(latency=args.latency_ms / 1000).load_menu()
+        primary = ConnectionPool({}, size=args.pool_size, connect=fake.connect)
+        replicas = {f"replica{i}": {} for i in range(args.fake_replicas)}
+        connect, probe = fake.connect, lambda connection: args.fake_lag
+        target = (f"fake primary + {args.fake_replicas} replica(s), "
+                  f"{args.latency_ms} ms/statement, {args.fake_lag:g} s lag")
+
+    with primary.connection() as connection:
+        ensure_order_schema(connection)
+    cache = MenuCache(MenuCatalog(primary), ttl=None)
+    carts = [price_cart(cache, cart) for cart in
+             random_carts(list(cache.snapshot().keys()), args.checkouts)]
+
+    print(f"\nCheckout latency under reporting load: {args.checkouts} checkouts, "
+          f"{args.reporters} reporting threads, target: {target}")
+    print("-" * 64)
+    print(f"{'reports on':<14}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}{'reports':>10}")
+    for label, replica_configs in (('primary', {}), ('replicas', replicas)):
+        router = ReplicaRouter(primary, replica_configs, connect=connect, probe=probe)
+        catalog = MenuCatalog(router.reads())
+        done = threading.Event()
+        reports = [0]
+
+        def report():
+            while not done.is_set():
+                load_order_page(router.reads(), page_size=10)
+                load_database_stats(router.reads(), catalog)
+                reports[0] += 1
+                time.sleep(args.report_pause_ms / 1000)
+
+        samples = []
+        with ThreadPoolExecutor(max_workers=args.reporters) as reporters:
+            for _ in range(args.reporters):
+                reporters.submit(report)
+            for priced in carts:
+                t = time.perf_counter()
+                with router.writes('till-1').connection() as connection:
+                    insert_order(connection, priced)
+                samples.append((time.perf_counter() - t) * 1000)
+            done.set()
+        r = summarize(samples)
+        print(f"{label:<14}{r['p50_ms']:>10.3f}{r['p99_ms']:>10.3f}{r['max_ms']:>10.3f}"
+              f"{reports[0]:>10}")
+        stats = router.stats()
+        router.close()
+
+    # Read-your-writes: the till that just checked out reads its own order
+    router = ReplicaRouter(primary, replicas, connect=connect, probe=probe)
+    with router.writes('till-1').connection() as connection:
+        insert_order(connection, carts[0])
+    own = router.choose('till-1')
+    other = router.choose('till-2')
+    print(f"\n✓ Replica reads: {stats['replica_reads']}, primary fallbacks: "
+          f"{stats['primary_reads']} ({stats['no_fresh_replica']} lagging, "
+          f"{stats['replica_errors']} unreachable)")
+    print(f"✓ Right after its checkout till-1 reads from "
+          f"{'the primary' if own is None else own.name}; till-2 from "
+          f"{'the primary' if other is None else other.name}")
+    router.close()
+    primary.close_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Data Access for the Restaurant Management System Screens
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Runs the queries behind each demo screen and returns plain typed rows.
+  Nothing here prints or formats; restaurant_views.py does that.
+
+  Every function checks out its connection, fetches everything it needs
+  and returns the connection to the pool BEFORE returning, so no
+  connection is held while tables are formatted or printed. In a
+  headless / service process the views are simply never called.
+
+  `pool` arguments take a ConnectionPool or a replica_router target
+  (router.reads(session) / router.writes(session)), which only needs
+  .connection().
+
+ROW TYPES (namedtuples):
+  MenuRow        sl, item_name, price
+  OrderRow       order_id, item_name, price, quantity, total, order_time
+  OrderPage      rows, next_cursor, line_count, order_count, revenue
+  CategoryCount  category, items
+  DatabaseStats  categories, total_items, table_count
+
+USAGE:
+  from restaurant_data import load_menu_preview, load_order_page
+
+  preview = load_menu_preview(cache, ["beverages", "curry"])
+  page = load_order_page(pool, page_size=10)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+from collections import namedtuple
+
+from order_history import fetch_page
+from order_stats import read_totals
+from order_store import insert_order
+
+MenuRow = namedtuple('MenuRow', 'sl item_name price')
+OrderRow = namedtuple('OrderRow', 'order_id item_name price quantity total order_time')
+OrderPage = namedtuple('OrderPage', 'rows next_cursor line_count order_count revenue')
+CategoryCount = namedtuple('CategoryCount', 'category items')
+DatabaseStats = namedtuple('DatabaseStats', 'categories total_items table_count')
+
+# Result of place_order(); header_id is None if the cart had no valid lines.
+# Orders taken offline (offline_store.py) carry the terminal's LocalID.
+PlacedOrder = namedtuple('PlacedOrder', 'header_id priced offline', defaults=(False,))
+
+
+def load_menu_preview(menu, categories, limit=5):
+    """
+    First `limit` items of each category
+
+    Args:
+        menu: MenuCache or MenuCatalog
+
+    Returns:
+        dict: {category: [MenuRow, ...]} in the order of `categories`
+    """
+    preview = menu.preview(categories, limit=limit)
+    return {category: [MenuRow(*row) for row in preview[category]] for category in categories}
+
+
+def place_order(pool, priced):
+    """
+    Store a priced cart as one order header + lines
+
+    Returns:
+        PlacedOrder
+    """
+    if not priced.lines:
+        return PlacedOrder(None, priced)
+    with pool.connection() as connection:
+        header_id = insert_order(connection, priced)
+    return PlacedOrder(header_id, priced)
+
+
+def load_order_page(pool, before_id=None, page_size=10):
+    """
+    One keyset page of order history plus the maintained totals
+
+    Returns:
+        OrderPage (rows are OrderRow, newest first)
+    """
+    with pool.connection() as connection:
+        rows, next_cursor = fetch_page(connection, before_id, page_size)
+        line_count, order_count, revenue = read_totals(connection) if rows else (0, 0, 0)
+    return OrderPage([OrderRow(*row) for row in rows], next_cursor,
+                     line_count, order_count, revenue)
+
+
+def load_database_stats(pool, catalog):
+    """
+    Menu item counts per category and the number of tables in the
+    connection's database
+
+    Returns:
+        DatabaseStats
+    """
+    counts = catalog.category_counts()
+    with pool.connection() as connection:
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SELECT TABLE_NAME FROM information_schema.TABLES "
+                           "WHERE TABLE_SCHEMA = DATABASE() ORDER BY TABLE_NAME")
+            table_count = len(cursor.fetchall())
+        finally:
+            cursor.close()
+    categories = [CategoryCount(category, count) for category, count in counts.items()]
+    return DatabaseStats(categories, sum(counts.values()), table_count)
+
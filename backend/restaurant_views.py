@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Rendering for the Restaurant Management System Screens
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Turns the typed rows from restaurant_data.py into console output. No
+  database access happens here, so formatting never holds a connection.
+
+VIEWS:
+  ConsoleView    prints tables with tabulate (the demo output)
+  HeadlessView   same methods, does nothing - for services and load
+                 tests, where formatting would only cost CPU
+
+INCREMENTAL TABLES:
+  iter_table() / print_table() size the columns from the first `sample`
+  rows and then emit one line per row, so a large result set is printed
+  as it streams instead of being built into one tabulate string.
+
+USAGE:
+  view = HeadlessView() if headless else ConsoleView()
+  view.menu_preview(load_menu_preview(cache, categories))
+
+  print_table(stream_orders(connection), ORDER_COLUMNS)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+import sys
+from itertools import chain, islice
+from numbers import Number
+
+DEFAULT_SAMPLE = 100
+
+
+def tabulate(*args, **kwargs):
+    """tabulate.tabulate, imported on first use - the package takes longer
+    to import than a CLI command that never draws a table takes to run"""
+    from tabulate import tabulate as _tabulate
+    return _tabulate(*args, **kwargs)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# INCREMENTAL TABLES
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def iter_table(rows, headers, sample=DEFAULT_SAMPLE):
+    """
+    Yield a plain-text table line by line
+
+    Column widths come from the headers and the first `sample` rows;
+    later, wider values widen their own line only. Numbers are
+    right-aligned, everything else left-aligned.
+
+    Args:
+        rows: Any iterable of row tuples (may be a generator)
+        headers: Column titles
+        sample: Rows buffered to size the columns
+    """
+    rows = iter(rows)
+    head = list(islice(rows, sample))
+    widths = [len(str(h)) for h in headers]
+    numeric = [bool(head) for _ in headers]
+    for row in head:
+        for i, value in enumerate(row):
+            widths[i] = max(widths[i], len(str(value)))
+            if not isinstance(value, Number) and value is not None:
+                numeric[i] = False
+
+    def fmt(values):
+        return "  ".join(str(v).rjust(w) if num else str(v).ljust(w)
+                         for v, w, num in zip(values, widths, numeric)).rstrip()
+
+    yield fmt(headers)
+    yield "  ".join("-" * w for w in widths)
+    for row in chain(head, rows):
+        yield fmt(["" if v is None else v for v in row])
+
+
+def print_table(rows, headers, out=print, sample=DEFAULT_SAMPLE):
+    """Print iter_table() output as it is produced; returns the row count"""
+    count = -2      # header + rule
+    for line in iter_table(rows, headers, sample):
+        out(line)
+        count += 1
+    return max(count, 0)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# SCREENS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class ConsoleView:
+    """
+    Console rendering of each demo screen
+
+    Args:
+        out: Line printer (default print)
+    """
+
+    def __init__(self, out=print):
+        self.out = out
+
+    def section(self, title):
+        self.out("\n" + "="*80)
+        self.out(title)
+        self.out("="*80)
+
+    def error(self, error):
+        self.out(f"Error: {error}")
+
+    def status(self, message):
+        """Progress / summary line outside the screens"""
+        self.out(message)
+
+    def menu_preview(self, preview, limit=5):
+        """preview: {category: [MenuRow, ...]}"""
+        for category, rows in preview.items():
+            shown = "" if limit is None else f" (showing first {limit} items)"
+            self.out(f"\n📍 {category.upper()}{shown}")
+            self.out("-" * 80)
+            self.out(tabulate(rows, headers=['SL', 'Item Name', 'Price (Rs)'], tablefmt='simple'))
+
+    def cart(self, priced):
+        """priced: order_pricing.PricedCart"""
+        self.out("\n🛒 Adding items to cart:")
+        for line in priced.lines:
+            self.out(f"   ✓ Added {line.quantity}x {line.item_name} @ Rs.{line.price}/item "
+                     f"= Rs.{line.total}")
+        for category, item_sl, quantity in priced.missing:
+            self.out(f"   ✗ Item {item_sl} not found in {category}")
+
+        self.out("\n" + "-"*80)
+        self.out("📋 ORDER SUMMARY")
+        self.out("-"*80)
+        items = [(line.item_name, line.price, line.quantity, line.total) for line in priced.lines]
+        self.out(tabulate(items, headers=['Item', 'Price (Rs)', 'Qty', 'Total (Rs)'],
+                          tablefmt='grid'))
+        if priced.discount:
+            self.out(f"\nDiscounts:         Rs. -{priced.discount:.2f}")
+        self.out(f"\nSubtotal:          Rs. {priced.subtotal:.2f}")
+        self.out(f"CGST:              Rs. {priced.cgst:.2f}")
+        self.out(f"SGST:              Rs. {priced.sgst:.2f}")
+        self.out(f"{'-'*30}")
+        self.out(f"GRAND TOTAL:       Rs. {priced.grand_total:.2f}")
+
+    def order_placed(self, placed):
+        """placed: restaurant_data.PlacedOrder"""
+        if placed.header_id is None:
+            self.out("\n📭 Nothing to save - no valid items in the cart")
+        elif placed.offline:
+            self.out(f"\n✅ Order #{placed.header_id} saved on this terminal - "
+                     "it is sent to the database when the connection is back")
+        else:
+            self.out(f"\n✅ Order #{placed.header_id} placed successfully!")
+
+    def order_page(self, page):
+        """page: restaurant_data.OrderPage"""
+        if not page.rows:
+            self.out("\n📭 No orders found!")
+            return
+        self.out(f"\n📊 Recent Orders (Last {len(page.rows)})")
+        self.out("-" * 80)
+        self.out(tabulate(page.rows, headers=['Order ID', 'Item Name', 'Price', 'Qty', 'Total',
+                                              'Order Time'], tablefmt='grid'))
+        self.out(f"\n📈 Statistics:")
+        self.out(f"   Total Orders: {page.line_count}")
+        self.out(f"   Total Revenue: Rs. {page.revenue:.2f}")
+        if page.next_cursor is not None:
+            self.out(f"   Older orders: python3 order_history.py page {page.next_cursor}")
+
+    def database_stats(self, stats):
+        """stats: restaurant_data.DatabaseStats"""
+        self.out("\n📊 Menu Items Per Category:")
+        self.out("-" * 80)
+        rows = [[c.category.capitalize(), c.items] for c in stats.categories]
+        self.out(tabulate(rows, headers=['Category', 'Items'], tablefmt='grid'))
+        self.out(f"\n✓ Total Menu Items: {stats.total_items}")
+        self.out(f"✓ Total Categories: {len(stats.categories)}")
+        self.out(f"✓ Total Tables in Database: {stats.table_count}")
+
+
+class HeadlessView:
+    """ConsoleView stand-in that renders nothing (errors still go to stderr)"""
+
+    def _skip(self, *args, **kwargs):
+        pass
+
+    section = status = menu_preview = cart = order_placed = order_page = database_stats = _skip
+
+    def error(self, error):
+        print(f"Error: {error}", file=sys.stderr)
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Sales Rollups and Reports for Restaurant Management System
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Pre-aggregates order lines into hourly and daily buckets per item and
+  category, so reports read a few hundred rollup rows instead of
+  scanning the raw orders table.
+
+SCHEMA:
+  sales_rollup
+    - Granularity CHAR(1)     'H' = hourly bucket, 'D' = daily bucket
+    - BucketStart DATETIME    start of the hour / day
+    - Category VARCHAR(32)    '' for lines written without a category
+    - ItemName VARCHAR(255)
+    - Quantity, Revenue, LineCount
+    - PRIMARY KEY (Granularity, BucketStart, Category, ItemName)
+
+  rollup_state
+    - Name VARCHAR(32) PRIMARY KEY
+    - LastOrderID BIGINT      watermark: every OrderID <= this is rolled up
+
+INCREMENTAL PROCESSING:
+  run_rollup() reads only orders with OrderID above the watermark, in
+  OrderID chunks. Each chunk merges into sales_rollup and advances the
+  watermark in the same transaction, so a crashed run resumes where it
+  stopped and never counts a line twice.
+
+  settle_seconds (default DEFAULT_SETTLE_SECONDS) stops the run at the
+  highest OrderID inserted at least that long ago: an AUTO_INCREMENT id
+  can commit after a higher one, and a run that raced past it would
+  otherwise never see it. The age is measured on the server from
+  orders.CreatedAt (insert time, set by the server), not from OrderTime -
+  queued and offline orders keep the time they were taken - and not
+  from this client's clock. Any transaction shorter than settle_seconds
+  is covered. Pass 0 only when nothing is writing orders.
+
+USAGE:
+  python3 sales_rollup.py run [settle]     # process new orders (settle 10 s)
+  python3 sales_rollup.py top [days]       # top sellers (default 7 days)
+  python3 sales_rollup.py hourly [hours]   # revenue by hour (default 24)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+import sys
+from datetime import datetime, timedelta
+
+ROLLUP_NAME = 'sales'
+GRANULARITIES = ('H', 'D')
+DEFAULT_CHUNK_SIZE = 5000
+DEFAULT_SETTLE_SECONDS = 10     # Age before a line is rolled up (see above)
+
+CREATE_SALES_ROLLUP_TABLE = """
+CREATE TABLE IF NOT EXISTS sales_rollup (
+    Granularity CHAR(1) NOT NULL,
+    BucketStart DATETIME NOT NULL,
+    Category VARCHAR(32) NOT NULL,
+    ItemName VARCHAR(255) NOT NULL,
+    Quantity BIGINT NOT NULL,
+    Revenue DECIMAL(14,2) NOT NULL,
+    LineCount BIGINT NOT NULL,
+    PRIMARY KEY (Granularity, BucketStart, Category, ItemName)
+)
+"""
+
+CREATE_ROLLUP_STATE_TABLE = """
+CREATE TABLE IF NOT EXISTS rollup_state (
+    Name VARCHAR(32) PRIMARY KEY,
+    LastOrderID BIGINT NOT NULL
+)
+"""
+
+
+def ensure_rollup_schema(connection):
+    """Create sales_rollup / rollup_state and the watermark row"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute(CREATE_SALES_ROLLUP_TABLE)
+        cursor.execute(CREATE_ROLLUP_STATE_TABLE)
+        cursor.execute("INSERT IGNORE INTO rollup_state (Name, LastOrderID) VALUES (%s, 0)",
+                       (ROLLUP_NAME,))
+        connection.commit()
+    finally:
+        cursor.close()
+
+
+def bucket_start(order_time, granularity):
+    """Truncate a timestamp to the start of its hour ('H') or day ('D')"""
+    if isinstance(order_time, str):
+        order_time = datetime.fromisoformat(order_time)
+    if granularity == 'H':
+        return order_time.replace(minute=0, second=0, microsecond=0)
+    return order_time.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def aggregate(rows):
+    """
+    Fold order lines into rollup deltas
+
+    Args:
+        rows: (OrderID, Category, ItemName, Quantity, TotalPrice, OrderTime)
+
+    Returns:
+        dict: {(Granularity, BucketStart, Category, ItemName): [qty, revenue, lines]}
+    """
+    deltas = {}
+    for _, category, item_name, quantity, total, order_time in rows:
+        for granularity in GRANULARITIES:
+            key = (granularity, bucket_start(order_time, granularity), category or '', item_name)
+            delta = deltas.get(key)
+            if delta is None:
+                deltas[key] = [quantity, total, 1]
+            else:
+                delta[0] += quantity
+                delta[1] += total
+                delta[2] += 1
+    return deltas
+
+
+def _merge(cursor, deltas):
+    """Add deltas onto the existing rollup rows of the touched buckets"""
+    buckets = sorted({(g, b) for g, b, _, _ in deltas})
+    existing = {}
+    for granularity in GRANULARITIES:
+        starts = [b for g, b in buckets if g == granularity]
+        if not starts:
+            continue
+        placeholders = ", ".join(["%s"] * len(starts))
+        cursor.execute(
+            "SELECT BucketStart, Category, ItemName, Quantity, Revenue, LineCount "
+            f"FROM sales_rollup WHERE Granularity = %s AND BucketStart IN ({placeholders})",
+            (granularity, *starts))
+        for start, category, item_name, quantity, revenue, lines in cursor.fetchall():
+            existing[(granularity, bucket_start(start, granularity), category, item_name)] = (
+                quantity, revenue, lines)
+
+    merged = []
+    for key, (quantity, revenue, lines) in deltas.items():
+        old_quantity, old_revenue, old_lines = existing.get(key, (0, 0, 0))
+        merged.append(key + (old_quantity + quantity, old_revenue + revenue, old_lines + lines))
+    cursor.executemany(
+        "REPLACE INTO sales_rollup (Granularity, BucketStart, Category, ItemName, "
+        "Quantity, Revenue, LineCount) VALUES (%s, %s, %s, %s, %s, %s, %s)", merged)
+
+
+def run_rollup(connection, chunk_size=DEFAULT_CHUNK_SIZE, settle_seconds=DEFAULT_SETTLE_SECONDS):
+    """
+    Roll up every order line added since the last run
+
+    Args:
+        connection: Open database connection
+        chunk_size: Order lines per transaction
+        settle_seconds: Leave lines younger than this for the next run
+                        (0 = no settle delay, only safe with no writers)
+
+    Returns:
+        (lines processed, new watermark)
+    """
+    ensure_rollup_schema(connection)
+    cursor = connection.cursor()
+    processed = 0
+    try:
+        cursor.execute("SELECT LastOrderID FROM rollup_state WHERE Name = %s", (ROLLUP_NAME,))
+        watermark = cursor.fetchone()[0]
+        if settle_seconds:
+            cursor.execute("SELECT MAX(OrderID) FROM orders WHERE OrderID > %s "
+                           "AND CreatedAt <= NOW() - INTERVAL %s SECOND",
+                           (watermark, settle_seconds))
+        else:
+            cursor.execute("SELECT MAX(OrderID) FROM orders WHERE OrderID > %s", (watermark,))
+        high = cursor.fetchone()[0]
+        connection.commit()
+        if high is None:
+            return 0, watermark
+
+        while True:
+            # Lock the watermark so two runs never process the same chunk
+            cursor.execute("SELECT LastOrderID FROM rollup_state WHERE Name = %s FOR UPDATE",
+                           (ROLLUP_NAME,))
+            watermark = cursor.fetchone()[0]
+            cursor.execute(
+                "SELECT OrderID, Category, ItemName, Quantity, TotalPrice, OrderTime FROM orders "
+                "WHERE OrderID > %s AND OrderID <= %s ORDER BY OrderID LIMIT %s",
+                (watermark, high, chunk_size))
+            rows = cursor.fetchall()
+            if not rows:
+                connection.commit()
+                return processed, watermark
+            _merge(cursor, aggregate(rows))
+            watermark = rows[-1][0]
+            cursor.execute("UPDATE rollup_state SET LastOrderID = %s WHERE Name = %s",
+                           (watermark, ROLLUP_NAME))
+            connection.commit()
+            processed += len(rows)
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# REPORTS (read sales_rollup only)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _report(connection, sql, params):
+    cursor = connection.cursor()
+    try:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def top_sellers(connection, since, until, limit=10):
+    """
+    Best-selling items by quantity between two days
+
+    Returns:
+        list of (Category, ItemName, Quantity, Revenue)
+    """
+    return _report(connection,
+        "SELECT Category, ItemName, SUM(Quantity) AS Qty, SUM(Revenue) FROM sales_rollup "
+        "WHERE Granularity = 'D' AND BucketStart >= %s AND BucketStart < %s "
+        "GROUP BY Category, ItemName ORDER BY Qty DESC, ItemName LIMIT %s",
+        (bucket_start(since, 'D'), until, limit))
+
+
+def revenue_by_hour(connection, since, until):
+    """
+    Returns:
+        list of (BucketStart, Revenue, Quantity) for each hour with sales
+    """
+    return _report(connection,
+        "SELECT BucketStart, SUM(Revenue), SUM(Quantity) FROM sales_rollup "
+        "WHERE Granularity = 'H' AND BucketStart >= %s AND BucketStart < %s "
+        "GROUP BY BucketStart ORDER BY BucketStart",
+        (bucket_start(since, 'H'), until))
+
+
+def revenue_by_category(connection, since, until):
+    """
+    Returns:
+        list of (Category, Revenue, Quantity), highest revenue first
+    """
+    return _report(connection,
+        "SELECT Category, SUM(Revenue) AS Rev, SUM(Quantity) FROM sales_rollup "
+        "WHERE Granularity = 'D' AND BucketStart >= %s AND BucketStart < %s "
+        "GROUP BY Category ORDER BY Rev DESC",
+        (bucket_start(since, 'D'), until))
+
+
+if __name__ == "__main__":
+    """
+    Command Line
+
+    Usage:
+      python3 sales_rollup.py run [settle]     # process new orders
+      python3 sales_rollup.py top [days]       # top sellers
+      python3 sales_rollup.py hourly [hours]   # revenue by hour
+    """
+    from tabulate import tabulate
+    from main import connect_to_database
+
+    command = sys.argv[1] if len(sys.argv) > 1 else "run"
+    if command not in ("run", "top", "hourly"):
+        print(f"Unknown command: {command} (use 'run', 'top' or 'hourly')")
+        sys.exit(1)
+
+    connection = connect_to_database()
+    if not connection:
+        sys.exit(1)
+    try:
+        now = datetime.now()
+        if command == "run":
+            settle = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_SETTLE_SECONDS
+            processed, watermark = run_rollup(connection, settle_seconds=settle)
+            print(f"✓ Rolled up {processed} order lines (watermark OrderID {watermark})")
+        elif command == "top":
+            days = int(sys.argv[2]) if len(sys.argv) > 2 else 7
+            rows = top_sellers(connection, now - timedelta(days=days), now + timedelta(days=1))
+            print(tabulate(rows, headers=['Category', 'Item', 'Qty', 'Revenue'], tablefmt='grid'))
+        else:
+            hours = int(sys.argv[2]) if len(sys.argv) > 2 else 24
+            rows = revenue_by_hour(connection, now - timedelta(hours=hours), now + timedelta(hours=1))
+            print(tabulate(rows, headers=['Hour', 'Revenue', 'Qty'], tablefmt='grid'))
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    finally:
+        connection.close()
@@ -8,7 +8,7 @@ PURPOSE:
 FUNCTIONALITY:
   1. Creates 'menu' database
   2. Creates 14 menu category tables
-  3. Creates 1 orders transaction table
+  3. Creates the orders tables (order_headers + order lines)
   4. Populates menu tables with 192 sample items
   5. Sets up all necessary indexes and constraints
   
@@ -24,6 +24,10 @@ MENU CATEGORIES (14 Tables):
 
 USAGE:
   python3 setup_database.py
+  python3 setup_database.py --unified   # also build the menu_items table
+  python3 setup_database.py --fulltext  # menu_items + FULLTEXT search index
+  python3 setup_database.py --parallel 8  # load the menu tables 8 at a time
+  python3 setup_database.py --bulk-seed --items 200000 --orders 2000000
   
 REQUIREMENTS:
   - MySQL server running on localhost
@@ -37,17 +41,261 @@ Use this script if you need to reset the database to initial state.
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
 
-import mysql.connector as con
 from mysql.connector import Error
+import argparse
 import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from bulk_seed import DEFAULT_BATCH_SIZE, bulk_seed
+from db_pool import PoolTimeout, get_pool
+from menu_catalog import check_category, create_fulltext_index, migrate_legacy_tables
+from order_stats import ensure_stats_schema
+from order_store import CREATE_ORDER_HEADERS_TABLE, CREATE_ORDERS_TABLE
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# MENU DATA
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+# Sample menu: {category table: [(SL, ItemName, Price), ...]}
+MENU_TABLES = {
+    'beverages': [
+        (1, 'Filter Coffee', 15),
+        (2, 'Tea', 15),
+        (3, 'Masala Tea', 20),
+        (4, 'Ginger Tea', 20),
+        (5, 'Lemon Tea', 20),
+        (6, 'Milk', 12),
+        (7, 'Badam Milk', 20),
+        (8, 'Horlicks', 15),
+        (9, 'Boost', 15),
+        (10, 'Complan', 15),
+        (11, 'Bournvita', 15),
+        (12, 'Mineral Water', 20)
+    ],
+    'southindian': [
+        (1, 'Idly', 25),
+        (2, 'Idly (2 nos.)', 40),
+        (3, 'Idly Vada', 80),
+        (4, 'Vada', 40),
+        (5, 'Khara Bath', 50),
+        (6, 'Kesari Bath', 35),
+        (7, 'Chow Chow Bath', 80),
+        (8, 'Upma', 40),
+        (9, 'Rice Bath', 55),
+        (10, 'Pongal', 45),
+        (11, 'Poori', 65),
+        (12, 'Manglore Buns', 40),
+        (13, 'Bisibele Bath', 60),
+        (14, 'Bonda Soup', 40),
+        (15, 'Rava Idly', 50),
+        (16, 'Thatte Idly', 40),
+        (17, 'Pudi Idly', 35)
+    ],
+    'dosaitem': [
+        (1, 'Plain Dosa', 60),
+        (2, 'Masala Dosa', 80),
+        (3, 'Butter Masala Dosa', 95),
+        (4, 'Set Dosa', 70),
+        (5, 'Onion Dosa', 85),
+        (6, 'Paper Dosa', 95),
+        (7, 'Paper Masala Dosa', 105),
+        (8, 'Ghee Roast', 110),
+        (9, 'Rava Dosa', 100),
+        (10, 'Rava Onion Dosa', 120),
+        (11, 'Ragi Dosa', 80),
+        (12, 'Neer Dosa', 90),
+        (13, 'Open Butter Masala Dosa', 100),
+        (14, 'Rava Masala Dosa', 110),
+        (15, 'Rava Onion Masala Dosa', 120),
+        (16, 'Mysore Masala Dosa', 100)
+    ],
+    'starters': [
+        (1, 'Masala Papad', 30),
+        (2, 'Roasted Masala Papad', 25),
+        (3, 'Gobi Munchurian', 120),
+        (4, 'Gobi 65', 100),
+        (5, 'Gobi Pepper Dry', 110),
+        (6, 'Baby Corn Munchurian', 110),
+        (7, 'Baby Corn Pepper Dry', 125),
+        (8, 'Paneer Munchurian', 135),
+        (9, 'Paneer 65', 120),
+        (10, 'Chilli Paneer', 110),
+        (11, 'Paneer Pepper Dry', 110),
+        (12, 'Mushroom Munchurian', 125),
+        (13, 'Mushroom 65', 120),
+        (14, 'Mushroom Pepper Dry', 110),
+        (15, 'Mushroom Chilli', 135),
+        (16, 'Veg Spring Rolls', 120)
+    ],
+    'soup': [
+        (1, 'Tomato Soup', 50),
+        (2, 'Hot n Sour Soup', 55),
+        (3, 'Manchow Soup', 65),
+        (4, 'Sweet Corn Soup', 70),
+        (5, 'Cream of Mushroom Soup', 90)
+    ],
+    'indianbreads': [
+        (1, 'Roti', 25),
+        (2, 'Butter Roti', 30),
+        (3, 'Kulcha', 40),
+        (4, 'Butter Kulcha', 45),
+        (5, 'Naan', 50),
+        (6, 'Butter Naan', 55),
+        (7, 'Garlic Naan', 65),
+        (8, 'Rumali Roti', 60),
+        (9, 'Aloo Paratha', 90),
+        (10, 'Gobi Paratha', 90),
+        (11, 'Aloo Gobi Paratha', 100),
+        (12, 'Paneer Paratha', 115),
+        (13, 'Methi Roti', 40),
+        (14, 'Malabar Parota', 55),
+        (15, 'Chapati', 20),
+        (16, 'Roti Basket', 180)
+    ],
+    'curry': [
+        (1, 'Dal', 140),
+        (2, 'Dal Tadka', 160),
+        (3, 'Dal Makhani', 180),
+        (4, 'Malai Kofta', 200),
+        (5, 'Kofta Curry', 190),
+        (6, 'Veg Hyderabadi', 210),
+        (7, 'Veg Kohlapuri', 215),
+        (8, 'Aloo Gobi', 165),
+        (9, 'Aloo Matar', 150),
+        (10, 'Dum Aloo', 145),
+        (11, 'Navaratan Kurma', 190),
+        (12, 'Kaju Masala', 200),
+        (13, 'Mix Veg', 190),
+        (14, 'Paneer Butter Masala', 220),
+        (15, 'Paneer Tikka', 210),
+        (16, 'Palak Paneer', 195),
+        (17, 'Paneer Do Pyaza', 205),
+        (18, 'Paneer Tikka Masala', 215),
+        (19, 'Kaju Paneer', 220),
+        (20, 'Matar Paneer', 180),
+        (21, 'Paneer Lababdar', 210),
+        (22, 'Manchurian Gravy', 170),
+        (23, 'Veg Ball Manchurian', 190),
+        (24, 'Stuffed Capsicum', 150),
+        (25, 'Chana Masala', 160),
+        (26, 'Rajma', 145)
+    ],
+    'riceitem': [
+        (1, 'Steamed Rice', 85),
+        (2, 'Ghee Rice', 100),
+        (3, 'Jeera Rice', 100),
+        (4, 'Peas Pulao', 120),
+        (5, 'Veg Pulao', 135),
+        (6, 'Kichidi', 120),
+        (7, 'Palak Rice', 105),
+        (8, 'Tawa Pulao', 140),
+        (9, 'Veg Biriyani', 160),
+        (10, 'Handi Biriyani', 170),
+        (11, 'Veg Hyderabadi Biriyani', 180),
+        (12, 'Paneer Biriyani', 195),
+        (13, 'Mushroom Biriyani', 185),
+        (14, 'Kashmiri Pulao', 150),
+        (15, 'Curd Rice', 90)
+    ],
+    'chineseitems': [
+        (1, 'Veg Noodles', 150),
+        (2, 'Veg Hakka Noodles', 165),
+        (3, 'Schezwan Noodles', 175),
+        (4, 'Chilli Garlic Noodles', 170),
+        (5, 'Chinese Chopsuey', 185),
+        (6, 'American Chopsuey', 195),
+        (7, 'Paneer Noodles', 190),
+        (8, 'Mushroom Noodles', 180),
+        (9, 'Veg Fried Rice', 160),
+        (10, 'Paneer Fried Rice', 180),
+        (11, 'Mushroom Fried Rice', 175),
+        (12, 'Garlic Fried Rice', 165),
+        (13, 'Schezwan Fried Rice', 180),
+        (14, 'Triple Fried Rice', 210)
+    ],
+    'chatitem': [
+        (1, 'Bhel Puri', 50),
+        (2, 'Sev Puri', 65),
+        (3, 'Dahi Puri', 70),
+        (4, 'Masala Puri', 65),
+        (5, 'Nippat Masala', 55),
+        (6, 'Samosa Chat', 60),
+        (7, 'Pani Puri', 45),
+        (8, 'Kachori', 40),
+        (9, 'Papdi Chat', 50),
+        (10, 'Dahi Papdi Chat', 65),
+        (11, 'Pav Bhaji', 90),
+        (12, 'Cheese Pav Bhaji', 100),
+        (13, 'Extra Pav', 15),
+        (14, 'Girmit', 30),
+        (15, 'Pakoda', 35),
+        (16, 'Veg Sandwich', 35),
+        (17, 'Veg Grilled Sandwich', 50),
+        (18, 'Grilled Cheese Sandwich', 65),
+        (19, 'French Fries', 70),
+        (20, 'Peri-Peri Fries', 80),
+        (21, 'Aloo Bonda', 35),
+        (22, 'Dahi Vada', 35)
+    ],
+    'sweets': [
+        (1, 'Gulab Jamun', 25),
+        (2, 'Rasgulla', 25),
+        (3, 'Carrot Halwa', 50),
+        (4, 'Payasam', 30),
+        (5, 'Mysore Pak', 40)
+    ],
+    'icecreams': [
+        (1, 'Vanilla', 40),
+        (2, 'Chocolate', 50),
+        (3, 'Strawberry', 50),
+        (4, 'Butterscotch', 55),
+        (5, 'Mango', 60),
+        (6, 'Black Currant', 55),
+        (7, 'Rajbhog', 70),
+        (8, 'Tutti-Frutty', 60)
+    ],
+    'fruitjuice': [
+        (1, 'Apple Juice', 70),
+        (2, 'Mosambi', 70),
+        (3, 'Sapota', 70),
+        (4, 'Muskmelon', 70),
+        (5, 'Watermelon', 80),
+        (6, 'Pineapple', 80),
+        (7, 'Mango', 85),
+        (8, 'Pomegranate', 80),
+        (9, 'Fresh Lime Soda', 70),
+        (10, 'Sweet Lassi', 90)
+    ],
+    'mealcombo': [
+        (1, 'Mini Tiffin', 149),
+        (2, 'South Indian Meals', 169),
+        (3, 'North Indian Meals', 199),
+        (4, 'Roti Curry', 80),
+        (5, 'Chapathi Kurma', 70),
+        (6, 'Parota Curry', 80),
+        (7, 'Fried Rice + Gobi Manchurian', 115)
+    ]
+}
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # DATABASE CONNECTION
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-def create_connection():
+# Server-level config (no database selected)
+SERVER_CONFIG = {
+    'host': 'localhost',
+    'user': 'root',
+    'password': 'youtreatedmelikeshitlol05'
+}
+
+def create_connection(allow_local_infile=False):
     """
-    Create connection to MySQL server (without selecting database)
+    Check out a connection to the MySQL server from the shared pool
+    
+    Args:
+        allow_local_infile: Allow LOAD DATA LOCAL INFILE (bulk seeding)
     
     Returns:
         connection object or None if connection fails
@@ -55,47 +303,161 @@ def create_connection():
     Note:
         This connects to MySQL root, not a specific database
         Database selection happens after connection is established
+        connection.close() returns the connection to the pool (see db_pool.py)
     """
     try:
-        connection = con.connect(
-            host='localhost',
-            user='root',
-            password='youtreatedmelikeshitlol05'
-        )
+        config = dict(SERVER_CONFIG, allow_local_infile=True) if allow_local_infile else SERVER_CONFIG
+        connection = get_pool(config, size=2).acquire()
         return connection
-    except Error as e:
-        print(f"Error connecting to MySQL: {e}")
+    except (Error, PoolTimeout) as e:
+        print(f"❌ Error connecting to MySQL: {e}")
         return None
 
-def create_database_and_tables():
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# MENU TABLE LOADING
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+DEFAULT_SETUP_WORKERS = 4
+
+CREATE_MENU_TABLE = """
+CREATE TABLE IF NOT EXISTS {table} (
+    SL INT PRIMARY KEY,
+    ItemName VARCHAR(255) NOT NULL,
+    Price INT NOT NULL
+)
+"""
+
+# Outcome of creating + loading one menu table (error is None on success)
+TableLoad = namedtuple('TableLoad', 'table rows seconds error')
+
+def load_menu_table(connection, table_name, items, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Create one menu category table and insert its items in one transaction
+    
+    A failure rolls the inserts back and is returned, not raised, so the
+    other tables can carry on. Re-running is safe: CREATE TABLE IF NOT
+    EXISTS + INSERT IGNORE.
+    
+    Args:
+        connection: Connection with the 'menu' database selected
+        table_name: Category table (must be one of menu_catalog.CATEGORIES)
+        items: [(SL, ItemName, Price), ...]
+        batch_size: Rows per INSERT statement
+    
+    Returns:
+        TableLoad
+    """
+    started = time.perf_counter()
+    cursor = connection.cursor()
+    try:
+        check_category(table_name)
+        cursor.execute(CREATE_MENU_TABLE.format(table=table_name))
+        insert_query = f"INSERT IGNORE INTO {table_name} (SL, ItemName, Price) VALUES (%s, %s, %s)"
+        for start in range(0, len(items), batch_size):
+            cursor.executemany(insert_query, items[start:start + batch_size])
+        connection.commit()
+        return TableLoad(table_name, len(items), time.perf_counter() - started, None)
+    except Exception as e:
+        try:
+            connection.rollback()
+        except Exception:
+            pass
+        return TableLoad(table_name, 0, time.perf_counter() - started, e)
+    finally:
+        cursor.close()
+
+def load_menu_tables(pool, menu_tables=None, workers=DEFAULT_SETUP_WORKERS):
+    """
+    Create and load independent menu tables concurrently
+    
+    Each table is loaded by a worker thread on its own pooled connection;
+    the pool should hold at least `workers` connections to 'menu'.
+    
+    Args:
+        pool: db_pool.ConnectionPool for the 'menu' database
+        menu_tables: {table: [(SL, ItemName, Price), ...]} (default MENU_TABLES)
+        workers: Tables loaded at the same time
+    
+    Yields:
+        TableLoad for every table, in the order they finish
+    """
+    menu_tables = MENU_TABLES if menu_tables is None else menu_tables
+    
+    def load(table_name, items):
+        started = time.perf_counter()
+        try:
+            with pool.connection() as connection:
+                return load_menu_table(connection, table_name, items)
+        except Exception as e:     # no connection at all
+            return TableLoad(table_name, 0, time.perf_counter() - started, e)
+    
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='setup') as executor:
+        futures = [executor.submit(load, table_name, items)
+                   for table_name, items in menu_tables.items()]
+        for future in as_completed(futures):
+            yield future.result()
+
+def report_table_load(result):
+    """Print one TableLoad line"""
+    if result.error is None:
+        print(f"✓ Table '{result.table}' created with {result.rows} items! "
+              f"({result.seconds * 1000:.0f} ms)")
+    else:
+        print(f"❌ Table '{result.table}' failed after {result.seconds * 1000:.0f} ms: "
+              f"{result.error}")
+
+def create_database_and_tables(unified=False, fulltext=False, workers=0):
     """
     Create MySQL database and all required tables
     
     This function performs:
       1. Creates 'menu' database (if not exists)
       2. Creates 14 menu category tables with schema
-      3. Creates 1 orders transaction table
+      3. Creates the orders tables (order_headers + order lines)
       4. Inserts sample data (192 items across categories)
+      5. Optionally migrates all items into the unified menu_items table
     
     Tables Created:
-      Menu Tables (each has: SL INT, ItemName VARCHAR(255), Price DECIMAL(10,2))
+      Menu Tables (each has: SL INT, ItemName VARCHAR(255), Price INT)
         - beverages, chatitem, chineseitems, curry, dosaitem
         - fruitjuice, icecreams, indianbreads, mealcombo, riceitem
         - soup, southindian, starters, sweets
       
+      Checkout Table (order_headers, see order_store.py):
+        - HeaderID INT AUTO_INCREMENT PRIMARY KEY
+        - LineCount, Subtotal, CGST, SGST, GrandTotal, OrderTime
+        - QueueRef VARCHAR(40) NULL UNIQUE (order_queue.py replay key)
+        - BranchID INT NOT NULL DEFAULT 1 (outlet that took the order)
+      
       Transaction Table (orders):
         - OrderID INT AUTO_INCREMENT PRIMARY KEY
+        - HeaderID INT NULL (indexed, links the line to its checkout)
+        - Category VARCHAR(32) NULL (menu category of the item)
         - ItemName VARCHAR(255) NOT NULL
         - Price DECIMAL(10,2) NOT NULL
         - Quantity INT NOT NULL
         - TotalPrice DECIMAL(10,2) NOT NULL
         - OrderTime TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        - BranchID INT NOT NULL DEFAULT 1 (indexed with OrderID)
+        - CreatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP (server insert time)
+      
+      Summary Table (order_stats, see order_stats.py):
+        - Running LineCount / OrderCount / Revenue per counter slot
     
     Data:
       - Each category table has items with SL (Serial), Name, and Price
       - Prices in Indian Rupees (Rs)
       - Sample menu items for demonstration
     
+    Args:
+        unified: Also create menu_items (see menu_catalog.py) and copy
+                 every legacy category table into it
+        fulltext: Also add the FULLTEXT index on menu_items.ItemName
+                  (implies unified)
+        workers: Load the menu tables this many at a time, each on its own
+                 connection (0 = one after another on this connection).
+                 Tables that fail are reported; the rest are still loaded.
+    
     Returns:
         bool: True if successful, False if failed
     """
@@ -115,268 +477,54 @@ def create_database_and_tables():
         # Select the database
         cursor.execute("USE menu")
         
-        # Create menu tables
-        menu_tables = {
-            'beverages': [
-                (1, 'Filter Coffee', 15),
-                (2, 'Tea', 15),
-                (3, 'Masala Tea', 20),
-                (4, 'Ginger Tea', 20),
-                (5, 'Lemon Tea', 20),
-                (6, 'Milk', 12),
-                (7, 'Badam Milk', 20),
-                (8, 'Horlicks', 15),
-                (9, 'Boost', 15),
-                (10, 'Complan', 15),
-                (11, 'Bournvita', 15),
-                (12, 'Mineral Water', 20)
-            ],
-            'southindian': [
-                (1, 'Idly', 25),
-                (2, 'Idly (2 nos.)', 40),
-                (3, 'Idly Vada', 80),
-                (4, 'Vada', 40),
-                (5, 'Khara Bath', 50),
-                (6, 'Kesari Bath', 35),
-                (7, 'Chow Chow Bath', 80),
-                (8, 'Upma', 40),
-                (9, 'Rice Bath', 55),
-                (10, 'Pongal', 45),
-                (11, 'Poori', 65),
-                (12, 'Manglore Buns', 40),
-                (13, 'Bisibele Bath', 60),
-                (14, 'Bonda Soup', 40),
-                (15, 'Rava Idly', 50),
-                (16, 'Thatte Idly', 40),
-                (17, 'Pudi Idly', 35)
-            ],
-            'dosaitem': [
-                (1, 'Plain Dosa', 60),
-                (2, 'Masala Dosa', 80),
-                (3, 'Butter Masala Dosa', 95),
-                (4, 'Set Dosa', 70),
-                (5, 'Onion Dosa', 85),
-                (6, 'Paper Dosa', 95),
-                (7, 'Paper Masala Dosa', 105),
-                (8, 'Ghee Roast', 110),
-                (9, 'Rava Dosa', 100),
-                (10, 'Rava Onion Dosa', 120),
-                (11, 'Ragi Dosa', 80),
-                (12, 'Neer Dosa', 90),
-                (13, 'Open Butter Masala Dosa', 100),
-                (14, 'Rava Masala Dosa', 110),
-                (15, 'Rava Onion Masala Dosa', 120),
-                (16, 'Mysore Masala Dosa', 100)
-            ],
-            'starters': [
-                (1, 'Masala Papad', 30),
-                (2, 'Roasted Masala Papad', 25),
-                (3, 'Gobi Munchurian', 120),
-                (4, 'Gobi 65', 100),
-                (5, 'Gobi Pepper Dry', 110),
-                (6, 'Baby Corn Munchurian', 110),
-                (7, 'Baby Corn Pepper Dry', 125),
-                (8, 'Paneer Munchurian', 135),
-                (9, 'Paneer 65', 120),
-                (10, 'Chilli Paneer', 110),
-                (11, 'Paneer Pepper Dry', 110),
-                (12, 'Mushroom Munchurian', 125),
-                (13, 'Mushroom 65', 120),
-                (14, 'Mushroom Pepper Dry', 110),
-                (15, 'Mushroom Chilli', 135),
-                (16, 'Veg Spring Rolls', 120)
-            ],
-            'soup': [
-                (1, 'Tomato Soup', 50),
-                (2, 'Hot n Sour Soup', 55),
-                (3, 'Manchow Soup', 65),
-                (4, 'Sweet Corn Soup', 70),
-                (5, 'Cream of Mushroom Soup', 90)
-            ],
-            'indianbreads': [
-                (1, 'Roti', 25),
-                (2, 'Butter Roti', 30),
-                (3, 'Kulcha', 40),
-                (4, 'Butter Kulcha', 45),
-                (5, 'Naan', 50),
-                (6, 'Butter Naan', 55),
-                (7, 'Garlic Naan', 65),
-                (8, 'Rumali Roti', 60),
-                (9, 'Aloo Paratha', 90),
-                (10, 'Gobi Paratha', 90),
-                (11, 'Aloo Gobi Paratha', 100),
-                (12, 'Paneer Paratha', 115),
-                (13, 'Methi Roti', 40),
-                (14, 'Malabar Parota', 55),
-                (15, 'Chapati', 20),
-                (16, 'Roti Basket', 180)
-            ],
-            'curry': [
-                (1, 'Dal', 140),
-                (2, 'Dal Tadka', 160),
-                (3, 'Dal Makhani', 180),
-                (4, 'Malai Kofta', 200),
-                (5, 'Kofta Curry', 190),
-                (6, 'Veg Hyderabadi', 210),
-                (7, 'Veg Kohlapuri', 215),
-                (8, 'Aloo Gobi', 165),
-                (9, 'Aloo Matar', 150),
-                (10, 'Dum Aloo', 145),
-                (11, 'Navaratan Kurma', 190),
-                (12, 'Kaju Masala', 200),
-                (13, 'Mix Veg', 190),
-                (14, 'Paneer Butter Masala', 220),
-                (15, 'Paneer Tikka', 210),
-                (16, 'Palak Paneer', 195),
-                (17, 'Paneer Do Pyaza', 205),
-                (18, 'Paneer Tikka Masala', 215),
-                (19, 'Kaju Paneer', 220),
-                (20, 'Matar Paneer', 180),
-                (21, 'Paneer Lababdar', 210),
-                (22, 'Manchurian Gravy', 170),
-                (23, 'Veg Ball Manchurian', 190),
-                (24, 'Stuffed Capsicum', 150),
-                (25, 'Chana Masala', 160),
-                (26, 'Rajma', 145)
-            ],
-            'riceitem': [
-                (1, 'Steamed Rice', 85),
-                (2, 'Ghee Rice', 100),
-                (3, 'Jeera Rice', 100),
-                (4, 'Peas Pulao', 120),
-                (5, 'Veg Pulao', 135),
-                (6, 'Kichidi', 120),
-                (7, 'Palak Rice', 105),
-                (8, 'Tawa Pulao', 140),
-                (9, 'Veg Biriyani', 160),
-                (10, 'Handi Biriyani', 170),
-                (11, 'Veg Hyderabadi Biriyani', 180),
-                (12, 'Paneer Biriyani', 195),
-                (13, 'Mushroom Biriyani', 185),
-                (14, 'Kashmiri Pulao', 150),
-                (15, 'Curd Rice', 90)
-            ],
-            'chineseitems': [
-                (1, 'Veg Noodles', 150),
-                (2, 'Veg Hakka Noodles', 165),
-                (3, 'Schezwan Noodles', 175),
-                (4, 'Chilli Garlic Noodles', 170),
-                (5, 'Chinese Chopsuey', 185),
-                (6, 'American Chopsuey', 195),
-                (7, 'Paneer Noodles', 190),
-                (8, 'Mushroom Noodles', 180),
-                (9, 'Veg Fried Rice', 160),
-                (10, 'Paneer Fried Rice', 180),
-                (11, 'Mushroom Fried Rice', 175),
-                (12, 'Garlic Fried Rice', 165),
-                (13, 'Schezwan Fried Rice', 180),
-                (14, 'Triple Fried Rice', 210)
-            ],
-            'chatitem': [
-                (1, 'Bhel Puri', 50),
-                (2, 'Sev Puri', 65),
-                (3, 'Dahi Puri', 70),
-                (4, 'Masala Puri', 65),
-                (5, 'Nippat Masala', 55),
-                (6, 'Samosa Chat', 60),
-                (7, 'Pani Puri', 45),
-                (8, 'Kachori', 40),
-                (9, 'Papdi Chat', 50),
-                (10, 'Dahi Papdi Chat', 65),
-                (11, 'Pav Bhaji', 90),
-                (12, 'Cheese Pav Bhaji', 100),
-                (13, 'Extra Pav', 15),
-                (14, 'Girmit', 30),
-                (15, 'Pakoda', 35),
-                (16, 'Veg Sandwich', 35),
-                (17, 'Veg Grilled Sandwich', 50),
-                (18, 'Grilled Cheese Sandwich', 65),
-                (19, 'French Fries', 70),
-                (20, 'Peri-Peri Fries', 80),
-                (21, 'Aloo Bonda', 35),
-                (22, 'Dahi Vada', 35)
-            ],
-            'sweets': [
-                (1, 'Gulab Jamun', 25),
-                (2, 'Rasgulla', 25),
-                (3, 'Carrot Halwa', 50),
-                (4, 'Payasam', 30),
-                (5, 'Mysore Pak', 40)
-            ],
-            'icecreams': [
-                (1, 'Vanilla', 40),
-                (2, 'Chocolate', 50),
-                (3, 'Strawberry', 50),
-                (4, 'Butterscotch', 55),
-                (5, 'Mango', 60),
-                (6, 'Black Currant', 55),
-                (7, 'Rajbhog', 70),
-                (8, 'Tutti-Frutty', 60)
-            ],
-            'fruitjuice': [
-                (1, 'Apple Juice', 70),
-                (2, 'Mosambi', 70),
-                (3, 'Sapota', 70),
-                (4, 'Muskmelon', 70),
-                (5, 'Watermelon', 80),
-                (6, 'Pineapple', 80),
-                (7, 'Mango', 85),
-                (8, 'Pomegranate', 80),
-                (9, 'Fresh Lime Soda', 70),
-                (10, 'Sweet Lassi', 90)
-            ],
-            'mealcombo': [
-                (1, 'Mini Tiffin', 149),
-                (2, 'South Indian Meals', 169),
-                (3, 'North Indian Meals', 199),
-                (4, 'Roti Curry', 80),
-                (5, 'Chapathi Kurma', 70),
-                (6, 'Parota Curry', 80),
-                (7, 'Fried Rice + Gobi Manchurian', 115)
-            ]
-        }
-        
         # Create menu item tables
-        for table_name, items in menu_tables.items():
-            print(f"Creating table '{table_name}'...")
-            
-            create_table_query = f"""
-            CREATE TABLE IF NOT EXISTS {table_name} (
-                SL INT PRIMARY KEY,
-                ItemName VARCHAR(255) NOT NULL,
-                Price INT NOT NULL
-            )
-            """
-            
-            cursor.execute(create_table_query)
-            
-            # Insert data
-            insert_query = f"INSERT IGNORE INTO {table_name} (SL, ItemName, Price) VALUES (%s, %s, %s)"
-            cursor.executemany(insert_query, items)
-            connection.commit()
-            print(f"✓ Table '{table_name}' created with {len(items)} items!")
+        started = time.perf_counter()
+        results = []
+        if workers:
+            print(f"Creating {len(MENU_TABLES)} menu tables, {workers} at a time...")
+            pool = get_pool(dict(SERVER_CONFIG, database='menu'), size=workers)
+            for result in load_menu_tables(pool, MENU_TABLES, workers):
+                report_table_load(result)
+                results.append(result)
+        else:
+            for table_name, items in MENU_TABLES.items():
+                print(f"Creating table '{table_name}'...")
+                results.append(load_menu_table(connection, table_name, items))
+                report_table_load(results[-1])
+        failed = [result.table for result in results if result.error is not None]
+        print(f"✓ {len(results) - len(failed)}/{len(results)} menu tables loaded in "
+              f"{time.perf_counter() - started:.2f}s "
+              f"(sum of table times {sum(r.seconds for r in results):.2f}s)")
         
-        # Create orders table
-        print("\nCreating orders table...")
-        create_orders_table = """
-        CREATE TABLE IF NOT EXISTS orders (
-            OrderID INT AUTO_INCREMENT PRIMARY KEY,
-            ItemName VARCHAR(255) NOT NULL,
-            Price INT NOT NULL,
-            Quantity INT NOT NULL,
-            TotalPrice INT NOT NULL,
-            OrderTime TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """
-        cursor.execute(create_orders_table)
+        # Create orders tables
+        print("\nCreating orders tables...")
+        cursor.execute(CREATE_ORDER_HEADERS_TABLE)
+        cursor.execute(CREATE_ORDERS_TABLE)
         connection.commit()
-        print("✓ Orders table created!")
+        ensure_stats_schema(connection)
+        print("✓ Orders tables created!")
+        
+        if failed:
+            print(f"\n❌ Menu tables not loaded: {', '.join(failed)}")
+            print("   Re-run setup to retry them - existing tables and rows are kept")
+            return False
+        
+        if unified or fulltext:
+            print("\nMigrating menu into unified 'menu_items' table...")
+            copied = migrate_legacy_tables(connection)
+            print(f"✓ Table 'menu_items' loaded ({copied} rows affected)!")
+        
+        if fulltext:
+            if create_fulltext_index(connection):
+                print("✓ FULLTEXT index 'ft_menu_items_name' created!")
+            else:
+                print("✓ FULLTEXT index 'ft_menu_items_name' already exists")
         
         print("\n" + "="*60)
         print("Database Setup Completed Successfully! ✓")
         print("="*60)
         print("\nDatabase: menu")
-        print("Tables created: 14 menu item tables + 1 orders table")
+        print("Tables created: 14 menu item tables + order_headers + orders + order_stats")
         print("\nConnection Details:")
         print("  Host: localhost")
         print("  User: root")
@@ -394,6 +542,37 @@ def create_database_and_tables():
         cursor.close()
         connection.close()
 
+def bulk_seed_database(items, orders, batch_size=DEFAULT_BATCH_SIZE, use_infile=False):
+    """
+    Load generated menu items and orders for load testing (see bulk_seed.py)
+    
+    Args:
+        items: Number of synthetic menu items to add
+        orders: Number of synthetic order lines to add
+        batch_size: Rows per INSERT batch / transaction
+        use_infile: Use LOAD DATA LOCAL INFILE instead of INSERT batches
+    
+    Returns:
+        bool: True if successful, False if failed
+    """
+    connection = create_connection(allow_local_infile=use_infile)
+    if connection is None:
+        return False
+    
+    try:
+        print(f"\nBulk seeding {items:,} menu items and {orders:,} order lines...")
+        cursor = connection.cursor()
+        cursor.execute("USE menu")
+        cursor.close()
+        bulk_seed(connection, items=items, orders=orders,
+                  batch_size=batch_size, use_infile=use_infile)
+        return True
+    except Error as e:
+        print(f"Error bulk seeding database: {e}")
+        return False
+    finally:
+        connection.close()
+
 if __name__ == "__main__":
     """
     Main Entry Point - Execute Database Setup
@@ -427,8 +606,31 @@ if __name__ == "__main__":
       - Use Next.js frontend for web interface
     """
     
+    parser = argparse.ArgumentParser(description="Create and load the 'menu' database")
+    parser.add_argument('--unified', action='store_true',
+                        help='also build the unified menu_items table')
+    parser.add_argument('--fulltext', action='store_true',
+                        help='also add a FULLTEXT index for menu search (implies --unified)')
+    parser.add_argument('--parallel', type=int, default=0, metavar='WORKERS',
+                        help='create and load the menu tables WORKERS at a time')
+    parser.add_argument('--bulk-seed', action='store_true',
+                        help='load generated data for load testing (see bulk_seed.py)')
+    parser.add_argument('--items', type=int, default=100000,
+                        help='generated menu items for --bulk-seed (default 100000)')
+    parser.add_argument('--orders', type=int, default=1000000,
+                        help='generated order lines for --bulk-seed (default 1000000)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f'rows per batch for --bulk-seed (default {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--infile', action='store_true',
+                        help='bulk seed with LOAD DATA LOCAL INFILE')
+    args = parser.parse_args()
+    
     try:
-        success = create_database_and_tables()
+        success = create_database_and_tables(unified=args.unified, fulltext=args.fulltext,
+                                             workers=args.parallel)
+        if success and args.bulk_seed:
+            success = bulk_seed_database(args.items, args.orders,
+                                         args.batch_size, args.infile)
         if success:
             sys.exit(0)
         else:
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Prepared Statement Cache for Restaurant Management System
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PURPOSE:
+  Keeps server-side prepared statements open per connection, so a
+  statement the scripts run over and over (item lookups, category
+  listings) is parsed and planned by MySQL once per connection instead of
+  on every call, and later executions only send the parameters.
+
+HOW:
+  mysql.connector's cursor(prepared=True) holds one prepared statement
+  and re-prepares unless execute() gets the very same SQL string object
+  it prepared (`operation is self._executed`, an identity check - equal
+  text built by a new f-string does not count). The cache therefore
+  keeps one prepared cursor per distinct SQL text together with the
+  first string object seen for that text, and every execution goes
+  through that canonical object. For the legacy schema the text already
+  names the category table, so entries are per (category, statement
+  shape). Least recently used cursors are
+  closed once `capacity` is reached, which deallocates their statement on
+  the server (MySQL caps open statements with max_prepared_stmt_count).
+
+  Table names cannot be bound as parameters; every category identifier
+  that reaches the SQL text is checked against the CATEGORIES whitelist
+  first (menu_catalog.check_category).
+
+USAGE:
+  with pool.connection() as connection:
+      rows = connection.fetch_prepared(
+          "SELECT ItemName, Price FROM curry WHERE SL = %s", (3,))
+
+      sql, cursor = connection.prepared(sql)    # execute with the returned sql
+
+  catalog = MenuCatalog(pool, prepared=True)    # every catalog query
+
+  The pool creates one StatementCache per driver connection and closes it
+  with the connection (see db_pool.py).
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+from collections import OrderedDict
+
+from query_metrics import InstrumentedCursor
+
+DEFAULT_CAPACITY = 64           # Prepared statements kept open per connection
+
+
+class StatementCache:
+    """
+    LRU cache of prepared cursors for one driver connection
+
+    Args:
+        raw: Driver connection (must support cursor(prepared=True))
+        capacity: Most prepared statements kept open
+        metrics: QueryMetrics to wrap new cursors with (None = off)
+    """
+
+    def __init__(self, raw, capacity=DEFAULT_CAPACITY, metrics=None):
+        self.raw = raw
+        self.capacity = capacity
+        self.metrics = metrics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cursors = OrderedDict()   # SQL text -> (canonical SQL object, cursor)
+
+    def statement(self, sql):
+        """
+        Prepared cursor for this SQL text
+
+        Returns:
+            (canonical_sql, cursor) - always execute the cursor with
+            canonical_sql, the string object it was first prepared with;
+            the driver re-prepares for any other object, even equal text
+        """
+        entry = self._cursors.get(sql)
+        if entry is not None:
+            self._cursors.move_to_end(sql)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        cursor = self.raw.cursor(prepared=True)
+        if self.metrics is not None:
+            cursor = InstrumentedCursor(cursor, self.metrics)
+        entry = self._cursors[sql] = (sql, cursor)
+        while len(self._cursors) > self.capacity:
+            _, (_, evicted) = self._cursors.popitem(last=False)
+            self.evictions += 1
+            self._close(evicted)
+        return entry
+
+    def discard(self, sql):
+        """Drop one statement, e.g. after it failed mid-execution"""
+        entry = self._cursors.pop(sql, None)
+        if entry is not None:
+            self._close(entry[1])
+
+    @staticmethod
+    def _close(cursor):
+        try:
+            cursor.close()
+        except Exception:
+            pass
+
+    def close(self):
+        """Close every cached cursor (the connection is going away)"""
+        while self._cursors:
+            self._close(self._cursors.popitem()[1][1])
+
+    def __len__(self):
+        return len(self._cursors)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# BENCHMARK
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+if __name__ == "__main__":
+    """
+    Command Line
+
+    Usage:
+      python3 statement_cache.py [--mysql] [--lookups N] [--parse-us US]
+
+    Repeats single-item lookups (MenuCatalog.get_item) as plain text
+    statements and as cached prepared statements. On the fake, --parse-us
+    stands in for the server's parse/plan time per text statement; run
+    with --mysql to measure the real saving.
+    """
+    import argparse
+    import random
+
+    from benchmark import summarize, time_runs
+    from db_pool import ConnectionPool
+    from menu_catalog import MenuCatalog
+
+    parser = argparse.ArgumentParser(description="Prepared statement benchmark")
+    parser.add_argument('--mysql', action='store_true', help='use main.DB_CONFIG instead of the fake')
+    parser.add_argument('--lookups', type=int, default=2000, help='lookups per mode (default 2000)')
+    parser.add_argument('--parse-us', type=float, default=50.0,
+                        help='fake parse cost per text statement in µs (default 50)')
+    args = parser.parse_args()
+
+    if args.mysql:
+        from main import DB_CONFIG
+        pool = ConnectionPool(DB_CONFIG, size=1)
+        target = f"MySQL {DB_CONFIG['host']}"
+    else:
+        from fake_db import FakeDatabase
+        fake = FakeDatabase(parse_latency=args.parse_us / 1e6).load_menu()
+        pool = ConnectionPool({}, size=1, connect=fake.connect)
+        target = f"fake ({args.parse_us:g} µs parse per text statement)"
+
+    keys = [(category, sl) for category, sl, _, _ in MenuCatalog(pool).all_items()]
+    lookups = random.Random(11).choices(keys, k=args.lookups)
+
+    print(f"\nItem lookups: {args.lookups} per mode, {len(keys)} menu items, target: {target}")
+    print("-" * 64)
+    print(f"{'mode':<14}{'p50 ms':>10}{'p99 ms':>10}{'mean ms':>10}{'ops/s':>12}")
+    results = {}
+    for mode, prepared in (('text', False), ('prepared', True)):
+        catalog = MenuCatalog(pool, prepared=prepared)
+        lookup = iter(lookups * 2).__next__
+        r = results[mode] = summarize(time_runs(lambda: catalog.get_item(*lookup()),
+                                                args.lookups, warmup=min(100, args.lookups)))
+        print(f"{mode:<14}{r['p50_ms']:>10.3f}{r['p99_ms']:>10.3f}{r['mean_ms']:>10.3f}"
+              f"{r['ops_per_sec']:>12,.0f}")
+    stats = pool.stats()
+    print(f"\n✓ Prepared statements: {stats['prepared_open']} open, "
+          f"{stats['prepared_hits']} cache hits, {stats['prepared_misses']} prepares; "
+          f"mean lookup {results['text']['mean_ms'] / results['prepared']['mean_ms']:.2f}x faster")
+    pool.close_all()